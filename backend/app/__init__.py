@@ -78,11 +78,12 @@ def create_app(config_name='default'):
         colorize=True
     )
 
-    # 파일 핸들러 (영구 기록)
+    # 파일 핸들러 (영구 기록, 지난 파일은 gzip 압축 후 LOG_RETENTION_DAYS 동안 보관)
     logger.add(
         log_file,
         rotation="1 day",
-        retention="7 days",
+        retention=f"{app.config['LOG_RETENTION_DAYS']} days",
+        compression="gz",
         level=app.config['LOG_LEVEL'],
         encoding='utf-8',
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
@@ -92,8 +93,9 @@ def create_app(config_name='default'):
 
     logger.info(f"📝 로그 파일: {log_file}")
 
-    # 종료 핸들러 설정
-    _setup_shutdown_handlers()
+    # 종료 핸들러 설정 (테스트에서는 pytest 의 시그널 처리를 덮어쓰지 않도록 생략)
+    if not app.testing:
+        _setup_shutdown_handlers()
 
     # 세션 보안 설정
     app.config['SESSION_COOKIE_HTTPONLY'] = True  # JavaScript에서 쿠키 접근 차단
@@ -111,6 +113,46 @@ def create_app(config_name='default'):
     from app.api import routes
     app.register_blueprint(routes.bp)
 
+    # 요청별 응답 시간 / DB 쿼리 수 메트릭
+    from app.utils import metrics
+    metrics.init_app(app)
+
+    # 요청별 trace (DB/XTicket/텔레그램 span, /api/admin/traces)
+    from app.utils import tracing
+    tracing.init_app(app)
+
+    # 요청별 SQL 프로파일링 (SQL_PROFILING=true 일 때만)
+    from app.utils import sql_profiler
+    sql_profiler.init_app(app)
+
+    # 외부 호출 기본 타임아웃 및 요청별 시간 예산 (deadline)
+    from app.utils import deadline
+    deadline.init_app(app)
+
+    # XTicket 클라이언트 풀 크기 / 재시도 / 타임아웃
+    from app.scrapers.xticket_pool import xticket_pool
+    xticket_pool.init_app(app)
+
+    # 호스트별 서킷 브레이커 임계값
+    from app.utils import circuit_breaker
+    circuit_breaker.init_app(app)
+
+    # 실시간 업스트림 조회 API 동시 실행 수 제한 (bulkhead)
+    from app.utils import bulkhead
+    bulkhead.init_app(app)
+
+    # JSON 인코딩 (orjson) 및 큰 응답 gzip 압축
+    from app.utils import serialization
+    serialization.init_app(app)
+
+    # 주기 작업 서비스 설정 (스크립트에서 직접 실행할 때도 같은 설정 사용)
+    from app.services.maintenance_service import maintenance_service
+    maintenance_service.init_app(app)
+    from app.services.backup_service import backup_service
+    backup_service.init_app(app)
+    from app.services.seat_catalog_service import seat_catalog_service
+    seat_catalog_service.init_app(app)
+
     # 데이터베이스 초기화
     with app.app_context():
         db.create_all()
@@ -120,13 +162,25 @@ def create_app(config_name='default'):
         from app.utils.auth import create_default_admin
         create_default_admin()
 
-    # 스케줄러 시작 (reloader 프로세스가 아닌 경우에만)
+    # 스케줄러 시작 (reloader 프로세스가 아닌 경우에만, 테스트에서는 시작하지 않음)
     import os
-    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug:
+    if (os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug) and not app.testing:
         from app.services.scheduler_service import scheduler_service
         scheduler_service.start()
         logger.info("Scheduler service started")
 
+        from app.notifications.notification_outbox import notification_dispatcher
+        notification_dispatcher.start(app)
+
+        # 보존 기간 정리 / 다운샘플링 / 증분 VACUUM (매일 한가한 시간대)
+        maintenance_service.start(app)
+
+        # SQLite 온라인 백업 (쓰기를 막지 않도록 페이지 단위로 나눠 복사)
+        backup_service.start(app)
+
+        # XTicket 상품 목록 → 좌석 카탈로그 동기화
+        seat_catalog_service.start(app)
+
     logger.info(f"Flask app created with config: {config_name}")
 
     return app
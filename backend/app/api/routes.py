@@ -1,14 +1,22 @@
 """API 라우트"""
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, Response, current_app, jsonify, request, session
 from loguru import logger
+from sqlalchemy.orm import joinedload, undefer
 from datetime import datetime, timedelta, timezone
 
-from app.models.database import CampingSite, CampingSiteAccount, CampingSiteSeat, Reservation, MonitoringTarget, UserInfo, AppSettings, ReservationSchedule
+from app.models.database import CampingSite, CampingSiteAccount, CampingSiteSeat, Reservation, MonitoringTarget, UserInfo, AppSettings, ReservationSchedule, AvailabilityHistory, AvailabilityMonthView, MonitoringRangeTarget, serialize_schedules, weekdays_to_mask
 from app.services.monitor_service import MonitorService
 from app.services.reservation_service import ReservationService
 from app.services.multi_account_reservation_service import MultiAccountReservationService
 from app.services.scheduler_service import scheduler_service
+from app.services.availability_calendar import calendar_views
+from app.scrapers.xticket_pool import xticket_pool
 from app.utils.auth import authenticate_user, require_auth
+from app.utils.bulkhead import upstream_bulkhead
+from app.utils.table_versions import etag_cached
+from app.utils.metrics import registry as metrics_registry
+from app.utils.tracing import trace_buffer
+from app.utils.export import EXPORT_FORMATS, stream_export
 from app import db, limiter
 import os
 
@@ -27,6 +35,24 @@ def health_check():
     return jsonify({'status': 'healthy', 'message': 'Server is running'}), 200
 
 
+@bp.route('/metrics', methods=['GET'])
+@limiter.exempt
+def get_metrics():
+    """Prometheus 텍스트 포맷 메트릭
+
+    METRICS_TOKEN 설정 시 Authorization: Bearer <토큰> 으로 접근 (수집기용),
+    설정하지 않으면 로그인 세션 필요
+    """
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        if request.headers.get('Authorization') != f'Bearer {token}':
+            return jsonify({'error': 'Unauthorized'}), 401
+    elif not session.get('logged_in'):
+        return jsonify({'error': 'Unauthorized', 'message': '로그인이 필요합니다'}), 401
+
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
+
 @bp.route('/server-time', methods=['GET'])
 @require_auth
 def get_simple_server_time():
@@ -124,10 +150,11 @@ def change_credentials():
 # 캠핑장 관리
 @bp.route('/camping-sites', methods=['GET'])
 @require_auth
+@etag_cached('camping_sites', 'camping_site_accounts')
 def get_camping_sites():
     """캠핑장 목록 조회"""
-    sites = CampingSite.query.all()
-    return jsonify([site.to_dict() for site in sites]), 200
+    sites = CampingSite.query_with_accounts_count().order_by(CampingSite.id).all()
+    return jsonify([site.to_dict(accounts_count=count) for site, count in sites]), 200
 
 
 @bp.route('/camping-sites', methods=['POST'])
@@ -140,6 +167,8 @@ def create_camping_site():
         name=data['name'],
         site_type=data['site_type'],
         url=data['url'],
+        shop_encode=data.get('shop_encode'),
+        shop_code=data.get('shop_code'),
         login_username=data.get('login_username'),
         login_password=data.get('login_password'),
         booker_name=data.get('booker_name'),
@@ -164,6 +193,8 @@ def update_camping_site(site_id):
     site.name = data.get('name', site.name)
     site.site_type = data.get('site_type', site.site_type)
     site.url = data.get('url', site.url)
+    site.shop_encode = data.get('shop_encode', site.shop_encode)
+    site.shop_code = data.get('shop_code', site.shop_code)
     site.login_username = data.get('login_username', site.login_username)
     site.login_password = data.get('login_password', site.login_password)
     site.booker_name = data.get('booker_name', site.booker_name)
@@ -182,34 +213,71 @@ def delete_camping_site(site_id):
     """캠핑장 삭제"""
     site = CampingSite.query.get_or_404(site_id)
     db.session.delete(site)
+    AvailabilityMonthView.query.filter_by(camping_site_id=site_id).delete()
     db.session.commit()
+    calendar_views.invalidate(site_id)
 
     logger.info(f"Deleted camping site: {site.name}")
     return jsonify({'message': 'Camping site deleted'}), 200
 
 
-@bp.route('/camping-sites/<int:site_id>/server-time', methods=['GET'])
+@bp.route('/camping-sites/<int:site_id>/calendar', methods=['GET'])
 @require_auth
-def get_camping_site_server_time(site_id):
-    """캠핑장 서버 시간 조회 및 offset 계산"""
+@etag_cached('availability_month_views', 'camping_sites')
+def get_camping_site_calendar(site_id):
+    """캠핑장 월별 예약 가능 캘린더 (모니터링 틱에서 미리 계산한 뷰, 업스트림 호출 없음)
+
+    Query Parameters:
+        - month: YYYYMM (기본값: 이번 달)
+
+    Returns:
+        {
+            'camping_site_id': 1,
+            'month': '202511',
+            'version': 3,
+            'updated_at': '...',   # 내용이 마지막으로 바뀐 시각
+            'checked_at': '...',   # 마지막으로 확인한 시각
+            'days': [{'date': '2025-11-01', 'remain_count': 2, 'available': true}, ...],
+            'available_days': 5
+        }
+    """
+    month_param = request.args.get('month') or datetime.now().strftime('%Y%m')
     try:
-        site = CampingSite.query.get_or_404(site_id)
+        month_start = datetime.strptime(month_param, '%Y%m')
+    except ValueError:
+        return jsonify({'error': 'month must be YYYYMM'}), 400
 
-        # URL에서 shop_encode 파싱
-        from urllib.parse import urlparse, parse_qs
-        from app.scrapers.xticket_scraper import XTicketScraper
+    if not db.session.query(CampingSite.id).filter_by(id=site_id).first():
+        return jsonify({'error': 'Camping site not found'}), 404
 
-        parsed_url = urlparse(site.url)
-        query_params = parse_qs(parsed_url.query)
+    view = calendar_views.get_month(site_id, month_start.year, month_start.month)
+    if view is None:
+        # 아직 모니터링 틱이 조회하지 않은 월
+        return jsonify({
+            'camping_site_id': site_id,
+            'month': month_param,
+            'version': 0,
+            'updated_at': None,
+            'checked_at': None,
+            'days': [],
+            'available_days': 0
+        }), 200
 
-        shop_encode = query_params.get('shopEncode', [None])[0]
+    return jsonify(view), 200
 
-        if not shop_encode:
-            logger.error(f"Missing shopEncode in URL: {site.url}")
-            return jsonify({'error': 'Invalid camping site URL format'}), 400
 
-        # XTicket 스크래퍼 생성 (서버 시간 조회에는 shop_code가 필요 없지만 생성자에서 필수이므로 shop_encode를 재사용)
-        scraper = XTicketScraper(shop_encode=shop_encode, shop_code=shop_encode)
+@bp.route('/camping-sites/<int:site_id>/server-time', methods=['GET'])
+@require_auth
+@upstream_bulkhead.limit
+def get_camping_site_server_time(site_id):
+    """캠핑장 서버 시간 조회 및 offset 계산"""
+    try:
+        site = CampingSite.query.get_or_404(site_id)
+
+        # 캠핑장별 XTicket 클라이언트 (풀에서 재사용)
+        scraper = xticket_pool.get_for_site(site)
+        if scraper is None:
+            return jsonify({'error': 'XTicket shop parameters not configured for this camping site'}), 400
 
         # 로컬 시간 기록 (before)
         local_time_before = datetime.now(timezone.utc)
@@ -368,11 +436,79 @@ def toggle_site_account(site_id, account_id):
 
 
 # 모니터링 관리
+def _invalid_fields(errors: dict):
+    """필드별 검증 오류 응답 (400, fields 에 {필드: 메시지})"""
+    summary = '; '.join(f"{field}: {message}" for field, message in errors.items())
+    return jsonify({'error': f'Invalid request - {summary}', 'fields': errors}), 400
+
+
+def _parse_id(value):
+    """양의 정수 ID (숫자 문자열 허용, 그 외에는 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    return value if isinstance(value, int) and value > 0 else None
+
+
+def _parse_id_list(value, field: str, errors: dict) -> list:
+    """ID 목록 검증 (잘못된 항목은 errors 에 '필드[인덱스]' 로 기록)"""
+    if not isinstance(value, list) or not value:
+        errors[field] = 'required (non-empty list of positive integers)'
+        return []
+    ids = []
+    for index, item in enumerate(value):
+        parsed = _parse_id(item)
+        if parsed is None:
+            errors[f'{field}[{index}]'] = 'must be a positive integer'
+        ids.append(parsed)
+    return ids
+
+
+def _parse_date_range(start, end, start_field: str, end_field: str, errors: dict):
+    """YYYY-MM-DD 시작/종료일 검증 (종료일 생략 시 시작일과 같음)
+
+    Returns:
+        (start_date, end_date): 오류가 있으면 해당 값은 None
+    """
+    def parse(value):
+        if not isinstance(value, str):
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            return None
+
+    start_date = parse(start)
+    if start_date is None:
+        errors[start_field] = 'must be YYYY-MM-DD' if start else 'required (YYYY-MM-DD)'
+    end_date = parse(end) if end else start_date
+    if end and end_date is None:
+        errors[end_field] = 'must be YYYY-MM-DD'
+    if start_date and end_date and start_date > end_date:
+        errors[end_field] = f'must be on or after {start_field}'
+    return start_date, end_date
+
+
+def _parse_weekdays(value, errors: dict):
+    """요일 목록 검증 (0=월 ... 6=일, 생략 시 None = 매일)"""
+    if value is None:
+        return None
+    if not isinstance(value, list) or not value:
+        errors['weekdays'] = 'must be a non-empty list of integers 0 (Mon) ~ 6 (Sun)'
+        return None
+    for index, weekday in enumerate(value):
+        if isinstance(weekday, bool) or not isinstance(weekday, int) or not 0 <= weekday <= 6:
+            errors[f'weekdays[{index}]'] = 'must be an integer 0 (Mon) ~ 6 (Sun)'
+    return value
+
+
 @bp.route('/monitoring/targets', methods=['GET'])
 @require_auth
+@etag_cached('monitoring_targets', 'camping_sites')
 def get_monitoring_targets():
     """모니터링 타겟 목록"""
-    targets = MonitoringTarget.query.filter_by(is_active=True).all()
+    targets = MonitoringTarget.query.options(joinedload(MonitoringTarget.camping_site)).filter_by(is_active=True).all()
     return jsonify([target.to_dict() for target in targets]), 200
 
 
@@ -395,6 +531,138 @@ def create_monitoring_target():
     return jsonify(target.to_dict()), 201
 
 
+@bp.route('/monitoring/targets/bulk', methods=['POST'])
+@require_auth
+def create_monitoring_targets_bulk():
+    """모니터링 타겟 일괄 추가 (날짜 범위 + 요일 필터)
+
+    Request Body:
+        {
+            "camping_site_ids": [1, 2],             // 또는 "camping_site_id": 1
+            "ranges": [{"start": "2025-11-01", "end": "2026-01-31"}],
+            "weekdays": [4, 5]                      // 선택 (0=월 ... 6=일)
+        }
+    """
+    from app.services.monitor_service import expand_target_dates
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return _invalid_fields({'body': 'must be a JSON object'})
+
+    errors = {}
+    if 'camping_site_ids' in data:
+        site_ids = _parse_id_list(data['camping_site_ids'], 'camping_site_ids', errors)
+    else:
+        site_id = _parse_id(data.get('camping_site_id'))
+        if site_id is None:
+            errors['camping_site_ids'] = 'required (list of camping site ids, or camping_site_id)'
+        site_ids = [site_id]
+
+    ranges = data.get('ranges')
+    if not isinstance(ranges, list) or not ranges:
+        errors['ranges'] = 'required (non-empty list of {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"})'
+    else:
+        for index, item in enumerate(ranges):
+            field = f'ranges[{index}]'
+            if not isinstance(item, dict):
+                errors[field] = 'must be an object with start and end'
+                continue
+            _parse_date_range(item.get('start'), item.get('end'), f'{field}.start', f'{field}.end', errors)
+
+    weekdays = _parse_weekdays(data.get('weekdays'), errors)
+    if errors:
+        return _invalid_fields(errors)
+
+    try:
+        dates = expand_target_dates(ranges, weekdays)
+        result = monitor_service.add_targets_bulk(site_ids, dates)
+    except ValueError as e:
+        # 캠핑장 없음 / 최대 개수 초과
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Failed to create monitoring targets: {e}")
+        return jsonify({'error': str(e)}), 500
+
+    return jsonify({'success': True, **result}), 201
+
+
+@bp.route('/monitoring/range-targets', methods=['GET'])
+@require_auth
+@etag_cached('monitoring_range_targets', 'camping_sites')
+def get_monitoring_range_targets():
+    """기간 모니터링 타겟 목록"""
+    targets = MonitoringRangeTarget.query.order_by(MonitoringRangeTarget.id).all()
+    return jsonify([target.to_dict() for target in targets]), 200
+
+
+@bp.route('/monitoring/range-targets', methods=['POST'])
+@require_auth
+def create_monitoring_range_target():
+    """기간 모니터링 타겟 추가
+
+    Request Body:
+        {
+            "camping_site_id": 1,
+            "start_date": "2025-11-01",
+            "end_date": "2026-01-31",
+            "weekdays": [4, 5]      // 선택 (0=월 ... 6=일, 생략 시 매일)
+        }
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return _invalid_fields({'body': 'must be a JSON object'})
+
+    errors = {}
+    site_id = _parse_id(data.get('camping_site_id'))
+    if site_id is None:
+        errors['camping_site_id'] = 'required (positive integer)'
+    start_date, end_date = _parse_date_range(data.get('start_date'), data.get('end_date'), 'start_date', 'end_date', errors)
+    if start_date and end_date and (end_date - start_date).days >= MonitoringRangeTarget.MAX_DAYS:
+        errors['end_date'] = f'range must be at most {MonitoringRangeTarget.MAX_DAYS} days'
+    weekdays = _parse_weekdays(data.get('weekdays'), errors)
+    if errors:
+        return _invalid_fields(errors)
+
+    site = db.session.get(CampingSite, site_id)
+    if site is None:
+        return _invalid_fields({'camping_site_id': f'camping site {site_id} not found'})
+    weekday_mask = weekdays_to_mask(weekdays)
+
+    target = MonitoringRangeTarget(
+        camping_site_id=site.id,
+        start_date=start_date,
+        end_date=end_date,
+        weekday_mask=weekday_mask,
+        is_active=True
+    )
+
+    db.session.add(target)
+    db.session.commit()
+
+    logger.info(f"Created range monitoring target for site {site.id}: {start_date} ~ {end_date}")
+    return jsonify(target.to_dict()), 201
+
+
+@bp.route('/monitoring/range-targets/<int:target_id>/toggle', methods=['POST'])
+@require_auth
+def toggle_monitoring_range_target(target_id):
+    """기간 모니터링 타겟 활성화/비활성화"""
+    target = MonitoringRangeTarget.query.get_or_404(target_id)
+    target.is_active = not target.is_active
+    db.session.commit()
+    return jsonify(target.to_dict()), 200
+
+
+@bp.route('/monitoring/range-targets/<int:target_id>', methods=['DELETE'])
+@require_auth
+def delete_monitoring_range_target(target_id):
+    """기간 모니터링 타겟 삭제"""
+    target = MonitoringRangeTarget.query.get_or_404(target_id)
+    db.session.delete(target)
+    db.session.commit()
+    return jsonify({'success': True}), 200
+
+
 @bp.route('/monitoring/start', methods=['POST'])
 @require_auth
 def start_monitoring():
@@ -565,9 +833,10 @@ def get_server_time_info():
 # 예약 관리
 @bp.route('/reservations', methods=['GET'])
 @require_auth
+@etag_cached('reservations', 'camping_sites')
 def get_reservations():
     """예약 목록 조회"""
-    reservations = Reservation.query.order_by(Reservation.created_at.desc()).all()
+    reservations = Reservation.query.options(joinedload(Reservation.camping_site)).order_by(Reservation.created_at.desc()).all()
     return jsonify([r.to_dict() for r in reservations]), 200
 
 
@@ -626,6 +895,7 @@ def create_multi_account_reservation():
 # XTicket 좌석 조회
 @bp.route('/xticket/sites', methods=['POST'])
 @require_auth
+@upstream_bulkhead.limit
 def get_xticket_sites():
     """XTicket 특정 날짜의 좌석 정보 조회"""
     data = request.json
@@ -750,10 +1020,10 @@ def test_telegram():
             }), 400
 
         # 텔레그램 알림 테스트
-        from app.notifications.telegram_notifier import TelegramNotifier
-        notifier = TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
+        from app.notifications.telegram_notifier import get_notifier_for
+        notifier = get_notifier_for(settings.telegram_bot_token, settings.telegram_chat_id)
 
-        success = notifier.send_message(
+        success = notifier.send_message_now(
             "🔔 테스트 알림\n\n"
             "텔레그램 알림이 정상적으로 작동합니다!"
         )
@@ -774,9 +1044,31 @@ def test_telegram():
         return jsonify({'error': str(e)}), 500
 
 
+@bp.route('/settings/telegram/outbox', methods=['GET'])
+@require_auth
+def get_notification_outbox():
+    """알림 아웃박스 상태 및 최근 실패 목록 조회"""
+    try:
+        from app.models.database import NotificationOutbox
+        from app.notifications.notification_outbox import notification_dispatcher
+
+        failed = NotificationOutbox.query.filter_by(status='failed').order_by(
+            NotificationOutbox.id.desc()
+        ).limit(20).all()
+
+        return jsonify({
+            **notification_dispatcher.get_status(),
+            'recent_failures': [item.to_dict() for item in failed]
+        }), 200
+    except Exception as e:
+        logger.error(f"Failed to get notification outbox: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @bp.route('/camping-sites/<int:site_id>/available-sites', methods=['POST'])
 @require_auth
 @limiter.limit("30 per minute")
+@upstream_bulkhead.limit
 def get_available_sites(site_id):
     """캠핑장 사용 가능한 좌석 목록 조회"""
     try:
@@ -789,20 +1081,10 @@ def get_available_sites(site_id):
         if not target_date:
             return jsonify({'error': 'target_date is required'}), 400
 
-        # URL에서 shop_encode 파싱
-        from urllib.parse import urlparse, parse_qs
-        from app.scrapers.xticket_scraper import XTicketScraper
-
-        parsed_url = urlparse(site.url)
-        query_params = parse_qs(parsed_url.query)
-        shop_encode = query_params.get('shopEncode', [None])[0]
-
-        if not shop_encode:
-            logger.error(f"Missing shopEncode in URL: {site.url}")
-            return jsonify({'error': 'Invalid camping site URL format'}), 400
-
-        # XTicket 스크래퍼 생성
-        scraper = XTicketScraper(shop_encode=shop_encode, shop_code=shop_encode)
+        # 캠핑장별 XTicket 클라이언트 (풀에서 재사용)
+        scraper = xticket_pool.get_for_site(site)
+        if scraper is None:
+            return jsonify({'error': 'XTicket shop parameters not configured for this camping site'}), 400
 
         # 사용 가능한 좌석 조회
         available_sites = scraper.get_available_sites(target_date, product_group_code)
@@ -824,6 +1106,7 @@ def get_available_sites(site_id):
 @bp.route('/camping-sites/<int:site_id>/product-groups', methods=['POST'])
 @require_auth
 @limiter.limit("30 per minute")
+@upstream_bulkhead.limit
 def get_product_groups(site_id):
     """캠핑장 상품 그룹(구역) 목록 조회"""
     try:
@@ -836,20 +1119,10 @@ def get_product_groups(site_id):
         if not start_date or not end_date:
             return jsonify({'error': 'start_date and end_date are required'}), 400
 
-        # URL에서 shop_encode 파싱
-        from urllib.parse import urlparse, parse_qs
-        from app.scrapers.xticket_scraper import XTicketScraper
-
-        parsed_url = urlparse(site.url)
-        query_params = parse_qs(parsed_url.query)
-        shop_encode = query_params.get('shopEncode', [None])[0]
-
-        if not shop_encode:
-            logger.error(f"Missing shopEncode in URL: {site.url}")
-            return jsonify({'error': 'Invalid camping site URL format'}), 400
-
-        # XTicket 스크래퍼 생성
-        scraper = XTicketScraper(shop_encode=shop_encode, shop_code=shop_encode)
+        # 캠핑장별 XTicket 클라이언트 (풀에서 재사용)
+        scraper = xticket_pool.get_for_site(site)
+        if scraper is None:
+            return jsonify({'error': 'XTicket shop parameters not configured for this camping site'}), 400
 
         # 상품 그룹 조회
         product_groups = scraper.get_product_groups(start_date, end_date)
@@ -875,6 +1148,7 @@ def get_product_groups(site_id):
 @bp.route('/camping-sites/<int:site_id>/seats', methods=['GET'])
 @require_auth
 @limiter.limit("60 per minute")
+@etag_cached('camping_site_seats', 'camping_sites')
 def get_camping_site_seats(site_id):
     """
     캠핑장의 전체 좌석 목록 조회 (카테고리별 분류)
@@ -951,6 +1225,7 @@ def get_camping_site_seats(site_id):
 @bp.route('/camping-sites/<int:site_id>/seats/by-category', methods=['GET'])
 @require_auth
 @limiter.limit("60 per minute")
+@etag_cached('camping_site_seats', 'camping_sites')
 def get_seats_by_category(site_id):
     """
     카테고리별로 그룹화된 좌석 목록 조회
@@ -997,18 +1272,52 @@ def get_seats_by_category(site_id):
         return jsonify({'error': str(e)}), 500
 
 
+@bp.route('/camping-sites/<int:site_id>/seats/sync', methods=['POST'])
+@require_auth
+@limiter.limit("5 per minute")
+@upstream_bulkhead.limit
+def sync_camping_site_seats(site_id):
+    """XTicket 상품 목록으로 좌석 카탈로그 동기화 (바뀐 좌석만 일괄 upsert, display_order 유지)
+
+    Request Body:
+        {
+            "dry_run": false,  // 선택 - 변경 건수만 집계
+            "prune": false     // 선택 - 상류에 없는 좌석 삭제 (스케줄이 참조하는 좌석 제외)
+        }
+    """
+    from app.services.seat_catalog_service import seat_catalog_service
+
+    site = CampingSite.query.get_or_404(site_id)
+    data = request.get_json(silent=True) or {}
+    try:
+        result = seat_catalog_service.sync_site(
+            site,
+            dry_run=bool(data.get('dry_run', False)),
+            prune=bool(data.get('prune', False))
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Failed to sync seats: {e}")
+        return jsonify({'error': str(e)}), 500
+    return jsonify(result), 200
+
+
 # =====================================================
 # 스케줄 예약 관리
 # =====================================================
 
 @bp.route('/schedules', methods=['GET'])
 @require_auth
+@etag_cached('reservation_schedules', 'camping_sites', 'camping_site_seats')
 def get_reservation_schedules():
-    """예약 스케줄 목록 조회"""
+    """예약 스케줄 목록 조회 (실행 결과는 요약만, 전체 결과는 상세 조회)"""
     try:
-        schedules = ReservationSchedule.query.order_by(ReservationSchedule.execute_at.desc()).all()
+        schedules = ReservationSchedule.query.options(
+            joinedload(ReservationSchedule.camping_site)
+        ).order_by(ReservationSchedule.execute_at.desc()).all()
         return jsonify({
-            'schedules': [s.to_dict() for s in schedules],
+            'schedules': serialize_schedules(schedules),
             'count': len(schedules)
         }), 200
     except Exception as e:
@@ -1106,7 +1415,7 @@ def create_reservation_schedule():
         return jsonify({
             'success': True,
             'message': '스케줄이 등록되었습니다',
-            'schedule': schedule.to_dict()
+            'schedule': schedule.to_summary_dict()
         }), 201
 
     except Exception as e:
@@ -1117,10 +1426,11 @@ def create_reservation_schedule():
 
 @bp.route('/schedules/<int:schedule_id>', methods=['GET'])
 @require_auth
+@etag_cached('reservation_schedules', 'camping_sites', 'camping_site_seats')
 def get_reservation_schedule(schedule_id):
-    """예약 스케줄 상세 조회"""
+    """예약 스케줄 상세 조회 (전체 실행 결과 포함)"""
     try:
-        schedule = ReservationSchedule.query.get_or_404(schedule_id)
+        schedule = ReservationSchedule.query.options(undefer(ReservationSchedule.result)).get_or_404(schedule_id)
         return jsonify(schedule.to_dict()), 200
     except Exception as e:
         logger.error(f"Failed to get schedule: {e}")
@@ -1189,7 +1499,7 @@ def toggle_reservation_schedule(schedule_id):
         return jsonify({
             'success': True,
             'message': message,
-            'schedule': schedule.to_dict()
+            'schedule': schedule.to_summary_dict()
         }), 200
 
     except Exception as e:
@@ -1228,7 +1538,7 @@ def cancel_reservation_schedule(schedule_id):
         return jsonify({
             'success': True,
             'message': '스케줄이 취소되었습니다',
-            'schedule': schedule.to_dict()
+            'schedule': schedule.to_summary_dict()
         }), 200
 
     except Exception as e:
@@ -1255,73 +1565,41 @@ def get_telegram_chats():
             }), 400
 
         import requests
+        from app.notifications.telegram_chat_directory import sync_chats, list_chats, TelegramApiError
 
-        # getUpdates API로 최근 대화 목록 가져오기
+        # 마지막 offset 이후의 새 update만 가져와 캐시 갱신
         bot_token = settings.telegram_bot_token
-        url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-
-        response = requests.get(url, timeout=10)
-        data = response.json()
-
-        if not data.get('ok'):
+        sync_error = None
+        try:
+            sync_chats(bot_token)
+        except TelegramApiError as e:
+            sync_error = f"텔레그램 API 오류: {e}"
+        except requests.Timeout:
+            logger.error("Telegram API timeout")
+            sync_error = '텔레그램 API 응답 시간 초과'
+        except requests.RequestException as e:
+            logger.error(f"Telegram API request failed: {e}")
+            sync_error = str(e)
+
+        # 캐시에서 목록 조회 (현재 선택된 것 먼저)
+        chats_list = list_chats(bot_token, settings.telegram_chat_id)
+
+        if sync_error and not chats_list:
             return jsonify({
                 'success': False,
-                'message': f"텔레그램 API 오류: {data.get('description', 'Unknown error')}",
+                'message': sync_error,
                 'chats': []
             }), 400
 
-        # 고유한 채팅방/사용자 추출
-        chats_dict = {}
-        for update in data.get('result', []):
-            message = update.get('message') or update.get('edited_message') or update.get('channel_post')
-            if message:
-                chat = message.get('chat', {})
-                chat_id = chat.get('id')
-                if chat_id and chat_id not in chats_dict:
-                    chat_type = chat.get('type', 'unknown')
-
-                    # 채팅 이름 결정
-                    if chat_type == 'private':
-                        name = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
-                        username = chat.get('username', '')
-                    elif chat_type in ['group', 'supergroup']:
-                        name = chat.get('title', 'Unknown Group')
-                        username = ''
-                    elif chat_type == 'channel':
-                        name = chat.get('title', 'Unknown Channel')
-                        username = chat.get('username', '')
-                    else:
-                        name = 'Unknown'
-                        username = ''
-
-                    chats_dict[chat_id] = {
-                        'chat_id': str(chat_id),
-                        'type': chat_type,
-                        'name': name or f"User {chat_id}",
-                        'username': username,
-                        'is_current': str(chat_id) == settings.telegram_chat_id
-                    }
-
-        # 리스트로 변환 (현재 선택된 것 먼저)
-        chats_list = sorted(
-            chats_dict.values(),
-            key=lambda x: (not x['is_current'], x['name'].lower())
-        )
-
         return jsonify({
             'success': True,
             'chats': chats_list,
             'count': len(chats_list),
-            'current_chat_id': settings.telegram_chat_id
+            'current_chat_id': settings.telegram_chat_id,
+            'stale': sync_error is not None,
+            'message': sync_error
         }), 200
 
-    except requests.Timeout:
-        logger.error("Telegram API timeout")
-        return jsonify({
-            'success': False,
-            'message': '텔레그램 API 응답 시간 초과',
-            'chats': []
-        }), 500
     except Exception as e:
         logger.error(f"Failed to get telegram chats: {e}")
         return jsonify({
@@ -1329,3 +1607,247 @@ def get_telegram_chats():
             'message': str(e),
             'chats': []
         }), 500
+
+
+# =====================================================
+# 데이터 내보내기 (스트리밍 CSV / JSONL)
+# =====================================================
+
+def _parse_export_args(column):
+    """내보내기 공통 파라미터 (format, from, to) 파싱
+
+    Returns:
+        (format, 기간 조건 목록, 에러 응답 또는 None)
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        return fmt, [], (jsonify({'error': f"format must be one of {', '.join(EXPORT_FORMATS)}"}), 400)
+
+    conditions = []
+    try:
+        if request.args.get('from'):
+            conditions.append(column >= datetime.strptime(request.args['from'], '%Y-%m-%d'))
+        if request.args.get('to'):
+            conditions.append(column < datetime.strptime(request.args['to'], '%Y-%m-%d') + timedelta(days=1))
+    except ValueError:
+        return fmt, [], (jsonify({'error': 'from/to must be YYYY-MM-DD'}), 400)
+
+    return fmt, conditions, None
+
+
+@bp.route('/export/reservations', methods=['GET'])
+@require_auth
+def export_reservations():
+    """예약 내보내기
+
+    Query Parameters:
+        - format: csv (기본) 또는 jsonl
+        - from, to: 생성일 기간 (YYYY-MM-DD)
+        - status: 상태 필터
+    """
+    fmt, conditions, error = _parse_export_args(Reservation.created_at)
+    if error:
+        return error
+
+    if request.args.get('status'):
+        conditions.append(Reservation.status == request.args['status'])
+
+    statement = db.select(
+        Reservation.id,
+        Reservation.camping_site_id,
+        CampingSite.name.label('camping_site_name'),
+        Reservation.check_in_date,
+        Reservation.check_out_date,
+        Reservation.status,
+        Reservation.reservation_number,
+        Reservation.error_message,
+        Reservation.created_at,
+        Reservation.updated_at
+    ).outerjoin(CampingSite, CampingSite.id == Reservation.camping_site_id).where(*conditions).order_by(Reservation.id)
+
+    return stream_export(statement, fmt, 'reservations')
+
+
+@bp.route('/export/schedules', methods=['GET'])
+@require_auth
+def export_schedule_results():
+    """예약 스케줄 실행 결과 내보내기
+
+    Query Parameters:
+        - format: csv (기본) 또는 jsonl
+        - from, to: 실행 시각 기간 (YYYY-MM-DD)
+        - status: 상태 필터
+    """
+    fmt, conditions, error = _parse_export_args(ReservationSchedule.execute_at)
+    if error:
+        return error
+
+    if request.args.get('status'):
+        conditions.append(ReservationSchedule.status == request.args['status'])
+
+    statement = db.select(
+        ReservationSchedule.id,
+        ReservationSchedule.camping_site_id,
+        CampingSite.name.label('camping_site_name'),
+        ReservationSchedule.execute_at,
+        ReservationSchedule.target_date,
+        ReservationSchedule.status,
+        ReservationSchedule.dry_run,
+        ReservationSchedule.seat_ids,
+        ReservationSchedule.account_ids,
+        # 전체 결과 JSON(result)은 크고 지연 로딩 컬럼이므로 요약 컬럼만 내보냄
+        ReservationSchedule.result_success,
+        ReservationSchedule.result_message,
+        ReservationSchedule.result_reservation_number,
+        ReservationSchedule.result_duration_ms,
+        ReservationSchedule.result_accounts_attempted,
+        ReservationSchedule.result_successful_count,
+        ReservationSchedule.result_failed_count,
+        ReservationSchedule.created_at,
+        ReservationSchedule.updated_at
+    ).outerjoin(CampingSite, CampingSite.id == ReservationSchedule.camping_site_id).where(*conditions).order_by(ReservationSchedule.id)
+
+    return stream_export(statement, fmt, 'schedule_results')
+
+
+@bp.route('/export/availability-history', methods=['GET'])
+@require_auth
+def export_availability_history():
+    """모니터링 예약 가능 상태 변경 이력 내보내기
+
+    Query Parameters:
+        - format: csv (기본) 또는 jsonl
+        - from, to: 확인 시각 기간 (YYYY-MM-DD)
+        - camping_site_id: 캠핑장 필터
+    """
+    fmt, conditions, error = _parse_export_args(AvailabilityHistory.checked_at)
+    if error:
+        return error
+
+    site_id = request.args.get('camping_site_id', type=int)
+    if site_id:
+        conditions.append(AvailabilityHistory.camping_site_id == site_id)
+
+    statement = db.select(
+        AvailabilityHistory.id,
+        AvailabilityHistory.monitoring_target_id,
+        AvailabilityHistory.camping_site_id,
+        CampingSite.name.label('camping_site_name'),
+        AvailabilityHistory.target_date,
+        AvailabilityHistory.previous_status,
+        AvailabilityHistory.status,
+        AvailabilityHistory.checked_at
+    ).outerjoin(CampingSite, CampingSite.id == AvailabilityHistory.camping_site_id).where(*conditions).order_by(AvailabilityHistory.id)
+
+    return stream_export(statement, fmt, 'availability_history')
+
+
+# =====================================================
+# 관리자 진단
+# =====================================================
+
+@bp.route('/admin/traces', methods=['GET'])
+@require_auth
+def get_recent_traces():
+    """최근 요청 trace 조회 (DB/XTicket/텔레그램 구간별 소요 시간)
+
+    Query Parameters:
+        - sort: slowest (기본) 또는 recent
+        - limit: 최대 개수 (기본 20, 최대 200)
+        - min_ms: 최소 소요 시간 (ms)
+        - spans: true면 span 목록 포함 (기본 false)
+    """
+    sort = request.args.get('sort', 'slowest')
+    limit = min(request.args.get('limit', 20, type=int), 200)
+    min_ms = request.args.get('min_ms', 0, type=float)
+    include_spans = request.args.get('spans', 'false').lower() == 'true'
+
+    if sort == 'recent':
+        traces = trace_buffer.recent(limit, min_ms)
+    else:
+        traces = trace_buffer.slowest(limit, min_ms)
+
+    return jsonify({
+        'traces': [t.to_dict(include_spans=include_spans) for t in traces],
+        'count': len(traces)
+    }), 200
+
+
+@bp.route('/admin/traces/<trace_id>', methods=['GET'])
+@require_auth
+def get_trace(trace_id):
+    """trace 상세 조회 (span 목록 포함)"""
+    found = trace_buffer.get(trace_id)
+    if found is None:
+        return jsonify({'error': 'Trace not found'}), 404
+    return jsonify(found.to_dict()), 200
+
+
+# =====================================================
+# DB 유지보수 / 백업
+# =====================================================
+
+@bp.route('/admin/maintenance', methods=['GET'])
+@require_auth
+def get_maintenance_status():
+    """DB 유지보수 상태 (보존 기간 설정, 다음 실행 시각, 마지막 실행 결과)"""
+    from app.services.maintenance_service import maintenance_service
+    return jsonify(maintenance_service.get_status()), 200
+
+
+@bp.route('/admin/maintenance/run', methods=['POST'])
+@require_auth
+def run_maintenance():
+    """DB 유지보수 즉시 실행
+
+    Request Body:
+        {
+            "dry_run": true,    // 선택 - 정리 대상 행 수만 집계
+            "vacuum": true,     // 선택 - 정리 후 증분 VACUUM (기본 true)
+            "force_vacuum": false  // 선택 - 유지보수 시간대 밖에서도 VACUUM
+        }
+    """
+    from app.services.maintenance_service import maintenance_service
+
+    data = request.json or {}
+    try:
+        result = maintenance_service.run(
+            dry_run=bool(data.get('dry_run', False)),
+            vacuum=bool(data.get('vacuum', True)),
+            force_vacuum=bool(data.get('force_vacuum', False))
+        )
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    return jsonify(result), 200
+
+
+@bp.route('/admin/backups', methods=['GET'])
+@require_auth
+def get_backup_status():
+    """DB 백업 상태 (설정, 다음 실행 시각, 마지막 실행 결과, 백업 파일 목록)"""
+    from app.services.backup_service import backup_service
+    return jsonify(backup_service.get_status()), 200
+
+
+@bp.route('/admin/backups/run', methods=['POST'])
+@require_auth
+def run_backup():
+    """DB 백업 즉시 실행 (메인 DB + 스케줄러 작업 저장소)"""
+    from app.services.backup_service import backup_service
+
+    try:
+        result = backup_service.run()
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    return jsonify(result), 200
+
+
+@bp.route('/admin/backups/verify', methods=['POST'])
+@require_auth
+def verify_backups():
+    """DB 별 가장 최근 백업을 열어 무결성 검사 (하나라도 실패하면 500)"""
+    from app.services.backup_service import backup_service
+
+    results = backup_service.verify_latest()
+    ok = bool(results) and all(r['ok'] for r in results.values())
+    return jsonify({'ok': ok, 'databases': results}), 200 if ok else 500
@@ -1,5 +1,8 @@
 """데이터베이스 모델"""
-from datetime import datetime
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
 from app import db
 
 
@@ -12,6 +15,10 @@ class CampingSite(db.Model):
     site_type = db.Column(db.String(50), nullable=False)  # gocamp, naver, custom
     url = db.Column(db.String(500), nullable=False)
 
+    # XTicket 캠핑장 식별값 (shopEncode: URL 파라미터, shopCode: API 요청용)
+    shop_encode = db.Column(db.String(100))
+    shop_code = db.Column(db.String(50))
+
     # 캠핑장 로그인 정보
     login_username = db.Column(db.String(100))
     login_password = db.Column(db.String(200))
@@ -26,22 +33,64 @@ class CampingSite(db.Model):
     # 관계
     reservations = db.relationship('Reservation', backref='camping_site', lazy=True, cascade='all, delete-orphan')
     monitoring_targets = db.relationship('MonitoringTarget', backref='camping_site', lazy=True, cascade='all, delete-orphan')
+    range_targets = db.relationship('MonitoringRangeTarget', backref='camping_site', lazy=True, cascade='all, delete-orphan')
     accounts = db.relationship('CampingSiteAccount', backref='camping_site', lazy=True, cascade='all, delete-orphan')
     seats = db.relationship('CampingSiteSeat', backref='camping_site', lazy=True, cascade='all, delete-orphan')
 
-    def to_dict(self):
+    @classmethod
+    def query_with_accounts_count(cls):
+        """(캠핑장, 계정 수) 목록 쿼리 - 계정 수는 그룹 집계 서브쿼리로 한 번에 조회"""
+        accounts_count = db.session.query(
+            CampingSiteAccount.camping_site_id,
+            db.func.count(CampingSiteAccount.id).label('accounts_count')
+        ).group_by(CampingSiteAccount.camping_site_id).subquery()
+
+        return db.session.query(
+            cls,
+            db.func.coalesce(accounts_count.c.accounts_count, 0)
+        ).outerjoin(accounts_count, accounts_count.c.camping_site_id == cls.id)
+
+    def count_accounts(self) -> int:
+        """계정 수 (이미 로드된 경우 재사용, 아니면 COUNT 쿼리)"""
+        if 'accounts' in self.__dict__:
+            return len(self.accounts)
+        return db.session.query(db.func.count(CampingSiteAccount.id)).filter(
+            CampingSiteAccount.camping_site_id == self.id
+        ).scalar() or 0
+
+    def xticket_shop(self) -> Tuple[Optional[str], Optional[str]]:
+        """XTicket (shop_encode, shop_code)
+
+        저장된 값을 우선 사용하고, 없으면 shop_encode는 URL의 shopEncode 파라미터,
+        그 다음 XTICKET_SHOP_ENCODE / XTICKET_SHOP_CODE 환경변수에서 가져옵니다.
+        """
+        shop_encode = self.shop_encode
+        if not shop_encode and self.url:
+            shop_encode = parse_qs(urlparse(self.url).query).get('shopEncode', [None])[0]
+        shop_encode = shop_encode or os.getenv('XTICKET_SHOP_ENCODE')
+
+        shop_code = self.shop_code or os.getenv('XTICKET_SHOP_CODE')
+        return shop_encode or None, shop_code or None
+
+    def to_dict(self, accounts_count: int = None):
+        """
+        Args:
+            accounts_count: 미리 집계한 계정 수 (목록 조회 시 query_with_accounts_count 결과 전달)
+        """
         return {
             'id': self.id,
             'name': self.name,
             'site_type': self.site_type,
             'url': self.url,
+            'shop_encode': self.shop_encode,
+            'shop_code': self.shop_code,
             'login_username': self.login_username,
             'login_password': self.login_password,
             'booker_name': self.booker_name,
             'booker_phone': self.booker_phone,
             'booker_car_number': self.booker_car_number,
             'created_at': self.created_at.isoformat() if self.created_at else None,
-            'accounts_count': len(self.accounts) if self.accounts else 0
+            'accounts_count': accounts_count if accounts_count is not None else self.count_accounts()
         }
 
 
@@ -101,6 +150,126 @@ class MonitoringTarget(db.Model):
         }
 
 
+# 요일 마스크 (bit 0 = 월요일 ... bit 6 = 일요일)
+ALL_WEEKDAYS_MASK = 0b1111111
+
+
+def weekdays_to_mask(weekdays) -> int:
+    """요일 목록(0=월 ... 6=일)을 비트 마스크로 변환 (None이면 전체)"""
+    if weekdays is None:
+        return ALL_WEEKDAYS_MASK
+    mask = 0
+    for weekday in weekdays:
+        if not 0 <= int(weekday) <= 6:
+            raise ValueError("weekdays must be between 0 (Mon) and 6 (Sun)")
+        mask |= 1 << int(weekday)
+    return mask
+
+
+class MonitoringRangeTarget(db.Model):
+    """기간 모니터링 타겟
+
+    날짜 범위 + 요일 마스크를 한 행으로 저장하고,
+    날짜별 예약 가능/알림 여부는 start_date 기준 오프셋 비트셋으로 보관합니다.
+    (1년 범위도 46바이트)
+    """
+    __tablename__ = 'monitoring_range_targets'
+
+    id = db.Column(db.Integer, primary_key=True)
+    camping_site_id = db.Column(db.Integer, db.ForeignKey('camping_sites.id'), nullable=False)
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date, nullable=False)
+    weekday_mask = db.Column(db.Integer, default=ALL_WEEKDAYS_MASK, nullable=False)
+    is_active = db.Column(db.Boolean, default=True)
+
+    # 날짜별 상태 비트셋 (bit i = start_date + i일)
+    available_bits = db.Column(db.LargeBinary, default=b'')
+    notified_bits = db.Column(db.LargeBinary, default=b'')
+
+    last_checked = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 최대 범위 (일)
+    MAX_DAYS = 366
+
+    @staticmethod
+    def _to_int(bits: bytes) -> int:
+        return int.from_bytes(bits or b'', 'little')
+
+    def _to_bytes(self, value: int) -> bytes:
+        return value.to_bytes(((self.end_date - self.start_date).days + 8) // 8, 'little')
+
+    def _offset(self, target_date: date) -> int:
+        return (target_date - self.start_date).days
+
+    def dates(self, since: date = None) -> Iterator[date]:
+        """범위 내 요일 마스크에 해당하는 날짜 (since 이전 제외)"""
+        current = max(self.start_date, since) if since else self.start_date
+        while current <= self.end_date:
+            if self.weekday_mask & (1 << current.weekday()):
+                yield current
+            current += timedelta(days=1)
+
+    def months(self, since: date = None) -> Set[Tuple[int, int]]:
+        """확인이 필요한 (연, 월) 목록"""
+        return {(d.year, d.month) for d in self.dates(since)}
+
+    def available_dates(self) -> List[date]:
+        bits = self._to_int(self.available_bits)
+        return [d for d in self.dates() if bits >> self._offset(d) & 1]
+
+    def is_notified(self, target_date: date) -> bool:
+        return bool(self._to_int(self.notified_bits) >> self._offset(target_date) & 1)
+
+    def apply_availability(self, availability: dict) -> List[date]:
+        """날짜별 예약 가능 여부 반영
+
+        Args:
+            availability: {date: bool}
+
+        Returns:
+            List[date]: 예약 가능하고 아직 알림을 보내지 않은 날짜
+                (알림을 아웃박스에 적재한 뒤 mark_notified 로 표시)
+        """
+        available = self._to_int(self.available_bits)
+        notified = self._to_int(self.notified_bits)
+        newly_available = []
+
+        for target_date, is_available in availability.items():
+            bit = 1 << self._offset(target_date)
+            if is_available:
+                if not notified & bit:
+                    newly_available.append(target_date)
+                available |= bit
+            else:
+                available &= ~bit
+
+        self.available_bits = self._to_bytes(available)
+        return sorted(newly_available)
+
+    def mark_notified(self, dates) -> None:
+        """알림을 보낸 날짜 표시"""
+        notified = self._to_int(self.notified_bits)
+        for target_date in dates:
+            notified |= 1 << self._offset(target_date)
+        self.notified_bits = self._to_bytes(notified)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'camping_site_id': self.camping_site_id,
+            'camping_site_name': self.camping_site.name if self.camping_site else None,
+            'start_date': self.start_date.isoformat() if self.start_date else None,
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'weekdays': [weekday for weekday in range(7) if self.weekday_mask & (1 << weekday)],
+            'is_active': self.is_active,
+            'date_count': sum(1 for _ in self.dates()),
+            'available_dates': [d.isoformat() for d in self.available_dates()],
+            'last_checked': self.last_checked.isoformat() if self.last_checked else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
 class UserInfo(db.Model):
     """사용자 정보"""
     __tablename__ = 'user_info'
@@ -206,8 +375,11 @@ class CampingSiteAccount(db.Model):
 
 
 class CampingSiteSeat(db.Model):
-    """캠핑장 좌석 정보 (하드코딩된 전체 좌석 목록)"""
+    """캠핑장 좌석 정보 (XTicket 상품 목록과 동기화: seat_catalog_service)"""
     __tablename__ = 'camping_site_seats'
+    __table_args__ = (
+        db.UniqueConstraint('camping_site_id', 'product_code', name='uq_camping_site_seats_site_product'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     camping_site_id = db.Column(db.Integer, db.ForeignKey('camping_sites.id'), nullable=False)
@@ -280,7 +452,18 @@ class ReservationSchedule(db.Model):
 
     # 상태
     status = db.Column(db.String(50), default='pending')  # pending, warming, running, completed, failed, cancelled
-    result = db.Column(db.JSON)  # 실행 결과
+
+    # 실행 결과 전체 (계정별 all_results 포함) - 크기가 커서 상세 조회 시에만 로드
+    result = db.deferred(db.Column(db.JSON))
+
+    # 실행 결과 요약 (목록 조회용, set_result()에서 함께 기록)
+    result_success = db.Column(db.Boolean)
+    result_message = db.Column(db.String(500))
+    result_reservation_number = db.Column(db.String(100))
+    result_duration_ms = db.Column(db.Integer)
+    result_accounts_attempted = db.Column(db.Integer)
+    result_successful_count = db.Column(db.Integer)
+    result_failed_count = db.Column(db.Integer)
 
     # APScheduler job IDs (메인 작업 + 워밍업 작업)
     job_id = db.Column(db.String(100))
@@ -308,18 +491,55 @@ class ReservationSchedule(db.Model):
             return []
         return CampingSiteSeat.query.filter(CampingSiteSeat.id.in_(seat_ids)).all()
 
-    def to_dict(self):
-        # 좌석 정보 구성
-        seats_info = []
-        for seat_id in self.get_seat_ids():
-            seat = CampingSiteSeat.query.get(seat_id)
-            if seat:
-                seats_info.append({
-                    'id': seat.id,
-                    'seat_name': seat.seat_name,
-                    'product_code': seat.product_code,
-                    'seat_category': seat.seat_category
-                })
+    def set_result(self, result: dict):
+        """실행 결과 저장 (전체 결과 + 요약 컬럼)"""
+        result = result or {}
+        first_success = result.get('first_success') or result.get('successful_account') or {}
+        all_results = result.get('all_results') or []
+
+        duration_ms = result.get('total_duration_ms')
+        attempted = result.get('accounts_attempted', result.get('total_accounts'))
+        successful = result.get('successful_count')
+        failed = result.get('failed_count')
+        message = result.get('message') or result.get('error')
+
+        self.result = result
+        self.result_success = bool(result.get('success'))
+        self.result_message = message[:500] if message else None
+        self.result_reservation_number = first_success.get('reservation_number')
+        self.result_duration_ms = int(duration_ms) if duration_ms is not None else None
+        self.result_accounts_attempted = attempted if attempted is not None else len(all_results)
+        self.result_successful_count = successful if successful is not None else sum(1 for r in all_results if r.get('success'))
+        self.result_failed_count = failed if failed is not None else sum(1 for r in all_results if not r.get('success'))
+
+    def result_summary(self) -> Optional[Dict]:
+        """실행 결과 요약 (아직 실행 전이면 None)"""
+        if self.result_success is None:
+            return None
+        return {
+            'success': self.result_success,
+            'message': self.result_message,
+            'reservation_number': self.result_reservation_number,
+            'duration_ms': self.result_duration_ms,
+            'accounts_attempted': self.result_accounts_attempted,
+            'successful_count': self.result_successful_count,
+            'failed_count': self.result_failed_count
+        }
+
+    def to_summary_dict(self, seats_by_id: Dict[int, 'CampingSiteSeat'] = None):
+        """목록 응답 (실행 결과는 요약만)
+
+        Args:
+            seats_by_id: 미리 조회한 좌석 {id: 좌석} (목록은 load_schedule_seats 로 한 번에 조회해 전달)
+        """
+        if seats_by_id is None:
+            seats_by_id = load_schedule_seats([self])
+
+        seat_ids = self.get_seat_ids()
+        seats = [seats_by_id[seat_id] for seat_id in seat_ids if seat_id in seats_by_id]
+        # 하위 호환용 단일 좌석 이름 (seat_id 좌석, 없으면 1순위 좌석)
+        seat = seats_by_id.get(self.seat_id) if self.seat_id else None
+        seat = seat or (seats[0] if seats else None)
 
         return {
             'id': self.id,
@@ -327,11 +547,19 @@ class ReservationSchedule(db.Model):
             'camping_site_name': self.camping_site.name if self.camping_site else None,
             'execute_at': self.execute_at.isoformat() if self.execute_at else None,
             'target_date': self.target_date.isoformat() if self.target_date else None,
-            'seat_ids': self.get_seat_ids(),
-            'seats': seats_info,
+            'seat_ids': seat_ids,
+            'seats': [
+                {
+                    'id': s.id,
+                    'seat_name': s.seat_name,
+                    'product_code': s.product_code,
+                    'seat_category': s.seat_category
+                }
+                for s in seats
+            ],
             # 하위 호환성
             'seat_id': self.seat_id,
-            'seat_name': self.seat.seat_name if self.seat else (seats_info[0]['seat_name'] if seats_info else None),
+            'seat_name': seat.seat_name if seat else None,
             'account_ids': self.account_ids,
             'retry_count': self.retry_count,
             'retry_interval': self.retry_interval,
@@ -342,9 +570,197 @@ class ReservationSchedule(db.Model):
             'session_warmup_minutes': self.session_warmup_minutes,
             'dry_run': self.dry_run,
             'status': self.status,
-            'result': self.result,
+            'result_summary': self.result_summary(),
             'job_id': self.job_id,
             'warmup_job_id': self.warmup_job_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+    def to_dict(self, seats_by_id: Dict[int, 'CampingSiteSeat'] = None):
+        """상세 응답 (전체 실행 결과 포함)"""
+        data = self.to_summary_dict(seats_by_id)
+        data['result'] = self.result
+        return data
+
+
+def load_schedule_seats(schedules: Iterable[ReservationSchedule]) -> Dict[int, CampingSiteSeat]:
+    """스케줄들이 참조하는 좌석을 한 번에 조회 ({seat_id: seat})"""
+    seat_ids = set()
+    for schedule in schedules:
+        seat_ids.update(schedule.get_seat_ids())
+        if schedule.seat_id:
+            seat_ids.add(schedule.seat_id)
+    if not seat_ids:
+        return {}
+    seats = CampingSiteSeat.query.filter(CampingSiteSeat.id.in_(seat_ids)).all()
+    return {seat.id: seat for seat in seats}
+
+
+def serialize_schedules(schedules: List[ReservationSchedule]) -> List[Dict]:
+    """스케줄 목록 직렬화 (실행 결과는 요약만, 좌석은 한 번의 IN 쿼리로 조회)"""
+    seats_by_id = load_schedule_seats(schedules)
+    return [schedule.to_summary_dict(seats_by_id) for schedule in schedules]
+
+
+class NotificationOutbox(db.Model):
+    """알림 아웃박스 (백그라운드 디스패처가 전송, 최소 1회 전달 보장)"""
+    __tablename__ = 'notification_outbox'
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # 전송 대상 (적재 시점의 텔레그램 설정)
+    bot_token = db.Column(db.String(200), nullable=False)
+    chat_id = db.Column(db.String(100), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+
+    # 전송 상태
+    status = db.Column(db.String(20), default='pending', index=True)  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, default=0)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    last_error = db.Column(db.Text)
+    sent_at = db.Column(db.DateTime)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'chat_id': self.chat_id,
+            'message': self.message,
+            'status': self.status,
+            'attempts': self.attempts,
+            'next_attempt_at': self.next_attempt_at.isoformat() if self.next_attempt_at else None,
+            'last_error': self.last_error,
+            'sent_at': self.sent_at.isoformat() if self.sent_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
+class TelegramChat(db.Model):
+    """텔레그램 봇과 대화한 채팅방/사용자 목록 (getUpdates 캐시)"""
+    __tablename__ = 'telegram_chats'
+    __table_args__ = (
+        db.UniqueConstraint('bot_id', 'chat_id', name='uq_telegram_chats_bot_chat'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    bot_id = db.Column(db.String(50), nullable=False, index=True)  # 봇 토큰의 ':' 앞부분
+    chat_id = db.Column(db.String(100), nullable=False)
+    chat_type = db.Column(db.String(20))  # private, group, supergroup, channel
+    name = db.Column(db.String(200))
+    username = db.Column(db.String(100))
+    last_seen_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'chat_id': self.chat_id,
+            'type': self.chat_type,
+            'name': self.name,
+            'username': self.username,
+            'last_seen_at': self.last_seen_at.isoformat() if self.last_seen_at else None
+        }
+
+
+class TelegramUpdateCursor(db.Model):
+    """봇별 getUpdates offset (이미 처리한 마지막 update_id)"""
+    __tablename__ = 'telegram_update_cursors'
+
+    bot_id = db.Column(db.String(50), primary_key=True)
+    last_update_id = db.Column(db.BigInteger)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class AvailabilityHistory(db.Model):
+    """모니터링 타겟 예약 가능 상태 변경 이력
+
+    캠핑장/타겟이 삭제되어도 이력은 보존되도록 외래 키 대신 ID만 기록합니다.
+    """
+    __tablename__ = 'availability_history'
+    __table_args__ = (
+        db.Index('ix_availability_history_site_checked', 'camping_site_id', 'checked_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    monitoring_target_id = db.Column(db.Integer, index=True)
+    camping_site_id = db.Column(db.Integer, nullable=False)
+    target_date = db.Column(db.Date, nullable=False)
+    previous_status = db.Column(db.String(50))  # available, unavailable (최초 확인 시 None)
+    status = db.Column(db.String(50), nullable=False)
+    checked_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'monitoring_target_id': self.monitoring_target_id,
+            'camping_site_id': self.camping_site_id,
+            'target_date': self.target_date.isoformat() if self.target_date else None,
+            'previous_status': self.previous_status,
+            'status': self.status,
+            'checked_at': self.checked_at.isoformat() if self.checked_at else None
+        }
+
+
+class AvailabilityDailySummary(db.Model):
+    """예약 가능 상태 변경 이력 일별 집계 (보존 기간이 지난 AvailabilityHistory 를 다운샘플링)"""
+    __tablename__ = 'availability_daily_summaries'
+    __table_args__ = (
+        db.UniqueConstraint('camping_site_id', 'target_date', 'day', name='uq_availability_daily_site_target_day'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    camping_site_id = db.Column(db.Integer, nullable=False)
+    target_date = db.Column(db.Date, nullable=False)
+    day = db.Column(db.Date, nullable=False, index=True)  # 상태를 확인한 날 (checked_at 기준)
+    changes = db.Column(db.Integer, nullable=False, default=0)
+    available_count = db.Column(db.Integer, nullable=False, default=0)  # 예약 가능으로 바뀐 횟수
+    unavailable_count = db.Column(db.Integer, nullable=False, default=0)
+    first_checked_at = db.Column(db.DateTime)
+    last_checked_at = db.Column(db.DateTime)
+    last_status = db.Column(db.String(50))
+
+    def to_dict(self):
+        return {
+            'camping_site_id': self.camping_site_id,
+            'target_date': self.target_date.isoformat() if self.target_date else None,
+            'day': self.day.isoformat() if self.day else None,
+            'changes': self.changes,
+            'available_count': self.available_count,
+            'unavailable_count': self.unavailable_count,
+            'first_checked_at': self.first_checked_at.isoformat() if self.first_checked_at else None,
+            'last_checked_at': self.last_checked_at.isoformat() if self.last_checked_at else None,
+            'last_status': self.last_status
+        }
+
+
+class AvailabilityMonthView(db.Model):
+    """캠핑장 월별 예약 가능 현황 (모니터링 틱에서 미리 계산한 캘린더 뷰)
+
+    days는 {일: 잔여 수} 형태이며, 내용이 바뀔 때만 version이 올라갑니다.
+    """
+    __tablename__ = 'availability_month_views'
+    __table_args__ = (
+        db.UniqueConstraint('camping_site_id', 'year', 'month', name='uq_availability_month_views_site_month'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    camping_site_id = db.Column(db.Integer, nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    days = db.Column(db.JSON, nullable=False, default=dict)  # {"1": 3, "2": 0, ...}
+    version = db.Column(db.Integer, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)  # 내용이 마지막으로 바뀐 시각
+    checked_at = db.Column(db.DateTime, default=datetime.utcnow)  # 마지막으로 조회(확인)한 시각
+
+
+class TableVersion(db.Model):
+    """테이블별 변경 버전 (목록 API ETag 기준, app.utils.table_versions 참고)
+
+    변경을 커밋하는 트랜잭션 안에서 올리므로 다른 프로세스/스크립트의 변경도 반영됩니다.
+    """
+    __tablename__ = 'table_versions'
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,155 @@
+"""
+예약 가능 알림 다이제스트
+
+한 번의 모니터링 틱(또는 지정한 윈도우) 동안 발생한 예약 가능 변경을 모아
+채팅별로 하나의 메시지로 묶어 전송합니다.
+텔레그램의 채팅별 전송 제한과 알림 폭주를 방지합니다.
+
+다이제스트는 메모리에만 있으므로, 호출자는 '알림 보냄' 표시를 flush 의 on_flushed 에서
+아웃박스 적재와 같은 트랜잭션으로 기록해야 합니다 (재시작 시 다음 틱에서 다시 감지).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from loguru import logger
+
+# 텔레그램 메시지 최대 길이 (4096자) 보다 약간 작게 분할
+MAX_MESSAGE_LENGTH = 4000
+
+
+class AvailabilityDigest:
+    """
+    예약 가능 알림 다이제스트
+
+    Features:
+    - 채팅(bot_token, chat_id)별 이벤트 수집
+    - 윈도우 경과 시 일괄 전송 (0이면 flush 호출 시마다 전송)
+    - 캠핑장별 그룹핑 또는 날짜순 단일 목록
+    """
+
+    def __init__(self, window_seconds: int = 0, group_by_site: bool = True):
+        """
+        Args:
+            window_seconds: 이벤트를 모으는 시간 (초, 0이면 틱 단위)
+            group_by_site: 캠핑장별로 묶어서 표시할지 여부
+        """
+        self.window_seconds = window_seconds
+        self.group_by_site = group_by_site
+
+        self._lock = threading.Lock()
+        self._events: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self._notifiers: Dict[Tuple[str, str], object] = {}
+        self._refs: Dict[Hashable, None] = {}
+        self._first_event_at: Optional[float] = None
+
+    def add(self, notifier, camping_site: str, date, ref: Hashable = None) -> None:
+        """예약 가능 이벤트 추가
+
+        Args:
+            notifier: 전송에 사용할 TelegramNotifier
+            camping_site: 캠핑장 이름
+            date: 예약 가능 날짜
+            ref: 전송 후 '알림 보냄'으로 표시할 대상 (flush 의 on_flushed 로 전달)
+        """
+        key = (notifier.bot_token, notifier.chat_id)
+
+        with self._lock:
+            if self._first_event_at is None:
+                self._first_event_at = time.monotonic()
+
+            self._notifiers[key] = notifier
+            events = self._events.setdefault(key, [])
+            event = (camping_site, str(date))
+            if event not in events:
+                events.append(event)
+            if ref is not None:
+                self._refs[ref] = None
+
+    def pending_count(self) -> int:
+        """전송 대기 중인 이벤트 수"""
+        with self._lock:
+            return sum(len(events) for events in self._events.values())
+
+    def is_due(self) -> bool:
+        """윈도우가 경과하여 전송할 시점인지 여부"""
+        with self._lock:
+            if self._first_event_at is None:
+                return False
+            return time.monotonic() - self._first_event_at >= self.window_seconds
+
+    def flush(self, force: bool = False, on_flushed: Callable[[List[Hashable]], None] = None) -> int:
+        """모인 이벤트를 채팅별 다이제스트로 전송 (아웃박스 적재, commit 은 호출자가 수행)
+
+        Args:
+            force: 윈도우 경과 여부와 관계없이 전송
+            on_flushed: 모든 메시지를 적재한 뒤 add() 의 ref 목록으로 호출
+
+        Returns:
+            int: 전송 요청한 메시지 수
+        """
+        if not force and not self.is_due():
+            return 0
+
+        with self._lock:
+            batches = self._events
+            notifiers = self._notifiers
+            refs = list(self._refs)
+            self._events = {}
+            self._notifiers = {}
+            self._refs = {}
+            self._first_event_at = None
+
+        sent = 0
+        for key, events in batches.items():
+            notifier = notifiers[key]
+
+            if len(events) == 1:
+                camping_site, date = events[0]
+                notifier.send_availability_notification(camping_site, date)
+                sent += 1
+                continue
+
+            for message in self.render(events):
+                notifier.send_message(message)
+                sent += 1
+
+            logger.info(f"Availability digest sent: {len(events)} changes -> chat {key[1]}")
+
+        if on_flushed and refs:
+            on_flushed(refs)
+
+        return sent
+
+    def render(self, events: List[Tuple[str, str]]) -> List[str]:
+        """다이제스트 메시지 생성 (길이 초과 시 여러 개로 분할)"""
+        header = f"🏕️ <b>예약 가능 알림 ({len(events)}건)</b>\n"
+        footer = "\n✅ 예약이 가능해졌습니다!"
+
+        lines = []
+        if self.group_by_site:
+            by_site = OrderedDict()
+            for camping_site, date in events:
+                by_site.setdefault(camping_site, []).append(date)
+
+            for camping_site, dates in by_site.items():
+                lines.append(f"\n<b>{camping_site}</b>")
+                lines.extend(f"• {date}" for date in sorted(dates))
+        else:
+            lines.append("")
+            lines.extend(
+                f"• {date} - {camping_site}"
+                for camping_site, date in sorted(events, key=lambda e: (e[1], e[0]))
+            )
+
+        messages = []
+        current = header
+        for line in lines:
+            if len(current) + len(line) + len(footer) + 1 > MAX_MESSAGE_LENGTH:
+                messages.append(current + footer)
+                current = header
+            current += line + "\n"
+        messages.append(current + footer)
+
+        return messages
@@ -0,0 +1,265 @@
+"""
+알림 아웃박스 디스패처
+
+알림은 notification_outbox 테이블에 먼저 적재되고,
+백그라운드 스레드가 텔레그램으로 전송합니다.
+
+- 호출자는 적재만 하므로 느린 텔레그램 API가 모니터링을 막지 않음
+- 적재는 호출자의 트랜잭션에 포함 (호출자가 commit 해야 전송 대상이 됨)
+- 전송 성공 후에만 sent 처리 (최소 1회 전달 보장)
+- 여러 프로세스(서버, 스크립트, 스케줄 작업)의 디스패처가 같은 행을 보내지 않도록
+  전송 전에 조건부 UPDATE 로 행을 선점(status='sending', 리스 만료 시각)한 프로세스만 전송
+  (선점한 프로세스가 전송 도중 죽으면 리스 만료 후 다른 디스패처가 다시 전송)
+- 일시적 오류는 exponential backoff로 재시도
+- 429 응답의 retry_after 준수
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from loguru import logger
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.database import NotificationOutbox
+from app.utils.metrics import NOTIFICATION_DISPATCH_SECONDS, NOTIFICATIONS_TOTAL
+
+
+_ENQUEUED_KEY = 'notification_outbox_enqueued'
+
+
+def enqueue_notification(bot_token: str, chat_id: str, message: str) -> bool:
+    """알림을 아웃박스에 적재 (호출자의 트랜잭션에 포함)
+
+    여기서는 commit / rollback 하지 않습니다. 호출자가 자신의 작업과 함께 commit 하면
+    알림도 함께 저장되고 디스패처를 깨우며, 호출자 작업이 롤백되면 알림도 함께 사라집니다.
+
+    Args:
+        bot_token: 텔레그램 봇 토큰
+        chat_id: 텔레그램 채팅 ID
+        message: 전송할 메시지 (HTML)
+
+    Returns:
+        bool: 적재 성공 여부
+    """
+    try:
+        item = NotificationOutbox(
+            bot_token=bot_token,
+            chat_id=str(chat_id),
+            message=message,
+            status='pending',
+            next_attempt_at=datetime.utcnow()
+        )
+        db.session.add(item)
+    except Exception as e:
+        logger.error(f"Failed to enqueue notification: {e}")
+        return False
+
+    db.session.info[_ENQUEUED_KEY] = True
+    logger.debug(f"Notification queued (on commit) -> {chat_id}")
+    return True
+
+
+def _register_listeners():
+    """적재한 알림이 커밋되면 디스패처를 즉시 깨움"""
+
+    @event.listens_for(Session, 'after_commit')
+    def wake_dispatcher(session):
+        if session.info.pop(_ENQUEUED_KEY, False):
+            notification_dispatcher.wake()
+
+    @event.listens_for(Session, 'after_rollback')
+    def discard_enqueued(session):
+        session.info.pop(_ENQUEUED_KEY, None)
+
+
+_register_listeners()
+
+
+class NotificationDispatcher:
+    """
+    아웃박스 백그라운드 디스패처 (싱글톤)
+
+    주기적으로(또는 적재 즉시) 전송 대기 중인 알림을 꺼내 전송합니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._app = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+        # 설정 (start 시 app.config 값으로 갱신)
+        self.poll_interval = 5  # 초
+        self.batch_size = 20
+        self.retry_base_seconds = 5
+        self.retry_max_seconds = 300
+        self.lease_seconds = 60
+
+    def start(self, app):
+        """디스패처 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+
+            self._app = app
+            self.poll_interval = app.config.get('NOTIFICATION_DISPATCH_INTERVAL', self.poll_interval)
+            self.batch_size = app.config.get('NOTIFICATION_BATCH_SIZE', self.batch_size)
+            self.retry_base_seconds = app.config.get('NOTIFICATION_RETRY_BASE_SECONDS', self.retry_base_seconds)
+            self.retry_max_seconds = app.config.get('NOTIFICATION_RETRY_MAX_SECONDS', self.retry_max_seconds)
+            self.lease_seconds = app.config.get('NOTIFICATION_LEASE_SECONDS', self.lease_seconds)
+
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                name="NotificationDispatcher",
+                daemon=True
+            )
+            self._thread.start()
+
+        logger.info("Notification dispatcher started")
+
+    def stop(self):
+        """디스패처 스레드 중지"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        logger.info("Notification dispatcher stopped")
+
+    def wake(self):
+        """대기 중인 디스패처를 즉시 깨움"""
+        self._wake_event.set()
+
+    def _run_loop(self):
+        """디스패처 루프"""
+        while not self._stop_event.is_set():
+            try:
+                with self._app.app_context():
+                    try:
+                        # 배치가 꽉 찼으면 남은 항목이 있을 수 있으므로 바로 다음 배치 처리
+                        while self.dispatch_pending() >= self.batch_size:
+                            if self._stop_event.is_set():
+                                break
+                    finally:
+                        db.session.remove()
+            except Exception as e:
+                logger.error(f"Notification dispatcher error: {e}")
+
+            self._wake_event.wait(timeout=self.poll_interval)
+            self._wake_event.clear()
+
+    def dispatch_pending(self) -> int:
+        """전송 시점이 된 알림 처리 (앱 컨텍스트 필요)
+
+        Returns:
+            int: 처리한 알림 수
+        """
+        from app.notifications.telegram_notifier import get_notifier_for
+
+        now = datetime.utcnow()
+        # sending 이면서 리스가 지난 행은 전송 도중 죽은 디스패처의 몫이므로 다시 처리
+        items = NotificationOutbox.query.filter(
+            NotificationOutbox.status.in_(('pending', 'sending')),
+            NotificationOutbox.next_attempt_at <= now
+        ).order_by(NotificationOutbox.id).limit(self.batch_size).all()
+
+        deferred_chats: Dict[tuple, datetime] = {}  # 채팅별 재시도 시각 (순서 유지용)
+
+        for item in items:
+            key = (item.bot_token, item.chat_id)
+
+            # 같은 채팅의 앞선 메시지가 지연되었으면 순서 유지를 위해 함께 지연
+            if key in deferred_chats:
+                item.next_attempt_at = max(item.next_attempt_at, deferred_chats[key])
+                db.session.commit()
+                continue
+
+            if not self._claim(item):
+                # 다른 프로세스의 디스패처가 먼저 가져감
+                continue
+
+            result = get_notifier_for(item.bot_token, item.chat_id).deliver(item.message)
+            item.attempts = (item.attempts or 0) + 1
+
+            if result.ok:
+                item.status = 'sent'
+                item.sent_at = datetime.utcnow()
+                item.last_error = None
+                NOTIFICATIONS_TOTAL.inc(result='sent')
+                NOTIFICATION_DISPATCH_SECONDS.observe((item.sent_at - item.created_at).total_seconds())
+            elif not result.retryable:
+                item.status = 'failed'
+                item.last_error = result.error
+                NOTIFICATIONS_TOTAL.inc(result='failed')
+                logger.error(f"Notification #{item.id} failed permanently: {result.error}")
+            else:
+                delay = self._retry_delay(item.attempts, result.retry_after)
+                item.status = 'pending'
+                item.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+                item.last_error = result.error
+                deferred_chats[key] = item.next_attempt_at
+                NOTIFICATIONS_TOTAL.inc(result='retry')
+                logger.warning(f"Notification #{item.id} retry in {delay:.0f}s (attempt {item.attempts}): {result.error}")
+
+            # 항목별 커밋 (전송 직후 상태를 영구 기록)
+            db.session.commit()
+
+        return len(items)
+
+    def _claim(self, item: NotificationOutbox) -> bool:
+        """전송 전 행 선점 (조건부 UPDATE 가 1행을 바꾼 경우만 성공, 즉시 커밋)"""
+        now = datetime.utcnow()
+        claimed = db.session.execute(
+            update(NotificationOutbox)
+            .where(
+                NotificationOutbox.id == item.id,
+                NotificationOutbox.status.in_(('pending', 'sending')),
+                NotificationOutbox.next_attempt_at <= now
+            )
+            .values(status='sending', next_attempt_at=now + timedelta(seconds=self.lease_seconds))
+            .execution_options(synchronize_session=False)
+        ).rowcount == 1
+        # 커밋으로 item 이 만료되므로 이후 접근 시 선점된 값으로 다시 로드됨
+        db.session.commit()
+        return claimed
+
+    def _retry_delay(self, attempts: int, retry_after: Optional[int] = None) -> float:
+        """재시도 대기 시간 계산 (retry_after 우선, 없으면 exponential backoff)"""
+        if retry_after:
+            return float(retry_after)
+        return min(self.retry_base_seconds * (2 ** (attempts - 1)), self.retry_max_seconds)
+
+    def get_status(self) -> Dict:
+        """아웃박스 상태 조회 (앱 컨텍스트 필요)"""
+        counts = dict(
+            db.session.query(NotificationOutbox.status, db.func.count(NotificationOutbox.id))
+            .group_by(NotificationOutbox.status).all()
+        )
+        return {
+            'is_running': bool(self._thread and self._thread.is_alive()),
+            'pending': counts.get('pending', 0),
+            'sending': counts.get('sending', 0),
+            'sent': counts.get('sent', 0),
+            'failed': counts.get('failed', 0)
+        }
+
+
+# 싱글톤 인스턴스
+notification_dispatcher = NotificationDispatcher()
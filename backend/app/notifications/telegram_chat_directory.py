@@ -0,0 +1,180 @@
+"""
+텔레그램 채팅 목록 캐시
+
+getUpdates offset을 봇별로 저장해 두고 새 update만 가져와
+telegram_chats 테이블을 점진적으로 갱신합니다.
+봇에 쌓인 update가 많아도 설정 화면은 캐시에서 바로 응답합니다.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app import db
+from app.models.database import TelegramChat, TelegramUpdateCursor
+from app.notifications.telegram_notifier import get_http_session
+
+# getUpdates 한 번에 가져올 최대 update 수 (텔레그램 최대값)
+UPDATES_PAGE_SIZE = 100
+# 한 번의 동기화에서 가져올 최대 페이지 수
+MAX_PAGES_PER_SYNC = 50
+
+
+class TelegramApiError(Exception):
+    """텔레그램 API 오류 응답"""
+    pass
+
+
+def get_bot_id(bot_token: str) -> str:
+    """봇 토큰에서 봇 ID(':' 앞부분) 추출"""
+    return bot_token.split(':', 1)[0]
+
+
+def _parse_chat(chat: Dict) -> Dict:
+    """update의 chat 객체를 캐시 레코드 형태로 변환"""
+    chat_type = chat.get('type', 'unknown')
+
+    # 채팅 이름 결정
+    if chat_type == 'private':
+        name = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
+        username = chat.get('username', '')
+    elif chat_type in ['group', 'supergroup']:
+        name = chat.get('title', 'Unknown Group')
+        username = ''
+    elif chat_type == 'channel':
+        name = chat.get('title', 'Unknown Channel')
+        username = chat.get('username', '')
+    else:
+        name = 'Unknown'
+        username = ''
+
+    return {
+        'chat_type': chat_type,
+        'name': name or f"User {chat.get('id')}",
+        'username': username
+    }
+
+
+def sync_chats(bot_token: str, timeout: int = 10) -> int:
+    """마지막 offset 이후의 update만 가져와 채팅 목록 캐시 갱신
+
+    Args:
+        bot_token: 텔레그램 봇 토큰
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        int: 처리한 update 수
+
+    Raises:
+        TelegramApiError: 텔레그램 API가 오류를 반환한 경우
+        requests.RequestException: 네트워크 오류
+    """
+    bot_id = get_bot_id(bot_token)
+    url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
+
+    last_update_id = db.session.execute(
+        select(TelegramUpdateCursor.last_update_id).where(TelegramUpdateCursor.bot_id == bot_id)
+    ).scalar()
+    processed = 0
+    chats_seen = set()
+
+    try:
+        for _ in range(MAX_PAGES_PER_SYNC):
+            params = {'limit': UPDATES_PAGE_SIZE, 'timeout': 0}
+            if last_update_id is not None:
+                params['offset'] = last_update_id + 1
+
+            response = get_http_session().get(url, params=params, timeout=timeout)
+            data = response.json()
+
+            if not data.get('ok'):
+                raise TelegramApiError(data.get('description', 'Unknown error'))
+
+            updates = data.get('result', [])
+            now = datetime.utcnow()
+            page_chats: Dict[str, Dict] = {}
+            for update in updates:
+                last_update_id = max(last_update_id or 0, update.get('update_id', 0))
+
+                message = update.get('message') or update.get('edited_message') or update.get('channel_post')
+                if not message:
+                    continue
+
+                chat = message.get('chat', {})
+                if not chat.get('id'):
+                    continue
+
+                chat_id = str(chat['id'])
+                page_chats[chat_id] = {'bot_id': bot_id, 'chat_id': chat_id, 'last_seen_at': now, **_parse_chat(chat)}
+
+            # 동시에 실행된 동기화(API 요청 / 예약 갱신)와 겹쳐도 실패하지 않도록 upsert
+            if page_chats:
+                db.session.execute(_upsert_chats_stmt(), list(page_chats.values()))
+                chats_seen.update(page_chats)
+            if updates:
+                db.session.execute(_upsert_cursor_stmt(), {
+                    'bot_id': bot_id, 'last_update_id': last_update_id, 'updated_at': now
+                })
+
+            processed += len(updates)
+
+            # 페이지마다 커밋하여 offset 진행 상황 보존
+            db.session.commit()
+
+            if len(updates) < UPDATES_PAGE_SIZE:
+                break
+    except Exception:
+        # 커밋되지 않은 페이지는 다음 동기화에서 다시 가져옴
+        db.session.rollback()
+        raise
+
+    if processed:
+        logger.info(f"Telegram chat directory synced: {processed} new updates, {len(chats_seen)} chats updated")
+
+    return processed
+
+
+def _upsert_chats_stmt():
+    """(bot_id, chat_id) 기준 채팅 upsert"""
+    table = TelegramChat.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.bot_id, table.c.chat_id],
+        set_={
+            'chat_type': stmt.excluded.chat_type,
+            'name': stmt.excluded.name,
+            'username': stmt.excluded.username,
+            'last_seen_at': stmt.excluded.last_seen_at
+        }
+    )
+
+
+def _upsert_cursor_stmt():
+    """봇별 offset upsert (동시 동기화 중 더 앞선 offset 으로 되돌리지 않음)"""
+    table = TelegramUpdateCursor.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.bot_id],
+        set_={
+            'last_update_id': func.max(func.coalesce(table.c.last_update_id, 0), stmt.excluded.last_update_id),
+            'updated_at': stmt.excluded.updated_at
+        }
+    )
+
+
+def list_chats(bot_token: str, current_chat_id: Optional[str] = None) -> List[Dict]:
+    """캐시된 채팅 목록 반환 (현재 선택된 채팅 먼저, 이후 이름순)"""
+    chats = TelegramChat.query.filter_by(bot_id=get_bot_id(bot_token)).all()
+
+    chats_list = []
+    for chat in chats:
+        item = chat.to_dict()
+        item['is_current'] = chat.chat_id == current_chat_id
+        chats_list.append(item)
+
+    return sorted(
+        chats_list,
+        key=lambda x: (not x['is_current'], (x['name'] or '').lower())
+    )
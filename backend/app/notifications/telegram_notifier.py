@@ -1,11 +1,34 @@
 """텔레그램 알림"""
 import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from flask import has_app_context
 from loguru import logger
+from sqlalchemy import event
+
+from app.utils.upstream import UpstreamSession
+from app.utils.tracing import traced
+
+
+@dataclass
+class DeliveryResult:
+    """텔레그램 전송 결과"""
+    ok: bool
+    retryable: bool = False
+    retry_after: Optional[int] = None  # 텔레그램이 요구한 대기 시간 (초)
+    error: Optional[str] = None
 
 
 class TelegramNotifier:
-    """텔레그램 알림 서비스 (requests 기반 동기 방식)"""
+    """텔레그램 알림 서비스 (requests 기반 동기 방식)
+
+    직접 생성하기보다 get_notifier() / get_notifier_for()로 공유 인스턴스를 사용하세요.
+    """
 
     def __init__(self, bot_token: str = None, chat_id: str = None):
         """
@@ -23,7 +46,29 @@ class TelegramNotifier:
             logger.warning("Telegram credentials not configured")
 
     def send_message(self, message: str) -> bool:
-        """메시지 전송
+        """메시지 전송 요청 (아웃박스에 적재, 실제 전송은 백그라운드 디스패처가 담당)
+
+        Flask 앱 컨텍스트 밖에서 호출되면 즉시 전송한다.
+
+        Returns:
+            bool: 적재(또는 전송) 성공 여부
+        """
+        if not self.bot_token or not self.chat_id:
+            logger.warning("Telegram bot not configured, skipping notification")
+            return False
+
+        if not has_app_context():
+            return self.send_message_now(message)
+
+        from app.notifications.notification_outbox import enqueue_notification
+        if enqueue_notification(self.bot_token, self.chat_id, message):
+            return True
+
+        # 아웃박스 적재 실패 시 직접 전송
+        return self.send_message_now(message)
+
+    def send_message_now(self, message: str) -> bool:
+        """메시지 즉시 전송 (동기 방식)
 
         Returns:
             bool: 성공 여부
@@ -32,6 +77,15 @@ class TelegramNotifier:
             logger.warning("Telegram bot not configured, skipping notification")
             return False
 
+        return self.deliver(message).ok
+
+    @traced('telegram.send_message', kind='telegram')
+    def deliver(self, message: str) -> 'DeliveryResult':
+        """텔레그램 sendMessage API 호출
+
+        Returns:
+            DeliveryResult: 전송 결과 (재시도 가능 여부, retry_after 포함)
+        """
         try:
             url = f"{self.api_base}/sendMessage"
             payload = {
@@ -40,19 +94,29 @@ class TelegramNotifier:
                 'parse_mode': 'HTML'
             }
 
-            response = requests.post(url, json=payload, timeout=10)
-            result = response.json()
+            response = get_http_session().post(url, json=payload, timeout=10)
+
+            try:
+                result = response.json()
+            except ValueError:
+                result = {'ok': False, 'description': f"HTTP {response.status_code}"}
 
             if result.get('ok'):
                 logger.info(f"Telegram message sent: {message[:50]}...")
-                return True
-            else:
-                logger.error(f"Telegram API error: {result.get('description', 'Unknown error')}")
-                return False
+                return DeliveryResult(ok=True)
+
+            description = result.get('description', 'Unknown error')
+            retry_after = (result.get('parameters') or {}).get('retry_after')
+            logger.error(f"Telegram API error: {description}")
+
+            # 429(rate limit)와 5xx는 재시도, 나머지 4xx는 영구 실패
+            status_code = result.get('error_code') or response.status_code
+            retryable = status_code == 429 or status_code >= 500
+            return DeliveryResult(ok=False, retryable=retryable, retry_after=retry_after, error=description)
 
         except requests.RequestException as e:
             logger.error(f"Failed to send Telegram message: {e}")
-            return False
+            return DeliveryResult(ok=False, retryable=True, error=str(e))
 
     def send_availability_notification(self, camping_site: str, date: str):
         """예약 가능 알림"""
@@ -128,3 +192,94 @@ class TelegramNotifier:
         """모니터링 중지 알림"""
         message = "⏹️ <b>모니터링 중지</b>\n\n캠핑 예약 모니터링이 중지되었습니다."
         self.send_message(message)
+
+
+# =====================================================
+# 프로세스 전역 알림 인스턴스 레지스트리
+# =====================================================
+
+# api.telegram.org keep-alive 세션 (모든 인스턴스가 공유하여 TLS 핸드셰이크 재사용)
+_http_session: Optional[requests.Session] = None
+_notifiers: Dict[Tuple[str, str], TelegramNotifier] = {}
+_registry_lock = threading.Lock()
+
+# 현재 설정(DB 우선, 환경 변수 fallback) 캐시
+_current_key: Optional[Tuple[str, str]] = None
+_current_resolved_at: float = 0.0
+SETTINGS_CACHE_TTL = 300  # 초 (다른 프로세스에서 변경된 설정 반영용)
+
+
+def get_http_session() -> requests.Session:
+    """공유 HTTP 세션 반환 (최초 호출 시 생성)"""
+    global _http_session
+    if _http_session is None:
+        with _registry_lock:
+            if _http_session is None:
+                session = UpstreamSession('telegram', breaker=True)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+                session.mount('https://', adapter)
+                _http_session = session
+    return _http_session
+
+
+def get_notifier_for(bot_token: str, chat_id: str) -> TelegramNotifier:
+    """(bot_token, chat_id)별 공유 TelegramNotifier 반환"""
+    key = (bot_token, str(chat_id) if chat_id is not None else None)
+    notifier = _notifiers.get(key)
+    if notifier is None:
+        with _registry_lock:
+            notifier = _notifiers.get(key)
+            if notifier is None:
+                notifier = TelegramNotifier(bot_token, chat_id)
+                _notifiers[key] = notifier
+    return notifier
+
+
+def _resolve_settings() -> Tuple[str, str]:
+    """텔레그램 설정 조회 - DB 설정 우선, 환경 변수 fallback"""
+    if has_app_context():
+        try:
+            from app.models.database import AppSettings
+            settings = AppSettings.query.first()
+            if settings and settings.telegram_bot_token and settings.telegram_chat_id:
+                logger.info("Using Telegram settings from database")
+                return settings.telegram_bot_token, settings.telegram_chat_id
+        except Exception as e:
+            logger.warning(f"Failed to load Telegram settings from DB: {e}")
+
+    logger.info("Using Telegram settings from environment")
+    return os.getenv('TELEGRAM_BOT_TOKEN'), os.getenv('TELEGRAM_CHAT_ID')
+
+
+def get_notifier() -> TelegramNotifier:
+    """현재 설정에 맞는 공유 TelegramNotifier 반환
+
+    설정은 캐시되며 AppSettings 변경 시(또는 TTL 경과 시) 자동으로 다시 조회됩니다.
+    """
+    global _current_key, _current_resolved_at
+
+    if _current_key is None or time.monotonic() - _current_resolved_at > SETTINGS_CACHE_TTL:
+        _current_key = _resolve_settings()
+        _current_resolved_at = time.monotonic()
+
+    return get_notifier_for(*_current_key)
+
+
+def invalidate_notifier_settings():
+    """캐시된 텔레그램 설정 무효화 (다음 get_notifier() 호출 시 다시 조회)"""
+    global _current_key
+    _current_key = None
+
+
+def _register_settings_listeners():
+    """AppSettings 변경 시 설정 캐시 무효화"""
+    from app.models.database import AppSettings
+
+    def _on_settings_change(mapper, connection, target):
+        invalidate_notifier_settings()
+
+    for event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(AppSettings, event_name, _on_settings_change)
+
+
+_register_settings_listeners()
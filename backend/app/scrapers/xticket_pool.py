@@ -0,0 +1,180 @@
+"""
+XTicket 클라이언트 풀
+
+캠핑장(shopEncode, shopCode)별로 XTicketScraper를 하나씩 보관해
+keep-alive 세션(연결)을 재사용합니다. XTicket 캠핑장 N곳을 모니터링하면
+N개의 연결이 계속 살아 있는 상태로 재사용됩니다.
+
+- 최근 사용 순(LRU)으로 관리하며 최대 개수를 넘으면 가장 오래 쓰지 않은 클라이언트 제거
+- 일정 시간 사용하지 않은 클라이언트는 조회 시점에 정리 (세션 close)
+- 클라이언트별 요청 수는 upstream_client_requests_total{client=shop_code} 로 집계
+
+로그인 상태가 계정마다 달라야 하는 다중 계정 예약은 풀을 쓰지 않고 계정별로 스크래퍼를 만듭니다.
+풀 클라이언트는 모니터링/조회용이므로 조회 요청에 서킷 브레이커를 적용합니다 (예약 요청은 제외).
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.scrapers.xticket_scraper import XTicketScraper
+from app.utils.metrics import XTICKET_POOL_CLIENTS, XTICKET_POOL_EVENTS
+
+ShopKey = Tuple[str, str]  # (shop_encode, shop_code)
+
+
+class _PooledClient:
+    """풀에 보관된 클라이언트와 사용 기록"""
+
+    __slots__ = ('scraper', 'created_at', 'last_used', 'uses')
+
+    def __init__(self, scraper: XTicketScraper):
+        self.scraper = scraper
+        self.created_at = datetime.utcnow()
+        self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class XTicketClientPool:
+    """
+    캠핑장별 XTicket 클라이언트 풀 (싱글톤)
+
+    Features:
+    - (shop_encode, shop_code)별 스크래퍼 재사용
+    - LRU 최대 개수 제한 및 유휴 클라이언트 정리
+    - 풀 적중/생성/제거 메트릭
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._pool_lock = threading.Lock()
+        self._clients: 'OrderedDict[ShopKey, _PooledClient]' = OrderedDict()
+        self.max_clients = 32
+        self.idle_seconds = 1800
+        self.max_retries = 3
+        self.timeout = 30
+
+    def init_app(self, app):
+        """XTICKET_POOL_* / MAX_RETRIES / REQUEST_TIMEOUT 설정 적용"""
+        self.max_clients = app.config['XTICKET_POOL_MAX_CLIENTS']
+        self.idle_seconds = app.config['XTICKET_POOL_IDLE_SECONDS']
+        self.max_retries = app.config['MAX_RETRIES']
+        self.timeout = app.config['REQUEST_TIMEOUT']
+
+    def _create(self, shop_encode: str, shop_code: str) -> XTicketScraper:
+        """새 스크래퍼 생성 (재시도/타임아웃 설정 적용)"""
+        return XTicketScraper(
+            shop_encode=shop_encode,
+            shop_code=shop_code,
+            max_retries=self.max_retries,
+            timeout=self.timeout,
+            circuit_breaker=True
+        )
+
+    @staticmethod
+    def _close(client: _PooledClient):
+        try:
+            client.scraper.session.close()
+        except Exception as e:
+            logger.debug(f"Error closing XTicket session: {e}")
+
+    def _evict_idle(self, now: float):
+        """유휴 시간이 지난 클라이언트 제거 (LRU 순서이므로 앞에서부터 확인)"""
+        while self._clients:
+            key, client = next(iter(self._clients.items()))
+            if now - client.last_used < self.idle_seconds:
+                break
+            del self._clients[key]
+            self._close(client)
+            XTICKET_POOL_EVENTS.inc(event='evict_idle')
+            logger.debug(f"XTicket client evicted (idle): shop_code={key[1]}")
+
+    def get(self, shop_encode: str, shop_code: str) -> XTicketScraper:
+        """캠핑장 클라이언트 조회 (없으면 생성)"""
+        key = (shop_encode, shop_code)
+        now = time.monotonic()
+
+        with self._pool_lock:
+            self._evict_idle(now)
+
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                XTICKET_POOL_EVENTS.inc(event='hit')
+            else:
+                client = _PooledClient(self._create(shop_encode, shop_code))
+                self._clients[key] = client
+                XTICKET_POOL_EVENTS.inc(event='miss')
+                logger.info(f"XTicket client created: shop_code={shop_code} ({len(self._clients)} pooled)")
+
+                while len(self._clients) > self.max_clients:
+                    evicted_key, evicted = self._clients.popitem(last=False)
+                    self._close(evicted)
+                    XTICKET_POOL_EVENTS.inc(event='evict_lru')
+                    logger.debug(f"XTicket client evicted (LRU): shop_code={evicted_key[1]}")
+
+            client.last_used = now
+            client.uses += 1
+            XTICKET_POOL_CLIENTS.set(len(self._clients))
+            return client.scraper
+
+    def get_for_site(self, camping_site) -> Optional[XTicketScraper]:
+        """CampingSite에 저장된 shop 값으로 클라이언트 조회
+
+        Returns:
+            Optional[XTicketScraper]: shop_encode/shop_code를 알 수 없으면 None
+        """
+        shop_encode, shop_code = camping_site.xticket_shop()
+        if not shop_encode or not shop_code:
+            logger.warning(f"XTicket shop parameters not configured for camping site {camping_site.id}")
+            return None
+        return self.get(shop_encode, shop_code)
+
+    def clear(self):
+        """모든 클라이언트 제거"""
+        with self._pool_lock:
+            for client in self._clients.values():
+                self._close(client)
+            self._clients.clear()
+            XTICKET_POOL_CLIENTS.set(0)
+
+    def get_status(self) -> Dict:
+        """풀 상태 (클라이언트별 사용 횟수/유휴 시간)"""
+        now = time.monotonic()
+        with self._pool_lock:
+            clients = [
+                {
+                    'shop_code': shop_code,
+                    'created_at': client.created_at.isoformat(),
+                    'idle_seconds': round(now - client.last_used, 1),
+                    'uses': client.uses,
+                    'logged_in': client.scraper.is_logged_in
+                }
+                for (_, shop_code), client in reversed(self._clients.items())
+            ]
+        return {
+            'size': len(clients),
+            'max_clients': self.max_clients,
+            'idle_seconds': self.idle_seconds,
+            'clients': clients
+        }
+
+
+# 싱글톤 인스턴스
+xticket_pool = XTicketClientPool()
@@ -4,7 +4,14 @@ from datetime import datetime, timedelta
 from loguru import logger
 import requests
 import time
+import os
 from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from app.utils import deadline
+from app.utils.circuit_breaker import circuit_breakers
+from app.utils.tracing import traced
+from app.utils.upstream import UpstreamSession
 
 
 class XTicketScraper:
@@ -14,21 +21,29 @@ class XTicketScraper:
     브라우저 자동화 대신 직접 API를 호출하여 더 빠르고 안정적으로 동작
     """
 
-    BASE_URL = "https://camp.xticket.kr"
+    # XTICKET_BASE_URL로 로컬 스텁 서버(benchmarks/xticket_stub.py) 지정 가능
+    BASE_URL = os.getenv('XTICKET_BASE_URL', "https://camp.xticket.kr").rstrip('/')
 
     def __init__(self, shop_encode: str, shop_code: str, max_retries: int = 3,
-                 retry_delay: float = 1.0, timeout: int = 30):
+                 retry_delay: float = 1.0, timeout: int = 30, base_url: str = None,
+                 circuit_breaker: bool = False):
         """
         Args:
             shop_encode: 캠핑장 고유 코드 (URL의 shopEncode 파라미터)
             shop_code: 캠핑장 코드 (API 요청용)
             max_retries: 최대 재시도 횟수
             retry_delay: 재시도 간 기본 대기 시간 (초)
-            timeout: HTTP 요청 타임아웃 (초)
+            timeout: HTTP 응답 대기(read) 타임아웃 (초, 연결 타임아웃은 UPSTREAM_CONNECT_TIMEOUT)
+            base_url: XTicket 서버 주소 (None이면 BASE_URL 사용)
+            circuit_breaker: 조회 요청에 호스트별 서킷 브레이커 적용 (모니터링/조회용 풀 클라이언트만 True,
+                예약/로그인/서버 시간 요청은 항상 제외)
         """
+        if base_url:
+            self.BASE_URL = base_url.rstrip('/')
+
         self.shop_encode = shop_encode
         self.shop_code = shop_code
-        self.session = requests.Session()
+        self.session = UpstreamSession('xticket', client=shop_code, timeout=timeout, breaker=circuit_breaker)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
@@ -46,6 +61,7 @@ class XTicketScraper:
         })
         self.is_logged_in = False
 
+    @traced('xticket.request_with_retry', kind='xticket')
     def _make_request_with_retry(self, method: str, url: str, **kwargs):
         """
         재시도 로직이 적용된 HTTP 요청 (exponential backoff)
@@ -60,8 +76,22 @@ class XTicketScraper:
 
         Raises:
             requests.RequestException: 모든 재시도 실패 시
+            CircuitOpenError: 브레이커를 쓰는 요청에서 XTicket 서버 회로가 열려 있을 때 (요청 없이 즉시)
+            DeadlineExceeded: 호출자(API 요청/모니터링 틱/작업)의 시간 예산 초과
         """
         kwargs.setdefault('timeout', self.timeout)
+        breaker = circuit_breakers.get(urlparse(url).netloc) if self.session.uses_breaker(kwargs.get('breaker')) else None
+
+        def should_stop(wait_time: float) -> bool:
+            """회로가 열렸거나 남은 시간이 백오프 대기보다 짧으면 재시도 중단"""
+            if breaker is not None and breaker.is_open:
+                logger.error(f"Circuit open for {breaker.host}, not retrying")
+                return True
+            left = deadline.remaining()
+            if left is not None and left <= wait_time:
+                logger.error(f"Deadline reached ({max(left, 0):.1f}s left), not retrying")
+                return True
+            return False
 
         for attempt in range(self.max_retries):
             try:
@@ -75,11 +105,16 @@ class XTicketScraper:
                 response.raise_for_status()
                 return response
 
+            except deadline.DeadlineExceeded:
+                raise
+
             except (requests.Timeout, requests.ConnectionError) as e:
                 # 타임아웃 또는 연결 오류는 재시도
                 wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
                 logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
 
+                if should_stop(wait_time):
+                    raise
                 if attempt < self.max_retries - 1:
                     logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
@@ -93,6 +128,8 @@ class XTicketScraper:
                     wait_time = self.retry_delay * (2 ** attempt)
                     logger.warning(f"Server error {e.response.status_code} (attempt {attempt + 1}/{self.max_retries})")
 
+                    if should_stop(wait_time):
+                        raise
                     if attempt < self.max_retries - 1:
                         logger.info(f"Retrying in {wait_time:.1f} seconds...")
                         time.sleep(wait_time)
@@ -112,7 +149,7 @@ class XTicketScraper:
         try:
             # 실제 캠핑장 페이지 URL 사용 (BASE_URL은 404 반환)
             main_url = f"{self.BASE_URL}/web/main?shopEncode={self.shop_encode}"
-            response = self._make_request_with_retry('GET', main_url)
+            response = self._make_request_with_retry('GET', main_url, breaker=False)
 
             # HTTP Date 헤더 파싱
             date_header = response.headers.get('Date')
@@ -179,7 +216,7 @@ class XTicketScraper:
         """세션 초기화 - 메인 페이지 방문하여 쿠키 획득 및 서버 시간 동기화"""
         try:
             main_url = f"{self.BASE_URL}/web/main?shopEncode={self.shop_encode}"
-            self.session.get(main_url, timeout=self.timeout)
+            self.session.get(main_url, timeout=self.timeout, breaker=False)
             logger.debug("Session initialized by visiting main page")
 
             # 서버 시간 동기화
@@ -211,7 +248,7 @@ class XTicketScraper:
         }
 
         try:
-            response = self._make_request_with_retry('POST', url, data=payload)
+            response = self._make_request_with_retry('POST', url, data=payload, breaker=False)
             data = response.json()
 
             # 응답 구조: {data: {success: true, member_id: ..., member_no: ...}}
@@ -233,7 +270,7 @@ class XTicketScraper:
         url = f"{self.BASE_URL}/Web/Member/MemberLogout.json"
 
         try:
-            response = self.session.post(url)
+            response = self.session.post(url, breaker=False)
             response.raise_for_status()
             self.is_logged_in = False
             logger.info("Logout successful")
@@ -357,7 +394,7 @@ class XTicketScraper:
             return []
 
     def get_available_sites(self, target_date: str, product_group_code: str = "0004",
-                           book_days: int = 1) -> list:
+                           book_days: int = 1, include_unavailable: bool = False) -> list:
         """
         특정 날짜의 선택 가능한 개별 사이트 조회
 
@@ -365,6 +402,7 @@ class XTicketScraper:
             target_date: 확인할 날짜 (YYYY-MM-DD 또는 YYYYMMDD)
             product_group_code: 시설 그룹 코드 (기본값: "0004" 파쇄석사이트)
             book_days: 숙박 일수 (1박2일 = 1, 2박3일 = 2)
+            include_unavailable: True면 선택 불가 사이트도 포함 (좌석 카탈로그 동기화용)
 
         Returns:
             선택 가능한 사이트 목록 [
@@ -401,6 +439,10 @@ class XTicketScraper:
             # 실제 응답 구조: {data: {bookProductList: [...]}}
             all_sites = data.get('data', {}).get('bookProductList', [])
 
+            if include_unavailable:
+                logger.info(f"Found {len(all_sites)} sites on {target_date}")
+                return all_sites
+
             # 선택 가능한 사이트만 필터링 (select_yn == "1" 또는 sale_product_fee > 0)
             available_sites = [
                 site for site in all_sites
@@ -493,7 +535,7 @@ class XTicketScraper:
             from app.utils.captcha_solver import get_captcha_solver
 
             # CAPTCHA 이미지 다운로드
-            response = self.session.get(captcha_image_url)
+            response = self.session.get(captcha_image_url, breaker=False)
             response.raise_for_status()
 
             # OCR로 CAPTCHA 해결
@@ -606,7 +648,8 @@ class XTicketScraper:
                     }
 
                 try:
-                    response = self.session.post(url, data=payload)
+                    # 오픈 시각의 5xx 폭주로 회로가 열려도 예약 요청은 막지 않음
+                    response = self.session.post(url, data=payload, breaker=False)
                     response.raise_for_status()
 
                     data = response.json()
@@ -0,0 +1,178 @@
+"""
+캠핑장 월별 예약 가능 캘린더 뷰
+
+모니터링 틱에서 조회한 월 캘린더를 availability_month_views 테이블에 저장하고,
+버전별로 메모리에 캐시해 대시보드 캘린더 요청을 업스트림 호출 없이 응답합니다.
+
+- 틱이 해당 월을 조회할 때마다 갱신 (내용이 바뀐 경우에만 version 증가)
+- 조회 시 DB의 version / checked_at 만 읽어 캐시 항목과 비교하고, 다르면 days 를 다시 로드
+  (다른 프로세스의 틱, 유지보수 삭제, 백업 복원도 반영)
+"""
+import threading
+from calendar import monthrange
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import select
+
+from app import db
+from app.models.database import AvailabilityMonthView
+
+MonthKey = Tuple[int, int, int]  # (camping_site_id, year, month)
+
+
+class AvailabilityCalendarService:
+    """
+    월별 캘린더 뷰 (싱글톤)
+
+    Features:
+    - 틱 캘린더 -> 월 뷰 upsert (커밋 1회)
+    - version 기반 인메모리 캐시
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._cache_lock = threading.Lock()
+        # (캠핑장, 연, 월) -> 응답용 dict (version 포함)
+        self._cache: Dict[MonthKey, Dict] = {}
+
+    @staticmethod
+    def _build(view: AvailabilityMonthView) -> Dict:
+        """DB 뷰 -> 응답용 dict (일자 순 정렬)"""
+        _, last_day = monthrange(view.year, view.month)
+        days = []
+        for day in sorted(int(key) for key in view.days):
+            if 1 <= day <= last_day:
+                remain = view.days[str(day)]
+                days.append({
+                    'date': date(view.year, view.month, day).isoformat(),
+                    'remain_count': remain,
+                    'available': remain > 0
+                })
+
+        return {
+            'camping_site_id': view.camping_site_id,
+            'month': f"{view.year:04d}{view.month:02d}",
+            'version': view.version,
+            'updated_at': view.updated_at.isoformat() if view.updated_at else None,
+            'days': days,
+            'available_days': sum(1 for item in days if item['available'])
+        }
+
+    def refresh(self, calendars: Dict[MonthKey, Dict[date, int]]) -> int:
+        """모니터링 틱 캘린더로 월 뷰 갱신
+
+        Args:
+            calendars: {(캠핑장, 연, 월): {날짜: 잔여 수}} (MonitorService 틱 캐시)
+
+        Returns:
+            int: 내용이 바뀌어 version이 올라간 월 수
+        """
+        # 조회 실패 시 스크래퍼가 빈 목록을 반환하므로 빈 캘린더로는 기존 뷰를 덮어쓰지 않음
+        calendars = {key: calendar for key, calendar in calendars.items() if calendar}
+        if not calendars:
+            return 0
+
+        now = datetime.utcnow()
+        site_ids = {site_id for site_id, _, _ in calendars}
+        existing = {
+            (view.camping_site_id, view.year, view.month): view
+            for view in AvailabilityMonthView.query.filter(AvailabilityMonthView.camping_site_id.in_(site_ids))
+        }
+
+        changed = []
+        for key, calendar in calendars.items():
+            days = {str(target_date.day): remain for target_date, remain in calendar.items()}
+            view = existing.get(key)
+
+            if view is None:
+                view = AvailabilityMonthView(
+                    camping_site_id=key[0], year=key[1], month=key[2],
+                    days=days, version=1, updated_at=now, checked_at=now
+                )
+                db.session.add(view)
+                changed.append((key, view))
+            elif view.days != days:
+                view.days = days
+                view.version += 1
+                view.updated_at = now
+                view.checked_at = now
+                changed.append((key, view))
+            else:
+                view.checked_at = now
+
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        with self._cache_lock:
+            for key, view in changed:
+                self._cache[key] = self._build(view)
+
+        if changed:
+            logger.debug(f"Availability month views refreshed: {len(changed)}/{len(calendars)} changed")
+        return len(changed)
+
+    def get_month(self, camping_site_id: int, year: int, month: int) -> Optional[Dict]:
+        """월 캘린더 조회 (DB version 이 같으면 캐시 사용, 다르면 DB에서 다시 로드)
+
+        Returns:
+            Optional[Dict]: 아직 모니터링되지 않은 월이면 None
+        """
+        key = (camping_site_id, year, month)
+        current = db.session.execute(
+            select(AvailabilityMonthView.version, AvailabilityMonthView.checked_at).filter_by(
+                camping_site_id=camping_site_id, year=year, month=month
+            )
+        ).first()
+
+        if current is None:
+            with self._cache_lock:
+                self._cache.pop(key, None)
+            return None
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+
+        if cached is None or cached['version'] != current.version:
+            view = AvailabilityMonthView.query.filter_by(
+                camping_site_id=camping_site_id, year=year, month=month
+            ).first()
+            if view is None:
+                return None
+
+            cached = self._build(view)
+            with self._cache_lock:
+                self._cache[key] = cached
+
+        checked_at = current.checked_at
+        return {**cached, 'checked_at': checked_at.isoformat() if checked_at else None}
+
+    def invalidate(self, camping_site_id: Optional[int] = None):
+        """캐시 무효화 (캠핑장 삭제 등, None이면 전체)"""
+        with self._cache_lock:
+            if camping_site_id is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == camping_site_id]:
+                del self._cache[key]
+
+
+# 싱글톤 인스턴스
+calendar_views = AvailabilityCalendarService()
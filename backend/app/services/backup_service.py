@@ -0,0 +1,259 @@
+"""
+SQLite 온라인 백업 서비스
+
+파일 복사 대신 SQLite online backup API 로 백업합니다.
+BACKUP_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 BACKUP_STEP_SLEEP_MS 만큼 쉬므로
+백업 중에도 앱의 쓰기가 오래 막히지 않고, 결과는 항상 일관된 시점의 DB 입니다.
+(복사 도중 다른 연결이 쓰면 SQLite 가 해당 시점부터 다시 복사)
+
+- 대상: 메인 DB (SQLALCHEMY_DATABASE_URI) + APScheduler 작업 저장소 (scheduler_jobs.db)
+- BACKUP_COMPRESS=true 이면 gzip 압축 (<이름>_<시각>.db.gz)
+- DB 별로 최근 BACKUP_KEEP 개만 보관
+- verify_latest(): 가장 최근 백업을 임시 파일로 풀어 열고 PRAGMA integrity_check
+
+사용 예:
+    python scripts/backup_db.py run
+    python scripts/backup_db.py verify
+"""
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from app import db
+from app.services.scheduler_service import JOBSTORE_DB_PATH, scheduler_service
+from app.utils.metrics import BACKUP_DURATION_SECONDS, BACKUP_LAST_SUCCESS_TIMESTAMP
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+class BackupService:
+    """SQLite 온라인 백업 서비스"""
+
+    def __init__(self):
+        self._run_lock = threading.Lock()
+        self.last_run: Optional[Dict] = None
+
+        self.enabled = True
+        self.hour = 3
+        self.backup_dir = BACKEND_DIR / 'data' / 'backups'
+        self.pages_per_step = 256
+        self.step_sleep = 0.01
+        self.compress = True
+        self.keep = 7
+
+    def init_app(self, app):
+        """BACKUP_* 설정 적용 (스크립트 실행 시에도 사용)"""
+        self.enabled = app.config['BACKUP_ENABLED']
+        self.hour = app.config['BACKUP_HOUR']
+        self.backup_dir = Path(app.config['BACKUP_DIR'])
+        self.pages_per_step = app.config['BACKUP_PAGES_PER_STEP']
+        self.step_sleep = app.config['BACKUP_STEP_SLEEP_MS'] / 1000
+        self.compress = app.config['BACKUP_COMPRESS']
+        self.keep = app.config['BACKUP_KEEP']
+
+    # ----- 스케줄 -----
+
+    def start(self, app):
+        """매일 BACKUP_HOUR 시에 실행되도록 공용 스케줄러에 등록"""
+        if not self.enabled:
+            return
+
+        scheduler_service.add_daily_job(app, 'backup_job', self.run, hour=self.hour)
+        logger.info(f"Backup job scheduled daily at {self.hour:02d}:00 ({self.backup_dir})")
+
+    # ----- 백업 -----
+
+    def databases(self) -> Dict[str, str]:
+        """백업 대상 {이름: 파일 경로} (앱 컨텍스트 필요)"""
+        targets = {}
+        main = db.engine.url.database if db.engine.dialect.name == 'sqlite' else None
+        if main and main != ':memory:':
+            targets[Path(main).stem] = main
+        if os.path.exists(JOBSTORE_DB_PATH):
+            targets[Path(JOBSTORE_DB_PATH).stem] = JOBSTORE_DB_PATH
+        return targets
+
+    def run(self) -> Dict:
+        """모든 대상 DB 백업 후 오래된 백업 정리"""
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError('Backup is already running')
+
+        try:
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            result = {'started_at': datetime.now().isoformat(timespec='seconds'), 'databases': {}}
+            for name, path in self.databases().items():
+                try:
+                    result['databases'][name] = self.backup(name, path, stamp)
+                    result['databases'][name]['removed'] = self.rotate(name)
+                except Exception as e:
+                    logger.error(f"Backup of {name} failed: {e}", exc_info=True)
+                    result['databases'][name] = {'error': str(e)}
+            self.last_run = result
+            return result
+        finally:
+            self._run_lock.release()
+
+    def backup(self, name: str, source_path: str, stamp: str) -> Dict:
+        """DB 하나를 online backup API 로 백업
+
+        Returns:
+            Dict: 백업 파일 경로, 크기, 페이지 수, 재시작 횟수, 소요 시간
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        db_file = self.backup_dir / f"{name}_{stamp}.db"
+        final_path = db_file.with_suffix('.db.gz') if self.compress else db_file
+        partial_path = final_path.with_name(final_path.name + '.partial')
+
+        progress = {'steps': 0, 'pages': 0, 'restarts': 0, 'last_remaining': None}
+
+        def on_progress(status, remaining, total):
+            # 남은 페이지가 늘었다면 다른 연결의 쓰기로 복사가 처음부터 다시 시작된 것
+            if progress['last_remaining'] is not None and remaining > progress['last_remaining']:
+                progress['restarts'] += 1
+            progress['last_remaining'] = remaining
+            progress['steps'] += 1
+            progress['pages'] = total
+
+        # 압축하는 경우 임시 DB 파일에 백업한 뒤 압축본만 남김
+        work_dir = tempfile.mkdtemp(prefix='backup-', dir=self.backup_dir) if self.compress else None
+        copy_path = Path(work_dir) / db_file.name if work_dir else partial_path
+        try:
+            source = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True, timeout=30)
+            target = sqlite3.connect(str(copy_path))
+            try:
+                source.backup(target, pages=self.pages_per_step, progress=on_progress, sleep=self.step_sleep)
+            finally:
+                target.close()
+                source.close()
+
+            if self.compress:
+                with open(copy_path, 'rb') as src, gzip.open(partial_path, 'wb', compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+            os.replace(partial_path, final_path)
+        except Exception:
+            partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        elapsed = time.perf_counter() - started
+        BACKUP_DURATION_SECONDS.observe(elapsed, database=name)
+        BACKUP_LAST_SUCCESS_TIMESTAMP.set(time.time(), database=name)
+
+        size = final_path.stat().st_size
+        logger.info(f"💾 Backed up {name} -> {final_path.name} "
+                    f"({progress['pages']} pages, {size / 1024 / 1024:.1f} MB, {elapsed:.1f}s, restarts {progress['restarts']})")
+        return {
+            'path': str(final_path),
+            'bytes': size,
+            'pages': progress['pages'],
+            'steps': progress['steps'],
+            'restarts': progress['restarts'],
+            'seconds': round(elapsed, 2)
+        }
+
+    def list_backups(self, name: str = None) -> List[Path]:
+        """백업 파일 목록 (최신순)"""
+        if not self.backup_dir.exists():
+            return []
+        pattern = f"{name}_*.db*" if name else '*.db*'
+        files = [p for p in self.backup_dir.glob(pattern) if p.name.endswith(('.db', '.db.gz'))]
+        return sorted(files, key=lambda p: p.name, reverse=True)
+
+    def rotate(self, name: str) -> List[str]:
+        """최근 BACKUP_KEEP 개만 남기고 삭제"""
+        if self.keep <= 0:
+            return []
+        removed = []
+        for path in self.list_backups(name)[self.keep:]:
+            path.unlink(missing_ok=True)
+            removed.append(path.name)
+        if removed:
+            logger.info(f"Removed {len(removed)} old {name} backups")
+        return removed
+
+    # ----- 검증 -----
+
+    def verify(self, path: Path) -> Dict:
+        """백업 파일을 열어 무결성 검사 (압축본은 임시 파일로 풀어서 검사)"""
+        path = Path(path)
+        work_dir = None
+        db_path = path
+        try:
+            if path.name.endswith('.gz'):
+                work_dir = tempfile.mkdtemp(prefix='verify-')
+                db_path = Path(work_dir) / path.name[:-3]
+                with gzip.open(path, 'rb') as src, open(db_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                integrity = [row[0] for row in conn.execute('PRAGMA integrity_check').fetchall()]
+                tables = [row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+                )]
+                row_counts = {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+            finally:
+                conn.close()
+        finally:
+            if work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        ok = integrity == ['ok']
+        return {
+            'path': str(path),
+            'ok': ok,
+            'integrity_check': integrity[:20],
+            'tables': len(tables),
+            'row_counts': row_counts
+        }
+
+    def verify_latest(self, names: List[str] = None) -> Dict[str, Dict]:
+        """DB 별 가장 최근 백업 검증 (names 생략 시 백업 디렉토리의 모든 DB)"""
+        if names is None:
+            names = sorted({p.name.rsplit('_', 2)[0] for p in self.list_backups()})
+
+        results = {}
+        for name in names:
+            backups = self.list_backups(name)
+            if not backups:
+                results[name] = {'ok': False, 'error': 'no backup found'}
+                continue
+            try:
+                results[name] = self.verify(backups[0])
+            except (sqlite3.DatabaseError, OSError, EOFError) as e:
+                results[name] = {'path': str(backups[0]), 'ok': False, 'error': str(e)}
+            level = 'info' if results[name]['ok'] else 'error'
+            getattr(logger, level)(f"Backup verification {name}: {'ok' if results[name]['ok'] else 'FAILED'} ({backups[0].name})")
+        return results
+
+    def get_status(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'hour': self.hour,
+            'backup_dir': str(self.backup_dir),
+            'compress': self.compress,
+            'keep': self.keep,
+            'next_run': scheduler_service.get_next_run('backup_job'),
+            'running': self._run_lock.locked(),
+            'last_run': self.last_run,
+            'backups': [
+                {'name': path.name, 'bytes': path.stat().st_size}
+                for path in self.list_backups()
+            ]
+        }
+
+
+# 전역 인스턴스
+backup_service = BackupService()
@@ -0,0 +1,489 @@
+"""
+DB 유지보수 서비스 (보존 기간 정리 / 다운샘플링 / 증분 VACUUM)
+
+매일 한가한 시간대(MAINTENANCE_HOUR 부터 MAINTENANCE_WINDOW_MINUTES 동안)에 실행되어
+이력성 테이블이 끝없이 커지지 않도록 합니다.
+
+- 테이블별 보존 기간(일)이 지난 행은 삭제 전에 gzip 압축 JSONL 로 보관
+  (data/archive/<테이블>/<테이블>_<시각>.jsonl.gz, 봇 토큰 등 비밀 값 컬럼은 보관하지 않음)
+- 오래된 availability_history 는 (캠핑장, 날짜, 확인일) 단위 일별 집계로 다운샘플링
+- 오래된 스케줄의 전체 실행 결과(result)는 비우고 요약 컬럼만 유지
+- 정리 후 SQLite 증분 VACUUM 으로 빈 페이지를 파일에서 반환
+  (auto_vacuum 이 INCREMENTAL 이 아니면 최초 1회 전체 VACUUM 으로 전환)
+
+삭제는 MAINTENANCE_BATCH_SIZE 행 단위로 커밋하므로 쓰기 잠금을 오래 잡지 않습니다.
+보관 파일은 커밋 전에 기록하므로, 중간에 실패하면 다음 실행에서 같은 행이 한 번 더 보관될 수 있습니다.
+
+설정은 config.py 의 MAINTENANCE_* / RETENTION_*_DAYS 를 init_app 에서 읽습니다.
+
+보존 기간 환경변수 (0이면 보존 기간 없음 = 정리하지 않음):
+    RETENTION_RESERVATIONS_DAYS          완료(reserved/failed)된 예약
+    RETENTION_SCHEDULES_DAYS             완료/실패/취소된 예약 스케줄
+    RETENTION_SCHEDULE_RESULTS_DAYS      스케줄 전체 실행 결과 JSON (요약 컬럼은 유지)
+    RETENTION_AVAILABILITY_HISTORY_DAYS  상태 변경 이력 원본 (이후 일별 집계로 보관)
+    RETENTION_AVAILABILITY_DAILY_DAYS    일별 집계
+    RETENTION_PAST_TARGETS_DAYS          날짜가 지난 모니터링 타겟 / 기간 타겟 / 월별 캘린더 뷰
+    RETENTION_NOTIFICATIONS_DAYS         전송 완료/실패한 알림 아웃박스
+"""
+import gzip
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import delete, func, null, select, update
+
+from app import db
+from app.models.database import (
+    AvailabilityDailySummary, AvailabilityHistory, AvailabilityMonthView, MonitoringRangeTarget,
+    MonitoringTarget, NotificationOutbox, Reservation, ReservationSchedule
+)
+from app.utils.metrics import MAINTENANCE_ROWS, MAINTENANCE_STEP_SECONDS
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 보존 기간 기본값 (일)
+DEFAULT_RETENTION_DAYS = {
+    'reservations': 365,
+    'schedules': 365,
+    'schedule_results': 90,
+    'availability_history': 30,
+    'availability_daily': 730,
+    'past_targets': 30,
+    'notifications': 14,
+}
+
+FINISHED_RESERVATION_STATUSES = ('reserved', 'failed')
+FINISHED_SCHEDULE_STATUSES = ('completed', 'failed', 'cancelled')
+FINISHED_NOTIFICATION_STATUSES = ('sent', 'failed')
+
+# 보관 파일에 남기지 않는 컬럼 (비밀 값)
+ARCHIVE_EXCLUDED_COLUMNS = {
+    'notification_outbox': ('bot_token',),
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _Archive:
+    """삭제하는 행을 gzip JSONL 파일로 보관 (첫 기록 시 파일 생성)"""
+
+    def __init__(self, directory: Path, table: str, stamp: str):
+        self.path = directory / table / f"{table}_{stamp}.jsonl.gz"
+        self._file = None
+        self.rows = 0
+
+    def write(self, rows: List[Dict]):
+        if not rows:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, 'at', encoding='utf-8')
+        self._file.write(''.join(
+            json.dumps(dict(row), ensure_ascii=False, default=_json_default) + '\n' for row in rows
+        ))
+        self._file.flush()
+        self.rows += len(rows)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class MaintenanceService:
+    """DB 유지보수 서비스"""
+
+    def __init__(self):
+        self._run_lock = threading.Lock()
+        self.last_run: Optional[Dict] = None
+
+        self.enabled = True
+        self.hour = 4
+        self.window_minutes = 120
+        self.batch_size = 1000
+        self.archive_dir = BACKEND_DIR / 'data' / 'archive'
+        self.vacuum_max_pages = 0  # 0이면 빈 페이지 전부
+        self.retention_days = dict(DEFAULT_RETENTION_DAYS)
+
+    def init_app(self, app):
+        """MAINTENANCE_* / RETENTION_*_DAYS 설정 적용 (스크립트 실행 시에도 사용)"""
+        self.enabled = app.config['MAINTENANCE_ENABLED']
+        self.hour = app.config['MAINTENANCE_HOUR']
+        self.window_minutes = app.config['MAINTENANCE_WINDOW_MINUTES']
+        self.batch_size = app.config['MAINTENANCE_BATCH_SIZE']
+        self.archive_dir = Path(app.config['MAINTENANCE_ARCHIVE_DIR'])
+        self.vacuum_max_pages = app.config['MAINTENANCE_VACUUM_MAX_PAGES']
+        self.retention_days = {
+            name: app.config.get(f'RETENTION_{name.upper()}_DAYS', default)
+            for name, default in DEFAULT_RETENTION_DAYS.items()
+        }
+
+    # ----- 스케줄 -----
+
+    def start(self, app):
+        """매일 MAINTENANCE_HOUR 시에 실행되도록 공용 스케줄러에 등록"""
+        from app.services.scheduler_service import scheduler_service
+
+        if not self.enabled:
+            return
+
+        scheduler_service.add_daily_job(
+            app, 'maintenance_job', self.run,
+            hour=self.hour,
+            misfire_grace_time=self.window_minutes * 60
+        )
+        logger.info(f"Maintenance job scheduled daily at {self.hour:02d}:00 (window {self.window_minutes}m)")
+
+    def in_window(self, now: datetime = None) -> bool:
+        """한가한 시간대 안인지 (MAINTENANCE_HOUR 부터 MAINTENANCE_WINDOW_MINUTES 동안)"""
+        now = now or datetime.now()
+        start = now.replace(hour=self.hour, minute=0, second=0, microsecond=0)
+        if start > now:
+            start -= timedelta(days=1)
+        return now < start + timedelta(minutes=self.window_minutes)
+
+    # ----- 실행 -----
+
+    def run(self, dry_run: bool = False, vacuum: bool = True, force_vacuum: bool = False) -> Dict:
+        """유지보수 전체 실행 (앱 컨텍스트 안에서 호출)
+
+        Args:
+            dry_run: True면 정리 대상 행 수만 집계
+            vacuum: 정리 후 증분 VACUUM 실행 여부
+            force_vacuum: 시간대와 관계없이 VACUUM 실행
+
+        Returns:
+            Dict: 단계별 결과
+        """
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError('Maintenance is already running')
+
+        try:
+            started = time.perf_counter()
+            self._dry_run = dry_run
+            self._stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            logger.info(f"🧹 Maintenance started (dry_run={dry_run})")
+
+            steps = [
+                ('availability_history', self._downsample_availability_history),
+                ('availability_daily', self._purge_availability_daily),
+                ('schedule_results', self._strip_schedule_results),
+                ('schedules', self._purge_schedules),
+                ('reservations', self._purge_reservations),
+                ('past_targets', self._purge_past_targets),
+                ('notifications', self._purge_notifications),
+            ]
+            result = {'started_at': datetime.now().isoformat(timespec='seconds'), 'dry_run': dry_run, 'steps': {}}
+            for name, step in steps:
+                days = self.retention_days[name]
+                if days <= 0:
+                    result['steps'][name] = {'skipped': 'no retention'}
+                    continue
+                result['steps'][name] = self._run_step(name, step, days)
+
+            if vacuum and not dry_run:
+                result['steps']['vacuum'] = self._run_step('vacuum', lambda _: self.vacuum(force=force_vacuum), None)
+
+            result['duration_seconds'] = round(time.perf_counter() - started, 2)
+            self.last_run = result
+            logger.info(f"🧹 Maintenance finished in {result['duration_seconds']}s: {result['steps']}")
+            return result
+        finally:
+            self._run_lock.release()
+
+    def _run_step(self, name: str, step, days: Optional[int]) -> Dict:
+        started = time.perf_counter()
+        try:
+            outcome = step(days)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Maintenance step '{name}' failed: {e}", exc_info=True)
+            outcome = {'error': str(e)}
+        elapsed = time.perf_counter() - started
+        MAINTENANCE_STEP_SECONDS.observe(elapsed, step=name)
+        outcome['seconds'] = round(elapsed, 2)
+        return outcome
+
+    def _cutoff(self, days: int) -> datetime:
+        return datetime.utcnow() - timedelta(days=days)
+
+    def _purge(self, table: str, model, conditions: list) -> Dict:
+        """조건에 맞는 행을 보관 후 배치 삭제"""
+        if self._dry_run:
+            return {'would_delete': db.session.scalar(select(func.count(model.id)).where(*conditions))}
+
+        excluded = ARCHIVE_EXCLUDED_COLUMNS.get(table, ())
+        columns = [column for column in model.__table__.columns if column.name not in excluded]
+        archive = _Archive(self.archive_dir, table, self._stamp)
+        deleted = 0
+        last_id = 0
+        try:
+            while True:
+                rows = db.session.execute(
+                    select(*columns)
+                    .where(model.id > last_id, *conditions)
+                    .order_by(model.id)
+                    .limit(self.batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+
+                ids = [row['id'] for row in rows]
+                archive.write(rows)
+                db.session.execute(delete(model).where(model.id.in_(ids)))
+                db.session.commit()
+
+                deleted += len(ids)
+                last_id = ids[-1]
+        finally:
+            archive.close()
+
+        if deleted:
+            MAINTENANCE_ROWS.inc(deleted, table=table, action='delete')
+            logger.info(f"Deleted {deleted} rows from {table} (archive: {archive.path})")
+        return {'deleted': deleted, 'archive': str(archive.path) if archive.rows else None}
+
+    # ----- 단계별 정리 -----
+
+    def _downsample_availability_history(self, days: int) -> Dict:
+        """보존 기간이 지난 상태 변경 이력을 하루 단위로 일별 집계 후 삭제"""
+        cutoff = self._cutoff(days)
+        condition = AvailabilityHistory.checked_at < cutoff
+        if self._dry_run:
+            return {'would_downsample': db.session.scalar(select(func.count(AvailabilityHistory.id)).where(condition))}
+
+        archive = _Archive(self.archive_dir, 'availability_history', self._stamp)
+        downsampled = 0
+        summaries = 0
+        try:
+            while True:
+                oldest = db.session.scalar(select(func.min(AvailabilityHistory.checked_at)).where(condition))
+                if oldest is None:
+                    break
+
+                day = oldest.date()
+                day_start = datetime.combine(day, datetime.min.time())
+                day_end = min(day_start + timedelta(days=1), cutoff)
+
+                rows = db.session.execute(
+                    select(*AvailabilityHistory.__table__.columns)
+                    .where(AvailabilityHistory.checked_at >= day_start, AvailabilityHistory.checked_at < day_end)
+                    .order_by(AvailabilityHistory.checked_at, AvailabilityHistory.id)
+                ).mappings().all()
+
+                summaries += self._merge_daily_summaries(day, rows)
+                archive.write(rows)
+                db.session.execute(delete(AvailabilityHistory).where(
+                    AvailabilityHistory.checked_at >= day_start, AvailabilityHistory.checked_at < day_end
+                ))
+                db.session.commit()
+                downsampled += len(rows)
+        finally:
+            archive.close()
+
+        if downsampled:
+            MAINTENANCE_ROWS.inc(downsampled, table='availability_history', action='downsample')
+            logger.info(f"Downsampled {downsampled} availability history rows into {summaries} daily summaries")
+        return {
+            'downsampled': downsampled,
+            'daily_summaries': summaries,
+            'archive': str(archive.path) if archive.rows else None
+        }
+
+    def _merge_daily_summaries(self, day: date, rows) -> int:
+        """하루치 이력 행을 (캠핑장, 날짜) 별로 집계해 일별 집계에 합침"""
+        groups: Dict = {}
+        for row in rows:
+            key = (row['camping_site_id'], row['target_date'])
+            group = groups.setdefault(key, {
+                'changes': 0, 'available_count': 0, 'unavailable_count': 0,
+                'first_checked_at': row['checked_at'], 'last_checked_at': row['checked_at'], 'last_status': None
+            })
+            group['changes'] += 1
+            if row['status'] == 'available':
+                group['available_count'] += 1
+            else:
+                group['unavailable_count'] += 1
+            group['last_checked_at'] = row['checked_at']
+            group['last_status'] = row['status']
+
+        if not groups:
+            return 0
+
+        existing = {
+            (summary.camping_site_id, summary.target_date): summary
+            for summary in AvailabilityDailySummary.query.filter(
+                AvailabilityDailySummary.day == day,
+                AvailabilityDailySummary.camping_site_id.in_({key[0] for key in groups})
+            )
+        }
+        for (site_id, target_date), group in groups.items():
+            summary = existing.get((site_id, target_date))
+            if summary is None:
+                db.session.add(AvailabilityDailySummary(camping_site_id=site_id, target_date=target_date, day=day, **group))
+                continue
+            summary.changes += group['changes']
+            summary.available_count += group['available_count']
+            summary.unavailable_count += group['unavailable_count']
+            summary.first_checked_at = min(filter(None, (summary.first_checked_at, group['first_checked_at'])))
+            if not summary.last_checked_at or group['last_checked_at'] >= summary.last_checked_at:
+                summary.last_checked_at = group['last_checked_at']
+                summary.last_status = group['last_status']
+        return len(groups)
+
+    def _purge_availability_daily(self, days: int) -> Dict:
+        return self._purge('availability_daily_summaries', AvailabilityDailySummary, [
+            AvailabilityDailySummary.day < self._cutoff(days).date()
+        ])
+
+    def _strip_schedule_results(self, days: int) -> Dict:
+        """오래된 스케줄의 전체 실행 결과를 보관 후 비움 (요약 컬럼은 유지)"""
+        conditions = [
+            ReservationSchedule.status.in_(FINISHED_SCHEDULE_STATUSES),
+            ReservationSchedule.execute_at < self._cutoff(days),
+            ReservationSchedule.result.isnot(None),
+        ]
+        if self._dry_run:
+            return {'would_strip': db.session.scalar(select(func.count(ReservationSchedule.id)).where(*conditions))}
+
+        archive = _Archive(self.archive_dir, 'reservation_schedule_results', self._stamp)
+        stripped = 0
+        last_id = 0
+        try:
+            while True:
+                rows = db.session.execute(
+                    select(ReservationSchedule.id, ReservationSchedule.execute_at, ReservationSchedule.result)
+                    .where(ReservationSchedule.id > last_id, *conditions)
+                    .order_by(ReservationSchedule.id)
+                    .limit(self.batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+
+                ids = [row['id'] for row in rows]
+                archive.write(rows)
+                # JSON null 이 아닌 SQL NULL 로 비워야 다음 실행에서 다시 선택되지 않음
+                db.session.execute(
+                    update(ReservationSchedule).where(ReservationSchedule.id.in_(ids)).values(result=null())
+                )
+                db.session.commit()
+
+                stripped += len(ids)
+                last_id = ids[-1]
+        finally:
+            archive.close()
+
+        if stripped:
+            MAINTENANCE_ROWS.inc(stripped, table='reservation_schedules', action='strip')
+        return {'stripped': stripped, 'archive': str(archive.path) if archive.rows else None}
+
+    def _purge_schedules(self, days: int) -> Dict:
+        return self._purge('reservation_schedules', ReservationSchedule, [
+            ReservationSchedule.status.in_(FINISHED_SCHEDULE_STATUSES),
+            ReservationSchedule.execute_at < self._cutoff(days),
+        ])
+
+    def _purge_reservations(self, days: int) -> Dict:
+        return self._purge('reservations', Reservation, [
+            Reservation.status.in_(FINISHED_RESERVATION_STATUSES),
+            Reservation.updated_at < self._cutoff(days),
+        ])
+
+    def _purge_past_targets(self, days: int) -> Dict:
+        """날짜가 지난 모니터링 타겟 / 기간 타겟 / 월별 캘린더 뷰 정리"""
+        cutoff = self._cutoff(days).date()
+        result = {
+            'monitoring_targets': self._purge('monitoring_targets', MonitoringTarget, [
+                MonitoringTarget.target_date < cutoff
+            ]),
+            'monitoring_range_targets': self._purge('monitoring_range_targets', MonitoringRangeTarget, [
+                MonitoringRangeTarget.end_date < cutoff
+            ]),
+            'availability_month_views': self._purge('availability_month_views', AvailabilityMonthView, [
+                AvailabilityMonthView.year * 12 + AvailabilityMonthView.month < cutoff.year * 12 + cutoff.month
+            ]),
+        }
+
+        if not self._dry_run:
+            # bulk 삭제는 매퍼 이벤트를 거치지 않으므로 메모리 인덱스/캐시를 다시 로드
+            if result['monitoring_targets']['deleted'] or result['monitoring_range_targets']['deleted']:
+                from app.services.target_index import target_index
+                target_index.invalidate()
+            if result['availability_month_views']['deleted']:
+                from app.services.availability_calendar import calendar_views
+                calendar_views.invalidate()
+        return result
+
+    def _purge_notifications(self, days: int) -> Dict:
+        return self._purge('notification_outbox', NotificationOutbox, [
+            NotificationOutbox.status.in_(FINISHED_NOTIFICATION_STATUSES),
+            NotificationOutbox.created_at < self._cutoff(days),
+        ])
+
+    # ----- VACUUM -----
+
+    def vacuum(self, force: bool = False) -> Dict:
+        """SQLite 증분 VACUUM (빈 페이지를 파일에서 반환)
+
+        Args:
+            force: True면 유지보수 시간대 밖에서도 실행
+        """
+        if db.engine.dialect.name != 'sqlite' or db.engine.url.database in (None, '', ':memory:'):
+            return {'skipped': 'not a sqlite file database'}
+        if not force and not self.in_window():
+            return {'skipped': 'outside maintenance window'}
+
+        db.session.remove()
+        with db.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level='AUTOCOMMIT')
+            page_size = conn.exec_driver_sql('PRAGMA page_size').scalar()
+            converted = False
+
+            if conn.exec_driver_sql('PRAGMA auto_vacuum').scalar() != 2:
+                # auto_vacuum 모드 변경은 전체 VACUUM 후에 적용됨 (최초 1회)
+                logger.warning("Converting database to auto_vacuum=INCREMENTAL (one-time full VACUUM)")
+                conn.exec_driver_sql('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.exec_driver_sql('VACUUM')
+                converted = True
+
+            free_before = conn.exec_driver_sql('PRAGMA freelist_count').scalar()
+            pages = min(free_before, self.vacuum_max_pages) if self.vacuum_max_pages else free_before
+            if pages:
+                # sqlite3 의 execute 는 한 단계(1페이지)만 실행하므로 executescript 로 끝까지 실행
+                conn.connection.dbapi_connection.executescript(f'PRAGMA incremental_vacuum({int(pages)});')
+            free_after = conn.exec_driver_sql('PRAGMA freelist_count').scalar()
+            conn.exec_driver_sql('PRAGMA optimize')
+
+        released = free_before - free_after
+        logger.info(f"Incremental vacuum released {released} pages ({released * page_size / 1024 / 1024:.1f} MB)")
+        return {
+            'converted_to_incremental': converted,
+            'released_pages': released,
+            'released_mb': round(released * page_size / 1024 / 1024, 2),
+            'free_pages': free_after
+        }
+
+    def get_status(self) -> Dict:
+        from app.services.scheduler_service import scheduler_service
+
+        return {
+            'enabled': self.enabled,
+            'window': {'hour': self.hour, 'minutes': self.window_minutes},
+            'retention_days': self.retention_days,
+            'archive_dir': str(self.archive_dir),
+            'next_run': scheduler_service.get_next_run('maintenance_job'),
+            'running': self._run_lock.locked(),
+            'last_run': self.last_run
+        }
+
+
+# 전역 인스턴스
+maintenance_service = MaintenanceService()
@@ -1,15 +1,69 @@
 """모니터링 서비스"""
-import os
-from datetime import datetime
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
 from apscheduler.schedulers.background import BackgroundScheduler
+from flask import current_app, has_app_context
 from loguru import logger
 
 from app import db
-from app.models.database import MonitoringTarget, Reservation, AppSettings
+from app.models.database import AvailabilityHistory, CampingSite, MonitoringRangeTarget, MonitoringTarget, Reservation
 from app.scrapers.gocamp_scraper import GoCampScraper
 from app.scrapers.naver_scraper import NaverScraper
+from app.scrapers.xticket_pool import xticket_pool
 from app.scrapers.xticket_scraper import XTicketScraper
-from app.notifications.telegram_notifier import TelegramNotifier
+from app.notifications.telegram_notifier import get_notifier
+from app.notifications.notification_digest import AvailabilityDigest
+from app.services.availability_calendar import calendar_views
+from app.services.target_index import target_index
+from app.utils import deadline
+from app.utils.bulkhead import upstream_bulkhead
+from app.utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from app.utils.metrics import MONITOR_TICK_SECONDS, MONITOR_TICK_TARGETS, instrument_scheduler
+from app.utils.tracing import trace
+
+# 일괄 등록 시 요청당 최대 타겟 수
+MAX_BULK_TARGETS = 5000
+
+# 틱에서 ID 목록으로 타겟을 로드할 때 한 번에 조회할 개수
+LOAD_CHUNK_SIZE = 500
+
+
+def expand_target_dates(ranges: Iterable[Dict], weekdays: Optional[Iterable[int]] = None) -> List[date]:
+    """날짜 범위를 개별 날짜 목록으로 변환
+
+    Args:
+        ranges: [{'start': 'YYYY-MM-DD', 'end': 'YYYY-MM-DD'}, ...] (end 포함)
+        weekdays: 포함할 요일 (0=월 ... 6=일, None이면 전체)
+
+    Returns:
+        List[date]: 중복 제거 후 정렬된 날짜 목록
+
+    Raises:
+        ValueError: 날짜 형식 오류 또는 start > end
+    """
+    allowed = set(weekdays) if weekdays is not None else None
+    if allowed is not None and not allowed <= set(range(7)):
+        raise ValueError("weekdays must be between 0 (Mon) and 6 (Sun)")
+
+    dates = set()
+    for item in ranges:
+        start = datetime.strptime(item['start'], '%Y-%m-%d').date()
+        end = datetime.strptime(item.get('end') or item['start'], '%Y-%m-%d').date()
+        if start > end:
+            raise ValueError(f"Invalid range: {item['start']} > {item['end']}")
+
+        current = start
+        while current <= end:
+            if allowed is None or current.weekday() in allowed:
+                dates.add(current)
+            current += timedelta(days=1)
+
+            if len(dates) > MAX_BULK_TARGETS:
+                raise ValueError(f"Too many dates (max {MAX_BULK_TARGETS})")
+
+    return sorted(dates)
 
 
 class MonitorService:
@@ -17,55 +71,46 @@ class MonitorService:
 
     def __init__(self):
         self.scheduler = BackgroundScheduler()
+        instrument_scheduler(self.scheduler)
         self.is_running = False
         self.scrapers = {
             'gocamp': GoCampScraper(),
-            'naver': NaverScraper(),
-            'xticket': self._create_xticket_scraper()
+            'naver': NaverScraper()
         }
-        self.notifier = self._create_notifier()
+        # 다이제스트 설정은 start() 시 app.config 값으로 갱신
+        self.digest = AvailabilityDigest()
+        self._app = None
+        # 틱 하나의 외부 호출 전체 예산 (start() 시 MONITOR_TICK_DEADLINE_SECONDS 로 갱신)
+        self.tick_deadline_seconds = 50.0
+
+    @property
+    def notifier(self):
+        """텔레그램 알림 (공유 인스턴스, 설정 변경 시 자동 갱신)"""
+        return get_notifier()
+
+    def _get_scraper(self, camping_site):
+        """캠핑장 유형별 스크래퍼 (XTicket은 캠핑장별 풀 클라이언트)"""
+        if camping_site.site_type == 'xticket':
+            return xticket_pool.get_for_site(camping_site)
+        return self.scrapers.get(camping_site.site_type)
+
+    def start(self, app=None):
+        """모니터링 시작
 
-    def _create_notifier(self):
-        """텔레그램 알림 생성 - DB 설정 우선 사용"""
-        try:
-            settings = AppSettings.query.first()
-            if settings and settings.telegram_bot_token and settings.telegram_chat_id:
-                logger.info("Using Telegram settings from database")
-                return TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
-        except Exception as e:
-            logger.warning(f"Failed to load Telegram settings from DB: {e}")
-
-        logger.info("Using Telegram settings from environment")
-        return TelegramNotifier()  # 환경 변수 fallback
-
-    def _create_xticket_scraper(self):
-        """XTicket 스크래퍼 생성 (환경변수 기반)"""
-        shop_encode = os.getenv('XTICKET_SHOP_ENCODE')
-        shop_code = os.getenv('XTICKET_SHOP_CODE')
-
-        if not shop_encode or not shop_code:
-            logger.warning("XTicket credentials not configured")
-            return None
-
-        # 환경변수에서 재시도 설정 가져오기
-        max_retries = int(os.getenv('MAX_RETRIES', 3))
-        timeout = int(os.getenv('REQUEST_TIMEOUT', 30))
-
-        return XTicketScraper(
-            shop_encode=shop_encode,
-            shop_code=shop_code,
-            max_retries=max_retries,
-            timeout=timeout
-        )
-
-    def start(self):
-        """모니터링 시작"""
+        Args:
+            app: Flask 앱 (None이면 현재 앱 컨텍스트의 앱)
+        """
         if self.is_running:
             logger.warning("Monitoring is already running")
             return
 
         logger.info("Starting monitoring service")
 
+        self._app = app or current_app._get_current_object()
+        self.digest.window_seconds = self._app.config.get('NOTIFICATION_DIGEST_WINDOW', 0)
+        self.digest.group_by_site = self._app.config.get('NOTIFICATION_DIGEST_GROUP_BY_SITE', True)
+        self.tick_deadline_seconds = self._app.config.get('MONITOR_TICK_DEADLINE_SECONDS', self.tick_deadline_seconds)
+
         # 스케줄러에 작업 추가 (60초마다 실행)
         self.scheduler.add_job(
             self.check_all_targets,
@@ -90,51 +135,274 @@ class MonitorService:
         logger.info("Monitoring service stopped")
 
     def check_all_targets(self):
-        """모든 모니터링 타겟 확인"""
+        """모든 모니터링 타겟 확인 (틱 전체를 하나의 trace로 기록)"""
+        if not has_app_context() and self._app is not None:
+            # 스케줄러 스레드에서 호출된 경우
+            with self._app.app_context():
+                return self.check_all_targets()
+
+        with trace('monitor.tick'), deadline.deadline(self.tick_deadline_seconds):
+            self._check_all_targets()
+
+    def _check_all_targets(self):
+        """활성 타겟 순회 및 다이제스트 전송"""
         logger.info("Checking all monitoring targets")
+        tick_start = time.perf_counter()
 
-        targets = MonitoringTarget.query.filter_by(is_active=True).all()
+        # 활성 타겟 인덱스에서 (캠핑장, 연, 월) 단위 조회 계획 생성 (DB 전체 조회 없음)
+        target_index.ensure_fresh()
+        plan = target_index.fetch_plan(since=date.today())
 
-        for target in targets:
+        target_ids = sorted({target_id for group in plan.values() for target_id in group['targets']})
+        range_target_ids = sorted({target_id for group in plan.values() for target_id in group['range_targets']})
+        targets = self._load_by_ids(MonitoringTarget, target_ids)
+        range_targets = self._load_by_ids(MonitoringRangeTarget, range_target_ids)
+        MONITOR_TICK_TARGETS.observe(len(targets) + len(range_targets))
+
+        # (캠핑장, 연, 월)별 캘린더 - 이번 틱에서 월마다 한 번만 조회
+        calendars: Dict[Tuple[int, int, int], Dict[date, int]] = {}
+
+        try:
+            self._check_targets(plan, targets, range_targets, range_target_ids, calendars)
+        finally:
+            # 이번 틱(또는 다이제스트 윈도우)에서 모인 알림을 채팅별로 묶어 아웃박스에 적재하고
+            # 같은 트랜잭션에서 '알림 보냄' 표시 (틱 도중 예외가 나도 모인 알림은 적재)
+            self.flush_digest()
+
+        MONITOR_TICK_SECONDS.observe(time.perf_counter() - tick_start)
+
+    def _check_targets(self, plan: Dict, targets: Dict, range_targets: Dict, range_target_ids: List[int],
+                       calendars: Dict):
+        """계획 순서대로 단일 타겟 / 기간 타겟 확인 후 캘린더 뷰 갱신"""
+        # 업스트림 장애(회로 open) 또는 틱 예산 초과로 건너뛴 타겟 수와 마지막 사유
+        skipped = 0
+        skip_reason = None
+
+        # 계획 순서(캠핑장 -> 월)대로 단일 타겟 확인
+        for group in plan.values():
+            for target_id in group['targets']:
+                target = targets.get(target_id)
+                if target is None or not target.is_active:
+                    continue
+                try:
+                    self.check_target(target, calendars)
+                except (CircuitOpenError, deadline.DeadlineExceeded) as e:
+                    db.session.rollback()
+                    skipped += 1
+                    skip_reason = e
+                except Exception as e:
+                    db.session.rollback()
+                    logger.error(f"Error checking target {target_id}: {e}")
+
+        # 기간 타겟은 여러 달에 걸치므로 마지막에 한 번씩 (캘린더는 이미 캐시됨)
+        for range_target_id in range_target_ids:
+            range_target = range_targets.get(range_target_id)
+            if range_target is None or not range_target.is_active:
+                continue
             try:
-                self.check_target(target)
+                self.check_range_target(range_target, calendars)
+            except (CircuitOpenError, deadline.DeadlineExceeded) as e:
+                db.session.rollback()
+                skipped += 1
+                skip_reason = e
             except Exception as e:
-                logger.error(f"Error checking target {target.id}: {e}")
+                db.session.rollback()
+                logger.error(f"Error checking range target {range_target_id}: {e}")
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} targets this tick: {skip_reason}")
+
+        # 이번 틱에서 조회한 월 캘린더로 캘린더 뷰 갱신 (대시보드는 업스트림 호출 없이 뷰로 응답)
+        try:
+            calendar_views.refresh(calendars)
+        except Exception as e:
+            logger.error(f"Error refreshing availability month views: {e}")
+
+    def flush_digest(self, force: bool = False) -> int:
+        """다이제스트를 아웃박스에 적재하고 대상 타겟을 '알림 보냄'으로 표시 (한 트랜잭션)
+
+        실패하면 롤백되어 표시가 남지 않으므로 다음 틱에서 다시 감지해 알립니다.
+
+        Returns:
+            int: 적재한 메시지 수
+        """
+        try:
+            sent = self.digest.flush(force=force, on_flushed=self._mark_notified)
+            db.session.commit()
+            return sent
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error flushing availability digest: {e}")
+            return 0
+
+    @staticmethod
+    def _mark_notified(refs: List[Tuple]):
+        """다이제스트 ref 로 알림 보냄 표시 (('target', id) / ('range', id, date))"""
+        target_ids = [ref[1] for ref in refs if ref[0] == 'target']
+        if target_ids:
+            MonitoringTarget.query.filter(MonitoringTarget.id.in_(target_ids)).update(
+                {'notification_sent': True},
+                synchronize_session=False
+            )
+
+        range_dates: Dict[int, List[date]] = {}
+        for ref in refs:
+            if ref[0] == 'range':
+                range_dates.setdefault(ref[1], []).append(ref[2])
+        if range_dates:
+            for range_target in MonitoringRangeTarget.query.filter(MonitoringRangeTarget.id.in_(range_dates)):
+                range_target.mark_notified(range_dates[range_target.id])
+
+    @staticmethod
+    def _load_by_ids(model, ids: List[int]) -> Dict:
+        """ID 목록으로 타겟 일괄 로드 ({id: 객체}, SQLite 파라미터 한도 고려해 나눠서 조회)"""
+        loaded = {}
+        for start in range(0, len(ids), LOAD_CHUNK_SIZE):
+            chunk = ids[start:start + LOAD_CHUNK_SIZE]
+            for obj in model.query.filter(model.id.in_(chunk)):
+                loaded[obj.id] = obj
+        return loaded
+
+    def add_targets_bulk(self, site_ids: List[int], dates: List[date]) -> Dict:
+        """여러 캠핑장 x 날짜 조합의 모니터링 타겟 일괄 등록
+
+        이미 활성 상태인 타겟은 건너뛰고, 비활성 타겟은 다시 활성화하며,
+        나머지는 한 번의 bulk insert로 추가합니다 (커밋 1회).
+        bulk insert/update는 ORM 이벤트를 거치지 않으므로 커밋 후 타겟 인덱스를 직접 갱신합니다.
+
+        Returns:
+            Dict: created / reactivated / skipped 개수
 
-    def check_target(self, target: MonitoringTarget):
-        """개별 타겟 확인"""
+        Raises:
+            ValueError: 존재하지 않는 캠핑장 또는 최대 개수 초과
+        """
+        site_ids = sorted(set(site_ids))
+        requested = len(site_ids) * len(dates)
+        if requested > MAX_BULK_TARGETS:
+            raise ValueError(f"Too many targets: {requested} (max {MAX_BULK_TARGETS})")
+        if not requested:
+            return {'requested': 0, 'created': 0, 'reactivated': 0, 'skipped': 0}
+
+        found = {row[0] for row in db.session.query(CampingSite.id).filter(CampingSite.id.in_(site_ids))}
+        missing = set(site_ids) - found
+        if missing:
+            raise ValueError(f"Camping sites not found: {sorted(missing)}")
+
+        # 요청 범위의 기존 타겟 조회 (중복 제거용)
+        existing = {
+            (site_id, target_date): (target_id, is_active)
+            for target_id, site_id, target_date, is_active in db.session.query(
+                MonitoringTarget.id,
+                MonitoringTarget.camping_site_id,
+                MonitoringTarget.target_date,
+                MonitoringTarget.is_active
+            ).filter(
+                MonitoringTarget.camping_site_id.in_(site_ids),
+                MonitoringTarget.target_date.between(dates[0], dates[-1])
+            )
+        }
+
+        now = datetime.utcnow()
+        new_rows = []
+        reactivate_ids = []
+        skipped = 0
+
+        for site_id in site_ids:
+            for target_date in dates:
+                found_target = existing.get((site_id, target_date))
+                if found_target is None:
+                    new_rows.append({
+                        'camping_site_id': site_id,
+                        'target_date': target_date,
+                        'is_active': True,
+                        'notification_sent': False,
+                        'created_at': now
+                    })
+                elif not found_target[1]:
+                    reactivate_ids.append(found_target[0])
+                else:
+                    skipped += 1
+
+        try:
+            if new_rows:
+                db.session.execute(db.insert(MonitoringTarget), new_rows)
+            if reactivate_ids:
+                MonitoringTarget.query.filter(MonitoringTarget.id.in_(reactivate_ids)).update(
+                    {'is_active': True, 'notification_sent': False},
+                    synchronize_session=False
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        target_index.reload_sites(site_ids)
+
+        logger.info(
+            f"Bulk monitoring targets: {len(new_rows)} created, {len(reactivate_ids)} reactivated, "
+            f"{skipped} already active ({len(site_ids)} sites x {len(dates)} dates)"
+        )
+
+        return {
+            'requested': requested,
+            'created': len(new_rows),
+            'reactivated': len(reactivate_ids),
+            'skipped': skipped
+        }
+
+    def check_target(self, target: MonitoringTarget, calendars: Dict = None):
+        """개별 타겟 확인
+
+        Args:
+            target: 모니터링 타겟
+            calendars: 틱 내에서 공유하는 월 캘린더 캐시 (None이면 날짜별 조회)
+        """
         camping_site = target.camping_site
-        scraper = self.scrapers.get(camping_site.site_type)
+        scraper = self._get_scraper(camping_site)
 
         if not scraper:
             logger.error(f"No scraper found for site type: {camping_site.site_type}")
             return
 
+        # 업스트림 장애(회로 open) 또는 틱 예산 초과 시 상태를 바꾸지 않고 건너뜀
+        self._raise_if_upstream_unavailable(scraper)
+
         logger.info(f"Checking target {target.id} for {camping_site.name}")
 
         # 예약 가능 여부 확인
-        is_available = scraper.check_availability(
-            camping_site.url,
-            target.target_date
-        )
+        is_available = self._resolve_availability(scraper, camping_site, target.target_date, calendars)
 
         # 상태 업데이트
         previous_status = target.last_status
         target.last_status = 'available' if is_available else 'unavailable'
         target.last_checked = datetime.utcnow()
 
+        # 상태가 바뀐 경우에만 이력 기록 (내보내기/통계용)
+        if target.last_status != previous_status:
+            db.session.add(AvailabilityHistory(
+                monitoring_target_id=target.id,
+                camping_site_id=camping_site.id,
+                target_date=target.target_date,
+                previous_status=previous_status,
+                status=target.last_status,
+                checked_at=target.last_checked
+            ))
+
+        # 텔레그램 알림 (다이제스트에 모아서 틱 종료 시 전송)
+        # notification_sent 는 flush 에서 아웃박스 적재와 함께 기록되므로,
+        # 적재 전에 중단되면 다음 틱에서 다시 알림 대상이 됨
+        if is_available and not target.notification_sent:
+            self.digest.add(
+                self.notifier,
+                camping_site.name,
+                target.target_date,
+                ref=('target', target.id)
+            )
+
         # 예약 가능으로 변경된 경우
         if is_available and previous_status == 'unavailable':
             logger.info(f"Target {target.id} is now available!")
 
-            # 텔레그램 알림
-            if not target.notification_sent:
-                self.notifier.send_availability_notification(
-                    camping_site.name,
-                    target.target_date
-                )
-                target.notification_sent = True
-
             # 예약 레코드 업데이트
             reservation = Reservation.query.filter_by(
                 camping_site_id=camping_site.id,
@@ -147,6 +415,78 @@ class MonitorService:
 
         db.session.commit()
 
+    def check_range_target(self, range_target: MonitoringRangeTarget, calendars: Dict = None):
+        """기간 타겟 확인 (오늘 이후 날짜만, 월 캘린더 기준으로 일괄 판정)"""
+        camping_site = range_target.camping_site
+        scraper = self._get_scraper(camping_site)
+
+        if not scraper:
+            logger.error(f"No scraper found for site type: {camping_site.site_type}")
+            return
+
+        self._raise_if_upstream_unavailable(scraper)
+
+        logger.info(f"Checking range target {range_target.id} for {camping_site.name}")
+
+        availability = {
+            target_date: self._resolve_availability(scraper, camping_site, target_date, calendars)
+            for target_date in range_target.dates(since=date.today())
+        }
+
+        newly_available = range_target.apply_availability(availability)
+        range_target.last_checked = datetime.utcnow()
+
+        for target_date in newly_available:
+            logger.info(f"Range target {range_target.id}: {target_date} is now available!")
+            self.digest.add(self.notifier, camping_site.name, target_date, ref=('range', range_target.id, target_date))
+
+        db.session.commit()
+
+    def _get_month_calendar(self, scraper: XTicketScraper, camping_site, year: int, month: int,
+                            calendars: Dict) -> Dict[date, int]:
+        """캠핑장 월 캘린더 ({날짜: 잔여 수}) - 틱 내에서 월마다 한 번만 조회"""
+        key = (camping_site.id, year, month)
+        if key not in calendars:
+            calendar = {
+                datetime.strptime(item['date'], '%Y-%m-%d').date(): item['remain_count']
+                for item in scraper.get_available_dates(year, month)
+            }
+            if not calendar:
+                # 조회 실패(빈 목록)가 회로 open/예산 초과 때문이면 '예약 불가'로 판정하지 않도록 중단
+                self._raise_if_upstream_unavailable(scraper)
+            calendars[key] = calendar
+        return calendars[key]
+
+    @staticmethod
+    def _raise_if_upstream_unavailable(scraper):
+        """틱 예산이 끝났으면 DeadlineExceeded, XTicket 서버 회로가 열려 있으면 CircuitOpenError"""
+        deadline.check('target check')
+        if isinstance(scraper, XTicketScraper):
+            circuit_breakers.get(urlparse(scraper.BASE_URL).netloc).raise_if_open()
+
+    def _resolve_availability(self, scraper, camping_site, target_date: date, calendars: Dict = None) -> bool:
+        """예약 가능 여부 판정
+
+        월 캘린더를 제공하는 XTicket은 캘린더 캐시에서 판정하고,
+        그 외 스크래퍼(또는 캐시 미사용 시)는 날짜별로 확인합니다.
+        """
+        if calendars is not None and isinstance(scraper, XTicketScraper):
+            calendar = self._get_month_calendar(scraper, camping_site, target_date.year, target_date.month, calendars)
+            return calendar.get(target_date, 0) > 0
+
+        return self._check_availability(scraper, camping_site, target_date)
+
+    def _check_availability(self, scraper, camping_site, target_date) -> bool:
+        """사이트 유형별 예약 가능 여부 확인
+
+        XTicket 스크래퍼는 캠핑장 URL 대신 생성 시 지정한 shopEncode를 사용하고
+        날짜를 YYYY-MM-DD 문자열로 받습니다.
+        """
+        if isinstance(scraper, XTicketScraper):
+            return scraper.check_availability(target_date.strftime('%Y-%m-%d'))
+
+        return scraper.check_availability(camping_site.url, target_date)
+
     def schedule_at_specific_time(self, hour: int, minute: int, second: int = 0,
                                   job_id: str = None):
         """
@@ -196,23 +536,21 @@ class MonitorService:
         for target in targets:
             try:
                 camping_site = target.camping_site
-                scraper = self.scrapers.get(camping_site.site_type)
+                scraper = self._get_scraper(camping_site)
 
                 if not scraper:
                     logger.error(f"No scraper for site type: {camping_site.site_type}")
                     continue
 
                 # 예약 가능 여부 확인
-                is_available = scraper.check_availability(
-                    camping_site.url,
-                    target.target_date
-                )
+                is_available = self._check_availability(scraper, camping_site, target.target_date)
 
                 if is_available:
                     logger.info(f"Attempting reservation for {camping_site.name}")
                     # 예약 서비스를 통한 예약 실행은 별도 로직 필요
                     # 여기서는 알림만 전송
-                    self.notifier.send_availability_notification(
+                    self.digest.add(
+                        self.notifier,
                         camping_site.name,
                         target.target_date
                     )
@@ -220,6 +558,8 @@ class MonitorService:
             except Exception as e:
                 logger.error(f"Error executing scheduled reservation for target {target.id}: {e}")
 
+        self.flush_digest(force=True)
+
     def remove_scheduled_job(self, job_id: str):
         """스케줄된 작업 제거"""
         try:
@@ -247,6 +587,11 @@ class MonitorService:
         return {
             'is_running': self.is_running,
             'active_targets': MonitoringTarget.query.filter_by(is_active=True).count(),
+            'active_range_targets': MonitoringRangeTarget.query.filter_by(is_active=True).count(),
+            'target_index': target_index.get_status(),
+            'xticket_clients': xticket_pool.get_status(),
+            'circuit_breakers': circuit_breakers.get_status(),
+            'upstream_bulkhead': upstream_bulkhead.get_status(),
             'scheduler_jobs': len(self.scheduler.get_jobs()) if self.is_running else 0,
             'scheduled_jobs': self.list_scheduled_jobs()
         }
@@ -213,8 +213,10 @@ class MultiAccountReservationService:
         start_time = time.time()
 
         try:
-            # 캠핑장 URL에서 shop_encode, shop_code 파싱
-            shop_encode, shop_code = self._parse_camping_site_url(camping_site.url)
+            # 캠핑장에 저장된 shop_encode, shop_code (없으면 URL/환경변수 기본값)
+            shop_encode, shop_code = camping_site.xticket_shop()
+            if not shop_encode or not shop_code:
+                raise ValueError(f"XTicket shop parameters not configured for camping site {camping_site.id}")
 
             # XTicket 스크래퍼 생성
             scraper = XTicketScraper(shop_encode, shop_code)
@@ -268,32 +270,6 @@ class MultiAccountReservationService:
         finally:
             logger.info(f"[{thread_name}] 스레드 종료")
 
-    def _parse_camping_site_url(self, url: str) -> tuple:
-        """
-        캠핑장 URL에서 shop_encode, shop_code 추출
-
-        URL 형식: https://camp.xticket.kr/web/main?shopEncode=xxx
-        """
-        import re
-        from urllib.parse import urlparse, parse_qs
-
-        # URL 파싱
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-
-        shop_encode = query_params.get('shopEncode', [''])[0]
-
-        # shop_code는 기본값 사용 (추후 캠핑장 모델에 추가 권장)
-        shop_code = "622830018001"  # 생림오토캠핑장 기본값
-
-        if not shop_encode:
-            # URL에서 직접 추출 시도
-            match = re.search(r'shopEncode=([^&]+)', url)
-            if match:
-                shop_encode = match.group(1)
-
-        return shop_encode, shop_code
-
     def _wait_until_reservation_time(self, reservation_time: str, server_time_offset: float = 0):
         """
         지정된 예약 시간까지 대기 (서버 시간 오프셋 적용)
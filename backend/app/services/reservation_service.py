@@ -1,14 +1,13 @@
 """예약 서비스"""
-import os
 from datetime import datetime
 from loguru import logger
 
 from app import db
-from app.models.database import CampingSite, Reservation, AppSettings
+from app.models.database import CampingSite, Reservation
 from app.scrapers.gocamp_scraper import GoCampScraper
 from app.scrapers.naver_scraper import NaverScraper
-from app.scrapers.xticket_scraper import XTicketScraper
-from app.notifications.telegram_notifier import TelegramNotifier
+from app.scrapers.xticket_pool import xticket_pool
+from app.notifications.telegram_notifier import get_notifier
 
 
 class ReservationService:
@@ -17,49 +16,25 @@ class ReservationService:
     def __init__(self):
         self.scrapers = {
             'gocamp': GoCampScraper(),
-            'naver': NaverScraper(),
-            'xticket': self._create_xticket_scraper()
+            'naver': NaverScraper()
         }
-        self.notifier = self._create_notifier()
 
-    def _create_notifier(self):
-        """텔레그램 알림 생성 - DB 설정 우선 사용"""
-        try:
-            settings = AppSettings.query.first()
-            if settings and settings.telegram_bot_token and settings.telegram_chat_id:
-                logger.info("Using Telegram settings from database")
-                return TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
-        except Exception as e:
-            logger.warning(f"Failed to load Telegram settings from DB: {e}")
-
-        logger.info("Using Telegram settings from environment")
-        return TelegramNotifier()  # 환경 변수 fallback
-
-    def _create_xticket_scraper(self):
-        """XTicket 스크래퍼 생성 (환경변수 기반)"""
-        shop_encode = os.getenv('XTICKET_SHOP_ENCODE')
-        shop_code = os.getenv('XTICKET_SHOP_CODE')
+    @property
+    def notifier(self):
+        """텔레그램 알림 (공유 인스턴스, 설정 변경 시 자동 갱신)"""
+        return get_notifier()
 
-        if not shop_encode or not shop_code:
-            logger.warning("XTicket credentials not configured")
-            return None
-
-        # 환경변수에서 재시도 설정 가져오기
-        max_retries = int(os.getenv('MAX_RETRIES', 3))
-        timeout = int(os.getenv('REQUEST_TIMEOUT', 30))
-
-        return XTicketScraper(
-            shop_encode=shop_encode,
-            shop_code=shop_code,
-            max_retries=max_retries,
-            timeout=timeout
-        )
+    def _get_scraper(self, camping_site):
+        """캠핑장 유형별 스크래퍼 (XTicket은 캠핑장별 풀 클라이언트)"""
+        if camping_site.site_type == 'xticket':
+            return xticket_pool.get_for_site(camping_site)
+        return self.scrapers.get(camping_site.site_type)
 
     def create_reservation(self, camping_site_id: int, check_in_date: str,
                           check_out_date: str, user_info: dict):
         """예약 생성 및 실행"""
         camping_site = CampingSite.query.get_or_404(camping_site_id)
-        scraper = self.scrapers.get(camping_site.site_type)
+        scraper = self._get_scraper(camping_site)
 
         if not scraper:
             raise ValueError(f"No scraper found for site type: {camping_site.site_type}")
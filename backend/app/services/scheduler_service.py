@@ -5,14 +5,24 @@
 - Pre-fire: RTT 보상 선행 발송
 - Wave Attack: 계정별 시차 발송
 - Burst Retry: ms 단위 즉시 재시도
+
+예약 작업 외에 유지보수/백업/좌석 동기화 같은 매일 도는 작업도 같은 스케줄러에 등록합니다
+(add_daily_job, 앱 시작 시마다 다시 등록하므로 메모리 저장소 사용).
 """
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from datetime import datetime, timedelta
 from loguru import logger
 import os
 
+from app.utils import deadline
+from app.utils.metrics import instrument_scheduler
+
+# APScheduler 작업 저장소 (backend/data/scheduler_jobs.db)
+JOBSTORE_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'scheduler_jobs.db')
+
 
 class SchedulerService:
     """예약 스케줄러 서비스"""
@@ -31,12 +41,11 @@ class SchedulerService:
 
     def _init_scheduler(self):
         """스케줄러 초기화"""
-        # 데이터베이스 경로
-        db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'scheduler_jobs.db')
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        os.makedirs(os.path.dirname(JOBSTORE_DB_PATH), exist_ok=True)
 
         jobstores = {
-            'default': SQLAlchemyJobStore(url=f'sqlite:///{db_path}')
+            'default': SQLAlchemyJobStore(url=f'sqlite:///{JOBSTORE_DB_PATH}'),
+            'memory': MemoryJobStore()  # 앱 시작 시 등록하는 주기 작업
         }
 
         job_defaults = {
@@ -50,6 +59,7 @@ class SchedulerService:
             job_defaults=job_defaults,
             timezone='Asia/Seoul'
         )
+        instrument_scheduler(self._scheduler)
 
         logger.info("Scheduler service initialized")
 
@@ -120,6 +130,40 @@ class SchedulerService:
         logger.info(f"Added reservation job: {job_id}, execute_at: {execute_at}")
         return job_id, warmup_job_id
 
+    def add_daily_job(self, app, job_id: str, func, hour: int, minute: int = 0,
+                      misfire_grace_time: int = 3600):
+        """매일 hour:minute 에 앱 컨텍스트 안에서 func 실행
+
+        Args:
+            app: Flask 앱
+            job_id: APScheduler job ID
+            func: 인자 없는 실행 함수 (bound method 가능)
+            hour, minute: 실행 시각 (스케줄러 시간대 기준)
+            misfire_grace_time: 이 시간(초) 안에 밀린 실행은 그대로 실행
+        """
+        self._scheduler.add_job(
+            func=run_app_job,
+            trigger='cron',
+            hour=hour,
+            minute=minute,
+            args=[app, job_id, func],
+            id=job_id,
+            jobstore='memory',
+            misfire_grace_time=misfire_grace_time,
+            coalesce=True,
+            replace_existing=True
+        )
+        logger.info(f"Added daily job: {job_id} at {hour:02d}:{minute:02d}")
+
+    def get_next_run(self, job_id: str):
+        """다음 실행 시각 (ISO 문자열, 작업이 없거나 스케줄러가 멈춰 있으면 None)"""
+        if not self._scheduler.running:
+            return None
+        job = self._scheduler.get_job(job_id)
+        if job and job.next_run_time:
+            return job.next_run_time.isoformat()
+        return None
+
     def remove_job(self, job_id: str):
         """작업 제거"""
         try:
@@ -147,6 +191,32 @@ class SchedulerService:
         logger.info(f"Resumed job: {job_id}")
 
 
+def run_app_job(app, job_id: str, func):
+    """주기 작업 실행 (APScheduler에서 호출) - 실패는 기록만 하고 다음 실행을 기다림"""
+    from app import db
+
+    with app.app_context():
+        try:
+            func()
+        except Exception as e:
+            logger.error(f"Scheduled job {job_id} failed: {e}", exc_info=True)
+        finally:
+            db.session.remove()
+
+
+def _reservation_job_budget(schedule_id: int) -> float:
+    """예약 작업 시간 예산 (초) - 예약 시각까지 기다리는 시간은 예산에서 제외 (앱 컨텍스트 필요)"""
+    from flask import current_app
+    from app.models.database import ReservationSchedule
+
+    job_deadline = current_app.config['JOB_DEADLINE_SECONDS']
+    schedule = ReservationSchedule.query.get(schedule_id)
+    if not schedule or not schedule.execute_at:
+        return job_deadline
+    wait_seconds = (schedule.execute_at - datetime.now()).total_seconds()
+    return max(wait_seconds, 0) + job_deadline
+
+
 def execute_session_warmup(schedule_id: int):
     """세션 워밍업 실행 (APScheduler에서 호출)
 
@@ -159,7 +229,7 @@ def execute_session_warmup(schedule_id: int):
 
     app = create_app()
 
-    with app.app_context():
+    with app.app_context(), deadline.deadline(app.config['JOB_DEADLINE_SECONDS']):
         logger.info(f"========== Session Warmup #{schedule_id} ==========")
 
         # 스케줄 조회
@@ -222,13 +292,14 @@ def execute_scheduled_reservation(schedule_id: int):
         schedule_id: ReservationSchedule ID
     """
     from app import create_app, db
-    from app.models.database import ReservationSchedule, CampingSite, CampingSiteAccount, CampingSiteSeat, AppSettings
+    from app.models.database import ReservationSchedule, CampingSite, CampingSiteAccount, CampingSiteSeat
     from app.services.multi_account_reservation_service import MultiAccountReservationService
-    from app.notifications.telegram_notifier import TelegramNotifier
+    from app.notifications.telegram_notifier import get_notifier
 
     app = create_app()
 
-    with app.app_context():
+    # 앱 컨텍스트 진입 후 예산 계산 (예약 시각까지 대기 + JOB_DEADLINE_SECONDS)
+    with app.app_context(), deadline.deadline(_reservation_job_budget(schedule_id)):
         logger.info(f"========== Executing scheduled reservation #{schedule_id} ==========")
 
         # 스케줄 조회
@@ -314,16 +385,10 @@ def execute_scheduled_reservation(schedule_id: int):
             )
 
             # 결과 저장
-            schedule.result = result
+            schedule.set_result(result)
 
-            # 텔레그램 알림 초기화 - DB 설정 우선 사용
-            settings = AppSettings.query.first()
-            if settings and settings.telegram_bot_token and settings.telegram_chat_id:
-                notifier = TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
-                logger.info(f"Using Telegram settings from database")
-            else:
-                notifier = TelegramNotifier()  # 환경 변수 fallback
-                logger.info(f"Using Telegram settings from environment")
+            # 텔레그램 알림 (공유 인스턴스) - DB 설정 우선 사용
+            notifier = get_notifier()
 
             if result.get('success'):
                 schedule.status = 'completed'
@@ -375,20 +440,16 @@ def execute_scheduled_reservation(schedule_id: int):
         except Exception as e:
             logger.error(f"Error executing schedule #{schedule_id}: {e}", exc_info=True)
             schedule.status = 'failed'
-            schedule.result = {'error': str(e)}
-            db.session.commit()
+            schedule.set_result({'error': str(e)})
 
-            # 예외 발생 시 실패 알림 - DB 설정 우선 사용
-            settings = AppSettings.query.first()
-            if settings and settings.telegram_bot_token and settings.telegram_chat_id:
-                notifier = TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
-            else:
-                notifier = TelegramNotifier()
+            # 예외 발생 시 실패 알림 - DB 설정 우선 사용 (아웃박스 적재는 아래 commit 에 포함)
+            notifier = get_notifier()
             notifier.send_reservation_failure(
                 camping_site=camping_site.name if camping_site else '알 수 없음',
                 date=str(schedule.target_date) if schedule else '알 수 없음',
                 error=str(e)
             )
+            db.session.commit()
 
         finally:
             # 세션 정리
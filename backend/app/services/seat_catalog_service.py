@@ -0,0 +1,318 @@
+"""
+좌석 카탈로그 동기화 서비스
+
+XTicket 상품 그룹(get_product_groups)과 그룹별 개별 사이트(get_available_sites)를 조회해
+camping_site_seats 와 비교(diff)한 뒤, 바뀐 좌석만 일괄 upsert 합니다.
+
+- 캠핑장당 기존 좌석 조회 1회 + upsert 1회 (+ prune 시 삭제 1회)
+  (좌석 수백 개 캠핑장도 ORM 객체를 하나씩 만들지 않고 몇 개의 SQL 로 처리)
+- (camping_site_id, product_code) 유니크 제약 기준으로 INSERT ... ON CONFLICT DO UPDATE
+- 기존 좌석의 display_order 는 바꾸지 않음 (관리자가 정한 순서 유지)
+  새 좌석은 그룹 안의 마지막 순서 다음, 새 그룹이면 <그룹 순번> * 100 + <그룹 내 순번>
+- 상류에서 사라진 좌석은 prune=True 일 때만 삭제 (예약 스케줄이 참조하는 좌석은 유지)
+- 매일 SEAT_SYNC_HOUR 시에 shop 설정이 있는 모든 캠핑장 동기화
+
+사용 예:
+    python scripts/sync_seats.py --site-id 1 --dry-run
+    python scripts/sync_seats.py --all
+"""
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy import delete, func, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app import db
+from app.models.database import CampingSite, CampingSiteSeat, ReservationSchedule
+from app.scrapers.xticket_pool import xticket_pool
+from app.services.scheduler_service import scheduler_service
+
+# 상품 그룹 이름 → seat_category (그 외 그룹은 그룹 이름을 그대로 사용)
+CATEGORY_KEYWORDS = (
+    ('잔디', 'grass'),
+    ('데크', 'deck'),
+    ('파쇄석', 'crushed_stone'),
+)
+
+# 새 그룹의 display_order 구간 크기 (그룹 내 좌석이 더 많으면 1000 단위)
+DISPLAY_ORDER_BLOCK = 100
+
+# upsert 충돌 기준 (uq_camping_site_seats_site_product)
+UPSERT_KEY = {'camping_site_id', 'product_code'}
+
+# 비교(diff) 및 upsert 대상 컬럼 (display_order 는 새 좌석에만 적용)
+SYNC_COLUMNS = ('product_group_code', 'seat_name', 'seat_category', 'price')
+
+
+def seat_category_for(group_name: str) -> str:
+    """상품 그룹 이름으로 좌석 카테고리 결정"""
+    for keyword, category in CATEGORY_KEYWORDS:
+        if keyword in (group_name or ''):
+            return category
+    return (group_name or 'etc')[:50]
+
+
+class SeatCatalogService:
+    """좌석 카탈로그 동기화 서비스"""
+
+    def __init__(self):
+        self._run_lock = threading.Lock()
+        self.last_run: Optional[Dict] = None
+
+        self.enabled = True
+        self.hour = 5
+        self.lookahead_days = 30
+
+    def init_app(self, app):
+        """SEAT_SYNC_* 설정 적용 (스크립트 실행 시에도 사용)"""
+        self.enabled = app.config['SEAT_SYNC_ENABLED']
+        self.hour = app.config['SEAT_SYNC_HOUR']
+        self.lookahead_days = app.config['SEAT_SYNC_LOOKAHEAD_DAYS']
+
+    # ----- 스케줄 -----
+
+    def start(self, app):
+        """매일 SEAT_SYNC_HOUR 시 30분에 실행되도록 공용 스케줄러에 등록"""
+        if not self.enabled:
+            return
+
+        with app.app_context():
+            if not self.has_unique_index():
+                # create_all 은 기존 테이블에 제약을 추가하지 않으므로 기존 DB 는 마이그레이션 필요
+                logger.error(
+                    "Seat catalog sync not scheduled: camping_site_seats has no unique index on "
+                    "(camping_site_id, product_code). Run: python scripts/add_seat_catalog_unique_index.py"
+                )
+                return
+
+        scheduler_service.add_daily_job(app, 'seat_catalog_sync_job', self.sync_all, hour=self.hour, minute=30)
+        logger.info(f"Seat catalog sync scheduled daily at {self.hour:02d}:30")
+
+    def has_unique_index(self) -> bool:
+        """upsert 기준인 (camping_site_id, product_code) 유니크 인덱스가 있는지 (앱 컨텍스트 필요)"""
+        inspector = inspect(db.engine)
+        unique_columns = [idx['column_names'] for idx in inspector.get_indexes('camping_site_seats') if idx['unique']]
+        unique_columns += [uc['column_names'] for uc in inspector.get_unique_constraints('camping_site_seats')]
+        return any(set(columns) == UPSERT_KEY for columns in unique_columns)
+
+    # ----- 조회 -----
+
+    def fetch_catalog(self, camping_site: CampingSite) -> List[Dict]:
+        """XTicket 에서 캠핑장 전체 좌석 목록 조회
+
+        Returns:
+            List[Dict]: 그룹/좌석 순서대로 정렬된 좌석 목록
+                (product_code, product_group_code, seat_name, seat_category, price, group_index, position)
+
+        Raises:
+            ValueError: shop 설정이 없거나 상품 그룹을 조회하지 못한 경우
+        """
+        scraper = xticket_pool.get_for_site(camping_site)
+        if scraper is None:
+            raise ValueError(f"XTicket shop parameters not configured for camping site {camping_site.id}")
+
+        start = date.today()
+        end = start + timedelta(days=self.lookahead_days)
+        groups = scraper.get_product_groups(start.strftime('%Y%m%d'), end.strftime('%Y%m%d'))
+        if not groups:
+            raise ValueError(f"No product groups returned for camping site {camping_site.id}")
+
+        catalog = []
+        for group_index, group in enumerate(groups):
+            group_code = group.get('product_group_code')
+            if not group_code:
+                continue
+            category = seat_category_for(group.get('product_group_name'))
+            products = scraper.get_available_sites(start.isoformat(), group_code, include_unavailable=True)
+            for position, product in enumerate(products, start=1):
+                if not product.get('product_code'):
+                    continue
+                fee = product.get('sale_product_fee') or 0
+                catalog.append({
+                    'product_code': product['product_code'],
+                    'product_group_code': product.get('product_group_code') or group_code,
+                    'seat_name': product.get('product_name') or product['product_code'],
+                    'seat_category': category,
+                    'price': fee if fee > 0 else None,
+                    'group_index': group_index,
+                    'position': position
+                })
+        return catalog
+
+    # ----- 반영 -----
+
+    def apply(self, camping_site_id: int, catalog: Iterable[Dict], dry_run: bool = False,
+              prune: bool = False) -> Dict:
+        """좌석 목록을 camping_site_seats 에 반영 (바뀐 좌석만 일괄 upsert)
+
+        Args:
+            camping_site_id: 캠핑장 ID
+            catalog: 좌석 목록 (fetch_catalog 형식, display_order 가 있으면 새 좌석에 그대로 사용)
+            dry_run: True면 변경 건수만 집계
+            prune: True면 목록에 없는 좌석 삭제 (예약 스케줄이 참조하는 좌석 제외)
+
+        Returns:
+            Dict: created / updated / unchanged / removed / kept_referenced 건수
+        """
+        catalog = list({item['product_code']: item for item in catalog}.values())
+
+        existing = {
+            row.product_code: row
+            for row in db.session.execute(
+                select(
+                    CampingSiteSeat.id, CampingSiteSeat.product_code, CampingSiteSeat.display_order,
+                    *(getattr(CampingSiteSeat, column) for column in SYNC_COLUMNS)
+                ).where(CampingSiteSeat.camping_site_id == camping_site_id)
+            )
+        }
+
+        # 그룹별 현재 마지막 display_order (새 좌석은 그 뒤에 추가)
+        last_order: Dict[str, int] = {}
+        for row in existing.values():
+            order = row.display_order or 0
+            last_order[row.product_group_code] = max(last_order.get(row.product_group_code, order), order)
+        largest_group = max((item.get('position', 0) for item in catalog), default=0)
+        block = DISPLAY_ORDER_BLOCK if largest_group < DISPLAY_ORDER_BLOCK else DISPLAY_ORDER_BLOCK * 10
+
+        now = datetime.utcnow()
+        rows = []
+        created = updated = unchanged = 0
+        for item in catalog:
+            current = existing.get(item['product_code'])
+            values = {column: item.get(column) for column in SYNC_COLUMNS}
+            if current is not None:
+                if values['price'] is None:
+                    values['price'] = current.price  # 매진 등으로 가격이 없으면 기존 가격 유지
+                if all(getattr(current, column) == values[column] for column in SYNC_COLUMNS):
+                    unchanged += 1
+                    continue
+                display_order = current.display_order
+                updated += 1
+            else:
+                display_order = item.get('display_order')
+                if display_order is None:
+                    group_code = values['product_group_code']
+                    if group_code in last_order:
+                        display_order = last_order[group_code] + 1
+                    else:
+                        display_order = item.get('group_index', 0) * block + item.get('position', 0)
+                    last_order[group_code] = display_order
+                created += 1
+
+            rows.append({
+                'camping_site_id': camping_site_id,
+                'product_code': item['product_code'],
+                **values,
+                'display_order': display_order,
+                'created_at': now,
+                'updated_at': now
+            })
+
+        # 목록에 없는 좌석 (prune 대상)
+        catalog_codes = {item['product_code'] for item in catalog}
+        stale = {row.id: code for code, row in existing.items() if code not in catalog_codes}
+        referenced = self._referenced_seat_ids(camping_site_id) & stale.keys() if prune and stale else set()
+        remove_ids = [seat_id for seat_id in stale if seat_id not in referenced]
+
+        result = {
+            'camping_site_id': camping_site_id,
+            'catalog': len(catalog),
+            'created': created,
+            'updated': updated,
+            'unchanged': unchanged,
+            'missing_upstream': len(stale),
+            'removed': len(remove_ids) if prune else 0,
+            'kept_referenced': len(referenced),
+            'dry_run': dry_run
+        }
+        if dry_run or (not rows and not (prune and remove_ids)):
+            return result
+
+        try:
+            if rows:
+                table = CampingSiteSeat.__table__
+                stmt = sqlite_insert(table)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[table.c.camping_site_id, table.c.product_code],
+                    set_={
+                        'product_group_code': stmt.excluded.product_group_code,
+                        'seat_name': stmt.excluded.seat_name,
+                        'seat_category': stmt.excluded.seat_category,
+                        'price': func.coalesce(stmt.excluded.price, table.c.price),
+                        'updated_at': stmt.excluded.updated_at
+                    }
+                )
+                db.session.execute(stmt, rows)
+            if prune and remove_ids:
+                db.session.execute(delete(CampingSiteSeat).where(CampingSiteSeat.id.in_(remove_ids)))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(
+            f"Seat catalog for camping site {camping_site_id}: {created} created, {updated} updated, "
+            f"{unchanged} unchanged, {result['removed']} removed"
+        )
+        return result
+
+    def _referenced_seat_ids(self, camping_site_id: int) -> set:
+        """예약 스케줄이 참조하는 좌석 ID"""
+        seat_ids = set()
+        for seat_id, seat_id_list in db.session.execute(
+            select(ReservationSchedule.seat_id, ReservationSchedule.seat_ids)
+            .where(ReservationSchedule.camping_site_id == camping_site_id)
+        ):
+            if seat_id:
+                seat_ids.add(seat_id)
+            seat_ids.update(seat_id_list or [])
+        return seat_ids
+
+    # ----- 동기화 -----
+
+    def sync_site(self, camping_site: CampingSite, dry_run: bool = False, prune: bool = False) -> Dict:
+        """캠핑장 하나의 좌석 카탈로그 동기화"""
+        started = time.perf_counter()
+        catalog = self.fetch_catalog(camping_site)
+        fetched = time.perf_counter()
+        result = self.apply(camping_site.id, catalog, dry_run=dry_run, prune=prune)
+        result['fetch_seconds'] = round(fetched - started, 2)
+        result['apply_seconds'] = round(time.perf_counter() - fetched, 3)
+        return result
+
+    def sync_all(self, dry_run: bool = False, prune: bool = False) -> Dict:
+        """shop 설정이 있는 모든 캠핑장 동기화 (캠핑장별 실패는 기록 후 계속)"""
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError('Seat catalog sync is already running')
+
+        try:
+            result = {'started_at': datetime.now().isoformat(timespec='seconds'), 'sites': {}}
+            for camping_site in CampingSite.query.order_by(CampingSite.id).all():
+                shop_encode, shop_code = camping_site.xticket_shop()
+                if not shop_encode or not shop_code:
+                    continue
+                try:
+                    result['sites'][camping_site.id] = self.sync_site(camping_site, dry_run=dry_run, prune=prune)
+                except Exception as e:
+                    logger.error(f"Seat catalog sync failed for camping site {camping_site.id}: {e}")
+                    result['sites'][camping_site.id] = {'error': str(e)}
+            self.last_run = result
+            return result
+        finally:
+            self._run_lock.release()
+
+    def get_status(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'hour': self.hour,
+            'next_run': scheduler_service.get_next_run('seat_catalog_sync_job'),
+            'running': self._run_lock.locked(),
+            'last_run': self.last_run
+        }
+
+
+# 전역 인스턴스
+seat_catalog_service = SeatCatalogService()
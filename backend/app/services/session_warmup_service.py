@@ -110,8 +110,10 @@ class SessionWarmupService:
         logger.info(f"   Accounts: {len(accounts)}")
         logger.info(f"   Execute at: {execute_at}")
 
-        # 캠핑장 정보 파싱
-        shop_encode, shop_code = self._parse_camping_site_url(camping_site.url)
+        # 캠핑장에 저장된 shop_encode, shop_code (없으면 URL/환경변수 기본값)
+        shop_encode, shop_code = camping_site.xticket_shop()
+        if not shop_encode or not shop_code:
+            raise ValueError(f"XTicket shop parameters not configured for camping site {camping_site.id}")
 
         # 시간 동기화 초기화
         time_sync = get_time_sync(XTicketScraper.BASE_URL, shop_encode)
@@ -337,35 +339,6 @@ class SessionWarmupService:
         """해당 스케줄의 시간 동기화 객체 반환"""
         return self._time_syncs.get(schedule_id)
 
-    def _parse_camping_site_url(self, url: str) -> tuple:
-        """
-        캠핑장 URL에서 shop_encode, shop_code 추출
-
-        URL 형식: https://camp.xticket.kr/web/main?shopEncode=xxx
-        """
-        import re
-        from urllib.parse import urlparse, parse_qs
-
-        # URL 파싱
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
-
-        shop_encode = query_params.get('shopEncode', [''])[0]
-
-        # shop_code는 별도 저장된 값 사용 또는 기본값
-        # 실제 구현에서는 캠핑장 모델에 저장된 값 사용
-        shop_code = "622830018001"  # 기본값 (생림오토캠핑장)
-
-        if not shop_encode:
-            # URL에서 직접 추출 시도
-            match = re.search(r'shopEncode=([^&]+)', url)
-            if match:
-                shop_encode = match.group(1)
-
-        logger.debug(f"Parsed URL: shop_encode={shop_encode}, shop_code={shop_code}")
-
-        return shop_encode, shop_code
-
 
 # 싱글톤 인스턴스
 session_warmup_service = SessionWarmupService()
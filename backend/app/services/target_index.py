@@ -0,0 +1,280 @@
+"""
+활성 모니터링 타겟 인메모리 인덱스
+
+(캠핑장, 연, 월) 단위로 활성 타겟 ID를 보관합니다.
+모니터링 틱은 DB 전체를 다시 조회하지 않고 이 인덱스에서 바로
+월 단위 조회 계획(fetch plan)을 만듭니다.
+
+- 타겟 생성/수정/삭제는 ORM 이벤트로 수집했다가 커밋 후에 반영 (롤백 시 폐기)
+- bulk insert/update 처럼 ORM 이벤트가 발생하지 않는 경로는 reload_sites()로 직접 알림
+- 다른 프로세스의 변경 등에 대비해 주기적으로 DB와 대조(reconcile)
+"""
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app import db
+from app.models.database import MonitoringRangeTarget, MonitoringTarget
+
+# 타겟 키: ('single', id) 또는 ('range', id)
+TargetKey = Tuple[str, int]
+MonthKey = Tuple[int, int, int]  # (camping_site_id, year, month)
+
+# DB 대조 주기 (초)
+RECONCILE_INTERVAL = 600
+
+# 세션 info 에 커밋 대기 중인 변경을 쌓아두는 키
+_PENDING_KEY = 'target_index_changes'
+
+# 인덱스에 영향을 주는 컬럼 (상태 확인 결과만 바뀐 update는 무시)
+_INDEXED_ATTRS = ('is_active', 'camping_site_id', 'target_date', 'start_date', 'end_date')
+
+
+def _month_range(start: date, end: date) -> Iterable[Tuple[int, int]]:
+    """start ~ end 사이의 (연, 월)"""
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+class ActiveTargetIndex:
+    """
+    활성 타겟 인덱스 (싱글톤)
+
+    Features:
+    - (캠핑장, 연, 월) -> 타겟 키 집합
+    - 커밋된 변경만 증분 반영
+    - 주기적 DB 대조 및 불일치 로그
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._data_lock = threading.RLock()
+        self._by_month: Dict[MonthKey, Set[TargetKey]] = {}
+        self._months_of: Dict[TargetKey, Set[MonthKey]] = {}
+        self._loaded = False
+        self._last_reconciled = 0.0
+        self.reconcile_interval = RECONCILE_INTERVAL
+
+    # ----- 인덱스 조작 -----
+
+    def _remove(self, key: TargetKey):
+        for month_key in self._months_of.pop(key, ()):
+            keys = self._by_month.get(month_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_month[month_key]
+
+    def _put(self, key: TargetKey, months: Set[MonthKey]):
+        self._remove(key)
+        if not months:
+            return
+        self._months_of[key] = months
+        for month_key in months:
+            self._by_month.setdefault(month_key, set()).add(key)
+
+    def apply(self, kind: str, target_id: int, camping_site_id: int, start: Optional[date],
+              end: Optional[date], active: bool):
+        """타겟 하나의 현재 상태 반영 (비활성/삭제면 제거)"""
+        key = (kind, target_id)
+        with self._data_lock:
+            if not active or start is None:
+                self._remove(key)
+                return
+            self._put(key, {(camping_site_id, year, month) for year, month in _month_range(start, end or start)})
+
+    # ----- DB 로드 / 대조 -----
+
+    def _load_from_db(self, site_ids: Optional[List[int]] = None) -> Dict[TargetKey, Set[MonthKey]]:
+        """DB의 활성 타겟을 {타겟 키: 월 키 집합} 으로 조회"""
+        singles = db.session.query(
+            MonitoringTarget.id, MonitoringTarget.camping_site_id, MonitoringTarget.target_date
+        ).filter(MonitoringTarget.is_active.is_(True))
+        ranges = db.session.query(
+            MonitoringRangeTarget.id, MonitoringRangeTarget.camping_site_id,
+            MonitoringRangeTarget.start_date, MonitoringRangeTarget.end_date
+        ).filter(MonitoringRangeTarget.is_active.is_(True))
+
+        if site_ids is not None:
+            singles = singles.filter(MonitoringTarget.camping_site_id.in_(site_ids))
+            ranges = ranges.filter(MonitoringRangeTarget.camping_site_id.in_(site_ids))
+
+        loaded: Dict[TargetKey, Set[MonthKey]] = {}
+        for target_id, site_id, target_date in singles:
+            loaded[('single', target_id)] = {(site_id, target_date.year, target_date.month)}
+        for target_id, site_id, start, end in ranges:
+            loaded[('range', target_id)] = {(site_id, year, month) for year, month in _month_range(start, end)}
+        return loaded
+
+    def load(self):
+        """DB에서 전체 인덱스 재구성 (앱 컨텍스트 필요)"""
+        loaded = self._load_from_db()
+        with self._data_lock:
+            self._by_month = {}
+            self._months_of = {}
+            for key, months in loaded.items():
+                self._put(key, months)
+            self._loaded = True
+            self._last_reconciled = time.monotonic()
+
+        logger.info(f"Target index loaded: {len(loaded)} targets in {len(self._by_month)} site-months")
+
+    def reload_sites(self, site_ids: Iterable[int]):
+        """특정 캠핑장의 타겟만 다시 로드 (bulk insert/update 후 호출)"""
+        site_ids = list(set(site_ids))
+        if not self._loaded or not site_ids:
+            return
+
+        loaded = self._load_from_db(site_ids)
+        site_set = set(site_ids)
+        with self._data_lock:
+            stale = [
+                key for key, months in self._months_of.items()
+                if any(month_key[0] in site_set for month_key in months)
+            ]
+            for key in stale:
+                self._remove(key)
+            for key, months in loaded.items():
+                self._put(key, months)
+
+    def reconcile(self) -> int:
+        """DB와 대조해 불일치 수정
+
+        Returns:
+            int: 불일치로 수정된 타겟 수
+        """
+        loaded = self._load_from_db()
+        with self._data_lock:
+            drift = {key for key in set(loaded) | set(self._months_of) if loaded.get(key) != self._months_of.get(key)}
+            for key in drift:
+                if key in loaded:
+                    self._put(key, loaded[key])
+                else:
+                    self._remove(key)
+            self._last_reconciled = time.monotonic()
+
+        if drift:
+            logger.warning(f"Target index reconciled: {len(drift)} targets out of sync")
+        return len(drift)
+
+    def ensure_fresh(self):
+        """최초 로드 또는 대조 주기 경과 시 DB와 동기화 (틱 시작 시 호출)"""
+        if not self._loaded:
+            self.load()
+        elif time.monotonic() - self._last_reconciled >= self.reconcile_interval:
+            self.reconcile()
+
+    def invalidate(self):
+        """다음 ensure_fresh() 에서 전체 재로드"""
+        with self._data_lock:
+            self._loaded = False
+
+    # ----- 조회 -----
+
+    def fetch_plan(self, since: Optional[date] = None) -> Dict[MonthKey, Dict[str, List[int]]]:
+        """(캠핑장, 연, 월)별 확인 대상 타겟 ID
+
+        Args:
+            since: 이 날짜가 속한 달 이전의 월은 제외 (None이면 전체)
+
+        Returns:
+            {(site_id, year, month): {'targets': [...], 'range_targets': [...]}} (정렬됨)
+        """
+        with self._data_lock:
+            items = [(month_key, list(keys)) for month_key, keys in self._by_month.items()]
+
+        plan = {}
+        for month_key, keys in sorted(items):
+            if since and (month_key[1], month_key[2]) < (since.year, since.month):
+                # 지난 달의 단일 타겟은 기존 동작대로 계속 확인
+                keys = [key for key in keys if key[0] == 'single']
+                if not keys:
+                    continue
+            plan[month_key] = {
+                'targets': sorted(target_id for kind, target_id in keys if kind == 'single'),
+                'range_targets': sorted(target_id for kind, target_id in keys if kind == 'range'),
+            }
+        return plan
+
+    def get_status(self) -> Dict:
+        with self._data_lock:
+            singles = sum(1 for kind, _ in self._months_of if kind == 'single')
+            return {
+                'loaded': self._loaded,
+                'targets': singles,
+                'range_targets': len(self._months_of) - singles,
+                'site_months': len(self._by_month),
+                'seconds_since_reconcile': round(time.monotonic() - self._last_reconciled, 1) if self._loaded else None
+            }
+
+
+# 싱글톤 인스턴스
+target_index = ActiveTargetIndex()
+
+
+def _snapshot(target) -> Tuple:
+    """flush 시점의 타겟 상태 (커밋 후 인덱스에 반영할 값)"""
+    if isinstance(target, MonitoringRangeTarget):
+        return ('range', target.id, target.camping_site_id, target.start_date, target.end_date, bool(target.is_active))
+    return ('single', target.id, target.camping_site_id, target.target_date, None, bool(target.is_active))
+
+
+def _register_listeners():
+    """타겟 변경 이벤트 수집 및 커밋/롤백 시 반영/폐기"""
+
+    def on_change(mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(_PENDING_KEY, []).append(_snapshot(target))
+
+    def on_update(mapper, connection, target):
+        state = inspect(target)
+        if any(name in state.attrs and state.attrs[name].history.has_changes() for name in _INDEXED_ATTRS):
+            on_change(mapper, connection, target)
+
+    def on_delete(mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            kind, target_id, site_id, start, end, _ = _snapshot(target)
+            session.info.setdefault(_PENDING_KEY, []).append((kind, target_id, site_id, start, end, False))
+
+    for model in (MonitoringTarget, MonitoringRangeTarget):
+        event.listen(model, 'after_insert', on_change)
+        event.listen(model, 'after_update', on_update)
+        event.listen(model, 'after_delete', on_delete)
+
+    @event.listens_for(Session, 'after_commit')
+    def apply_pending(session):
+        changes = session.info.pop(_PENDING_KEY, None)
+        if changes and target_index._loaded:
+            for change in changes:
+                target_index.apply(*change)
+
+    @event.listens_for(Session, 'after_rollback')
+    def discard_pending(session):
+        session.info.pop(_PENDING_KEY, None)
+
+
+_register_listeners()
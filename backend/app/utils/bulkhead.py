@@ -0,0 +1,106 @@
+"""
+실시간 업스트림 조회 API 격벽(bulkhead)
+
+좌석/상품 그룹/서버 시간처럼 요청마다 XTicket을 직접 호출하는 API는
+업스트림이 느려지면 응답 대기 동안 워커 스레드를 붙잡습니다.
+이런 API의 동시 실행 수를 제한해 워커 대부분이 항상 대시보드 등 다른 요청을 처리할 수 있게 하고,
+자리가 없으면 기다리지 않고 503 (Retry-After) 으로 즉시 응답합니다.
+
+사용 예:
+    @bp.route('/camping-sites/<int:site_id>/available-sites', methods=['POST'])
+    @require_auth
+    @upstream_bulkhead.limit
+    def get_available_sites(site_id): ...
+"""
+import threading
+from functools import wraps
+
+from flask import jsonify
+from loguru import logger
+
+from app.utils.metrics import BULKHEAD_IN_FLIGHT, BULKHEAD_REJECTIONS
+
+
+class Bulkhead:
+    """동시 실행 수 제한 (자리가 없으면 queue_timeout 만큼만 대기 후 거절)"""
+
+    def __init__(self, name: str, max_concurrent: int, queue_timeout: float = 0.0, retry_after: int = 1):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected = 0
+
+    def configure(self, max_concurrent: int, queue_timeout: float):
+        """동시 실행 수 / 대기 시간 변경 (요청을 처리하기 전, 앱 생성 시에만 호출)"""
+        with self._lock:
+            if self.in_flight:
+                raise RuntimeError(f"Bulkhead '{self.name}' cannot be resized while requests are in flight")
+            self.max_concurrent = max_concurrent
+            self.queue_timeout = queue_timeout
+            self._semaphore = threading.BoundedSemaphore(max_concurrent)
+
+    def try_acquire(self) -> bool:
+        if self.queue_timeout > 0:
+            acquired = self._semaphore.acquire(timeout=self.queue_timeout)
+        else:
+            acquired = self._semaphore.acquire(blocking=False)
+
+        with self._lock:
+            if acquired:
+                self.in_flight += 1
+            else:
+                self.rejected += 1
+            BULKHEAD_IN_FLIGHT.set(self.in_flight, bulkhead=self.name)
+
+        if not acquired:
+            BULKHEAD_REJECTIONS.inc(bulkhead=self.name)
+        return acquired
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+            BULKHEAD_IN_FLIGHT.set(self.in_flight, bulkhead=self.name)
+        self._semaphore.release()
+
+    def limit(self, view):
+        """라우트 데코레이터 (자리가 없으면 503)"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not self.try_acquire():
+                logger.warning(f"Bulkhead '{self.name}' full ({self.max_concurrent} in flight), rejecting request")
+                response = jsonify({
+                    'error': 'Too many live upstream requests in progress, please retry shortly',
+                    'retry_after': self.retry_after
+                })
+                response.headers['Retry-After'] = str(self.retry_after)
+                return response, 503
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release()
+        return wrapper
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                'name': self.name,
+                'max_concurrent': self.max_concurrent,
+                'in_flight': self.in_flight,
+                'rejected': self.rejected
+            }
+
+
+# XTicket 실시간 조회 API 공용 격벽 (크기는 init_app 에서 설정 적용)
+upstream_bulkhead = Bulkhead('upstream_proxy', max_concurrent=4, queue_timeout=0.5)
+
+
+def init_app(app):
+    """UPSTREAM_PROXY_* 설정 적용"""
+    upstream_bulkhead.configure(
+        app.config['UPSTREAM_PROXY_MAX_CONCURRENT'],
+        app.config['UPSTREAM_PROXY_QUEUE_TIMEOUT']
+    )
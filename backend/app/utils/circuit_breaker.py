@@ -0,0 +1,205 @@
+"""
+호스트별 서킷 브레이커
+
+외부 서버(XTicket, 텔레그램)가 장애일 때 모든 요청이 재시도/타임아웃을 기다리며
+요청 스레드나 모니터링 틱을 붙잡지 않도록, 연속 실패가 쌓이면 회로를 열어
+이후 요청을 즉시 실패(CircuitOpenError)시킵니다.
+
+상태:
+- closed: 정상. 연속 실패가 failure_threshold 회에 도달하면 open
+- open: 즉시 실패. recovery_seconds 가 지나면 half_open
+- half_open: 요청 하나만 시험(probe)으로 보냄. 성공하면 closed, 실패하면 다시 open
+
+같은 호스트를 쓰는 스크래퍼/세션이 하나의 브레이커를 공유하며, UpstreamSession(breaker=True) 로
+opt-in 한 모니터링/조회 요청에만 적용합니다 (예약 요청과 서버 시간 동기화는 제외).
+연결 오류, 타임아웃, 5xx 응답을 실패로 보며 4xx 는 서버가 살아 있는 것으로 봅니다.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 메트릭 게이지 값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(requests.RequestException):
+    """회로가 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+    def __init__(self, host: str, retry_after: float, last_error: Optional[str]):
+        self.host = host
+        self.retry_after = retry_after
+        self.last_error = last_error
+        super().__init__(
+            f"Upstream unavailable: {host} (circuit open, retry in {retry_after:.0f}s, last error: {last_error})"
+        )
+
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 브레이커"""
+
+    def __init__(self, host: str, failure_threshold: int = 5, recovery_seconds: float = 30):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_failure_at: Optional[datetime] = None
+        self.last_state_change: datetime = datetime.utcnow()
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def _set_state(self, state: str):
+        if self.state != state:
+            self.state = state
+            self.last_state_change = datetime.utcnow()
+
+    def before_request(self):
+        """요청 전 호출 (열려 있으면 CircuitOpenError)
+
+        half_open 전환 시점에 처음 들어온 요청 하나만 probe로 통과시킵니다.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            if self.state == OPEN:
+                elapsed = now - self.opened_at
+                if elapsed >= self.recovery_seconds:
+                    self._set_state(HALF_OPEN)
+                    self._probe_in_flight = True
+                    return
+                retry_after = self.recovery_seconds - elapsed
+            elif not self._probe_in_flight:
+                # 이전 probe가 결과 없이 끝난 경우 다음 요청을 probe로 사용
+                self._probe_in_flight = True
+                return
+            else:
+                retry_after = self.recovery_seconds
+
+            self.rejected += 1
+            raise CircuitOpenError(self.host, retry_after, self.last_error)
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+            self.opened_at = None
+            self._set_state(CLOSED)
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = error
+            self.last_failure_at = datetime.utcnow()
+            self._probe_in_flight = False
+
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set_state(OPEN)
+
+    def release_probe(self):
+        """판정 없이 끝난 요청 (probe였다면 다음 요청이 다시 probe가 됨)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """즉시 실패 중인지 (recovery 대기 중인 open 상태)"""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self.opened_at < self.recovery_seconds
+
+    def raise_if_open(self):
+        """즉시 실패 중이면 CircuitOpenError (probe 슬롯은 사용하지 않음)"""
+        with self._lock:
+            if self.state != OPEN:
+                return
+            retry_after = self.recovery_seconds - (time.monotonic() - self.opened_at)
+            if retry_after > 0:
+                raise CircuitOpenError(self.host, retry_after, self.last_error)
+
+    def reset(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+            self.opened_at = None
+            self._set_state(CLOSED)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            retry_after = None
+            if self.state == OPEN:
+                retry_after = round(max(self.recovery_seconds - (time.monotonic() - self.opened_at), 0), 1)
+            return {
+                'host': self.host,
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_after_seconds': retry_after,
+                'rejected': self.rejected,
+                'last_error': self.last_error,
+                'last_failure_at': self.last_failure_at.isoformat() if self.last_failure_at else None,
+                'last_state_change': self.last_state_change.isoformat()
+            }
+
+
+class CircuitBreakerRegistry:
+    """호스트별 브레이커 모음 (프로세스 전체에서 공유)"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.failure_threshold = 5
+        self.recovery_seconds = 30.0
+
+    def configure(self, failure_threshold: int, recovery_seconds: float):
+        """임계값 변경 (이미 만든 브레이커에도 적용)"""
+        with self._lock:
+            self.failure_threshold = failure_threshold
+            self.recovery_seconds = recovery_seconds
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = failure_threshold
+                breaker.recovery_seconds = recovery_seconds
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(host)
+                if breaker is None:
+                    breaker = CircuitBreaker(host, self.failure_threshold, self.recovery_seconds)
+                    self._breakers[host] = breaker
+        return breaker
+
+    def get_status(self) -> Dict[str, Dict]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.host: breaker.to_dict() for breaker in breakers}
+
+    def reset(self):
+        with self._lock:
+            for breaker in self._breakers.values():
+                breaker.reset()
+
+
+# 싱글톤 레지스트리
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def init_app(app):
+    """CIRCUIT_BREAKER_* 설정 적용"""
+    circuit_breakers.configure(
+        app.config['CIRCUIT_BREAKER_FAILURE_THRESHOLD'],
+        app.config['CIRCUIT_BREAKER_RECOVERY_SECONDS']
+    )
@@ -0,0 +1,121 @@
+"""
+호출 단위 마감 시간(deadline) 전파
+
+API 요청, 모니터링 틱, 스케줄 작업이 각자 전체 시간 예산을 정하면
+그 안에서 이루어지는 모든 외부 호출이 남은 시간만큼만 기다리도록 합니다.
+(contextvars 기반이므로 같은 스레드/컨텍스트 안의 호출에 자동으로 적용)
+
+- 연결(connect) / 응답 대기(read) 타임아웃을 분리하고, 둘 다 남은 시간으로 잘라서 사용
+- 마감이 지났으면 요청을 보내지 않고 DeadlineExceeded
+- 재시도 루프는 남은 시간이 백오프 대기보다 짧으면 바로 중단
+
+사용 예:
+    with deadline(50):
+        monitor.check_all_targets()
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Tuple, Union
+
+import requests
+
+# 기본 타임아웃 (초) - 연결은 짧게, 응답 대기는 REQUEST_TIMEOUT (init_app 에서 설정 적용)
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30.0
+
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """호출자의 전체 시간 예산 초과"""
+
+
+def remaining() -> Optional[float]:
+    """남은 시간 (초, 마감이 없으면 None)"""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def check(what: str = 'operation'):
+    """마감이 지났으면 DeadlineExceeded"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before {what} ({-left:.2f}s over budget)")
+
+
+def start(seconds: Optional[float]):
+    """마감 설정 (reset()에 전달할 토큰 반환, 바깥 마감보다 늦어지지 않음)"""
+    if not seconds or seconds <= 0:
+        return None
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(new_deadline, current)
+    return _deadline.set(new_deadline)
+
+
+def reset(token):
+    if token is not None:
+        _deadline.reset(token)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """with 블록에 전체 시간 예산 적용 (None/0 이면 바깥 마감만 유지)"""
+    token = start(seconds)
+    try:
+        yield
+    finally:
+        reset(token)
+
+
+def upstream_timeout(timeout: Union[None, float, Tuple[float, float]] = None) -> Tuple[Tuple[float, float], bool]:
+    """외부 호출 타임아웃 계산
+
+    Args:
+        timeout: 호출자가 지정한 타임아웃 (숫자면 read 타임아웃으로 보고 connect는 기본값 이하로)
+
+    Returns:
+        ((connect, read), clipped): clipped는 마감 때문에 타임아웃이 줄었는지 여부
+
+    Raises:
+        DeadlineExceeded: 이미 마감이 지난 경우
+    """
+    if timeout is None:
+        connect, read = CONNECT_TIMEOUT, READ_TIMEOUT
+    elif isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect, read = min(CONNECT_TIMEOUT, timeout), timeout
+
+    left = remaining()
+    if left is None:
+        return (connect, read), False
+
+    check('upstream request')
+    clipped = left < read or left < connect
+    return (min(connect, left), min(read, left)), clipped
+
+
+def init_app(app):
+    """기본 타임아웃(UPSTREAM_CONNECT_TIMEOUT / REQUEST_TIMEOUT) 설정 및 API 요청마다 API_REQUEST_DEADLINE_SECONDS 예산 적용"""
+    from flask import g
+
+    global CONNECT_TIMEOUT, READ_TIMEOUT
+    CONNECT_TIMEOUT = float(app.config['UPSTREAM_CONNECT_TIMEOUT'])
+    READ_TIMEOUT = float(app.config['REQUEST_TIMEOUT'])
+
+    budget = app.config.get('API_REQUEST_DEADLINE_SECONDS')
+    if not budget:
+        return
+
+    @app.before_request
+    def _start_request_deadline():
+        g.deadline_token = start(budget)
+
+    @app.teardown_request
+    def _reset_request_deadline(exc):
+        reset(g.pop('deadline_token', None))
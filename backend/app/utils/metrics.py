@@ -0,0 +1,468 @@
+"""
+프로세스 내 메트릭 레지스트리
+
+Counter / Gauge / Histogram 을 메모리에 집계하고
+Prometheus 텍스트 포맷(/api/metrics)으로 노출합니다.
+
+수집 항목:
+- 외부 API(XTicket, 텔레그램) 요청 지연 (엔드포인트/상태 코드별)
+- 모니터링 틱 소요 시간 및 틱당 타겟 수
+- 알림 적재 → 전송 완료까지의 지연
+- HTTP 요청당 DB 쿼리 수 및 응답 시간
+- APScheduler 작업 지연 실행 시간 (작업 유형별)
+"""
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from app.utils.tracing import span
+
+# 기본 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 공통 기능 (라벨 처리 및 포맷)"""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        unknown = set(labels) - set(self.labelnames)
+        if unknown:
+            raise ValueError(f"Unknown labels for {self.name}: {sorted(unknown)}")
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels_text(self, key: Tuple[str, ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._labels_text(key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._labels_text(key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """분포 히스토그램 (누적 버킷 + 합계 + 개수)"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # key -> [버킷별 개수..., 합계, 개수]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return int(state[-1]) if state else 0
+
+    def get_sum(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-2] if state else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for index, bound in enumerate(self.buckets):
+                cumulative += state[index]
+                labels = self._labels_text(key, (('le', _format_value(bound)),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels_text(key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{self._labels_text(key)} {int(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷으로 변환"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# 싱글톤 레지스트리
+registry = MetricsRegistry()
+
+# =====================================================
+# 메트릭 정의
+# =====================================================
+
+UPSTREAM_REQUEST_SECONDS = registry.histogram(
+    'upstream_request_duration_seconds',
+    'Outbound HTTP request latency by upstream, endpoint and status',
+    ('upstream', 'endpoint', 'status')
+)
+
+MONITOR_TICK_SECONDS = registry.histogram(
+    'monitor_tick_duration_seconds',
+    'Duration of a monitoring tick (check_all_targets)',
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+
+MONITOR_TICK_TARGETS = registry.histogram(
+    'monitor_tick_targets',
+    'Number of active targets checked per monitoring tick',
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 2500, 5000)
+)
+
+NOTIFICATION_DISPATCH_SECONDS = registry.histogram(
+    'notification_dispatch_latency_seconds',
+    'Time from enqueueing a notification to successful delivery',
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+)
+
+NOTIFICATIONS_TOTAL = registry.counter(
+    'notifications_total',
+    'Notification delivery attempts by result',
+    ('result',)
+)
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'http_request_duration_seconds',
+    'API request latency by endpoint, method and status',
+    ('endpoint', 'method', 'status')
+)
+
+HTTP_REQUEST_DB_QUERIES = registry.histogram(
+    'http_request_db_queries',
+    'Number of DB queries executed per API request',
+    ('endpoint',),
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+)
+
+SCHEDULER_JOB_LATENESS_SECONDS = registry.histogram(
+    'scheduler_job_lateness_seconds',
+    'Delay between a job\'s scheduled run time and its actual submission',
+    ('job_type',),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 60)
+)
+
+SCHEDULER_JOBS_MISSED = registry.counter(
+    'scheduler_jobs_missed_total',
+    'Jobs skipped because they fired past misfire_grace_time',
+    ('job_type',)
+)
+
+UPSTREAM_CLIENT_REQUESTS = registry.counter(
+    'upstream_client_requests_total',
+    'Outbound HTTP requests per pooled client (e.g. XTicket shop) and status',
+    ('upstream', 'client', 'status')
+)
+
+CIRCUIT_BREAKER_STATE = registry.gauge(
+    'circuit_breaker_state',
+    'Upstream circuit breaker state per host (0=closed, 1=half_open, 2=open)',
+    ('host',)
+)
+
+CIRCUIT_BREAKER_REJECTIONS = registry.counter(
+    'circuit_breaker_rejections_total',
+    'Requests failed fast because the host circuit was open',
+    ('host',)
+)
+
+BULKHEAD_IN_FLIGHT = registry.gauge(
+    'bulkhead_in_flight',
+    'Requests currently running inside a bulkhead',
+    ('bulkhead',)
+)
+
+BULKHEAD_REJECTIONS = registry.counter(
+    'bulkhead_rejections_total',
+    'Requests rejected with 503 because the bulkhead was full',
+    ('bulkhead',)
+)
+
+XTICKET_POOL_CLIENTS = registry.gauge(
+    'xticket_pool_clients',
+    'Number of XTicket clients currently held in the pool'
+)
+
+XTICKET_POOL_EVENTS = registry.counter(
+    'xticket_pool_events_total',
+    'XTicket client pool lookups and evictions by event (hit, miss, evict_lru, evict_idle)',
+    ('event',)
+)
+
+
+MAINTENANCE_ROWS = registry.counter(
+    'maintenance_rows_total',
+    'Rows removed or rewritten by the maintenance job by table and action (delete, downsample, strip)',
+    ('table', 'action')
+)
+
+MAINTENANCE_STEP_SECONDS = registry.histogram(
+    'maintenance_step_seconds',
+    'Maintenance job step duration',
+    ('step',),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 1800)
+)
+
+
+BACKUP_DURATION_SECONDS = registry.histogram(
+    'backup_duration_seconds',
+    'Online SQLite backup duration per database',
+    ('database',),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900)
+)
+
+BACKUP_LAST_SUCCESS_TIMESTAMP = registry.gauge(
+    'backup_last_success_timestamp_seconds',
+    'Unix time of the last successful backup per database',
+    ('database',)
+)
+
+
+# =====================================================
+# 계측 헬퍼
+# =====================================================
+
+def endpoint_label(url: str) -> str:
+    """URL을 메트릭 라벨로 변환 (경로 마지막 구간, 토큰/쿼리 제외)"""
+    path = urlparse(url).path.rstrip('/')
+    return path.rsplit('/', 1)[-1] or '/'
+
+
+class InstrumentedSession(requests.Session):
+    """외부 API 호출 계측용 Session
+
+    - 요청 지연을 upstream_request_duration_seconds 메트릭과 trace span으로 기록
+    - client를 지정하면 클라이언트별 요청 수(upstream_client_requests_total)도 기록
+
+    타임아웃/마감/서킷 브레이커 정책은 app.utils.upstream.UpstreamSession 에서 적용합니다.
+    """
+
+    def __init__(self, upstream: str, client: str = None):
+        """
+        Args:
+            upstream: 메트릭/trace 라벨 (xticket, telegram)
+            client: 클라이언트 라벨 (풀 클라이언트 식별용)
+        """
+        super().__init__()
+        self.upstream = upstream
+        self.client = client
+
+    def request(self, method, url, *args, **kwargs):
+        endpoint = endpoint_label(url)
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            with span('http.request', kind=self.upstream, method=method, endpoint=endpoint) as current:
+                response = super().request(method, url, *args, **kwargs)
+                status = str(response.status_code)
+                if current is not None:
+                    current.attrs['status'] = status
+            return response
+        except requests.Timeout:
+            status = 'timeout'
+            raise
+        finally:
+            self._record(endpoint, status, time.perf_counter() - start)
+
+    def _record(self, endpoint: str, status: str, elapsed: float = None):
+        """지연(실제로 요청한 경우만) 및 클라이언트별 요청 수 기록"""
+        if elapsed is not None:
+            UPSTREAM_REQUEST_SECONDS.observe(elapsed, upstream=self.upstream, endpoint=endpoint, status=status)
+        if self.client:
+            UPSTREAM_CLIENT_REQUESTS.inc(upstream=self.upstream, client=self.client, status=status)
+
+
+def _job_type(job_id: str) -> str:
+    """작업 ID에서 유형 추출 (reservation_12 -> reservation)"""
+    return re.sub(r'_\d+$', '', job_id or 'unknown')
+
+
+def instrument_scheduler(scheduler):
+    """APScheduler 작업 지연 실행 시간 및 누락 기록"""
+    from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+
+    def on_job_event(event):
+        job_type = _job_type(event.job_id)
+
+        if event.code == EVENT_JOB_MISSED:
+            SCHEDULER_JOBS_MISSED.inc(job_type=job_type)
+            return
+
+        for run_time in event.scheduled_run_times:
+            lateness = (datetime.now(run_time.tzinfo) - run_time).total_seconds()
+            SCHEDULER_JOB_LATENESS_SECONDS.observe(max(lateness, 0), job_type=job_type)
+
+    scheduler.add_listener(on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED)
+
+
+_query_listener_registered = False
+
+
+def init_app(app):
+    """요청별 응답 시간 및 DB 쿼리 수 수집 등록"""
+    global _query_listener_registered
+
+    from flask import g, has_request_context, request
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if not _query_listener_registered:
+        @event.listens_for(Engine, 'before_cursor_execute')
+        def _count_query(conn, cursor, statement, parameters, context, executemany):
+            if has_request_context():
+                g.metrics_db_queries = g.get('metrics_db_queries', 0) + 1
+
+        _query_listener_registered = True
+
+    @app.before_request
+    def _start_request_metrics():
+        g.metrics_request_start = time.perf_counter()
+        g.metrics_db_queries = 0
+
+    @app.after_request
+    def _record_request_metrics(response):
+        start = g.get('metrics_request_start')
+        if start is not None:
+            endpoint = request.endpoint or 'unknown'
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                endpoint=endpoint,
+                method=request.method,
+                status=str(response.status_code)
+            )
+            HTTP_REQUEST_DB_QUERIES.observe(g.get('metrics_db_queries', 0), endpoint=endpoint)
+        return response
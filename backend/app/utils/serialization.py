@@ -0,0 +1,97 @@
+"""
+응답 JSON 인코딩 / 압축
+
+- FastJSONProvider: orjson이 설치되어 있으면 jsonify 인코딩에 사용 (없으면 표준 json)
+- gzip: RESPONSE_GZIP_MIN_BYTES 이상인 JSON/텍스트 응답을 Accept-Encoding에 따라 압축
+"""
+import gzip
+from typing import Any
+
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+# 압축 대상 mimetype
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'text/plain',
+    'text/csv',
+    'text/html',
+}
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 프로바이더 (orjson이 없거나 인코딩할 수 없는 값이면 표준 json으로 처리)
+
+    날짜/시간은 기존과 같이 default(HTTP 날짜 형식)로 넘겨 두 경로의 출력이 같도록 합니다.
+    키 정렬은 하지 않습니다 (클라이언트는 키 순서에 의존하지 않음).
+    """
+
+    sort_keys = False
+
+    def _orjson_options(self, indent: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode('utf-8')
+        except (orjson.JSONEncodeError, TypeError):
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._orjson_options(indent)) + b'\n'
+        except (orjson.JSONEncodeError, TypeError):
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_app(app):
+    """JSON 프로바이더 교체 및 응답 gzip 압축 등록"""
+    app.json = FastJSONProvider(app)
+
+    min_bytes = app.config.get('RESPONSE_GZIP_MIN_BYTES', 0)
+    level = app.config.get('RESPONSE_GZIP_LEVEL', 6)
+    if not min_bytes:
+        return
+
+    @app.after_request
+    def _gzip_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        data = response.get_data()
+        if len(data) < min_bytes:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if request.accept_encodings['gzip'] <= 0:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=level))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
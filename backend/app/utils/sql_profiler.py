@@ -0,0 +1,131 @@
+"""
+요청별 SQL 프로파일러 (SQL_PROFILING=true 일 때만 동작)
+
+SQLAlchemy 엔진 이벤트로 요청마다 실행된 쿼리 수와 총 소요 시간을 집계하고,
+같은 형태(shape)의 쿼리가 반복되면 N+1 의심으로 표시합니다.
+
+결과는 응답 헤더와 로그 한 줄로 남습니다.
+    X-SQL-Query-Count: 152
+    X-SQL-Query-Time-Ms: 43.2
+    X-SQL-N-Plus-One: 150x SELECT camping_site_seats.id, ... WHERE camping_site_seats.id = ?
+"""
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from flask import g, has_request_context, request
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 공백/리터럴 정규화 패턴
+_WHITESPACE = re.compile(r'\s+')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*\?\s*,?)+\)', re.IGNORECASE)
+_SELECT_COLUMNS = re.compile(r'^SELECT .+? FROM ', re.IGNORECASE)
+
+# 헤더에 넣을 쿼리 형태 최대 길이
+MAX_HEADER_SHAPE_LENGTH = 200
+
+_listeners_registered = False
+
+
+def normalize_statement(statement: str) -> str:
+    """쿼리 형태 추출 (리터럴과 IN 목록 길이를 제거해 같은 형태끼리 묶음)"""
+    shape = _WHITESPACE.sub(' ', statement).strip()
+    shape = _STRING_LITERAL.sub('?', shape)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    return _IN_LIST.sub('IN (?)', shape)
+
+
+def display_shape(shape: str) -> str:
+    """헤더/로그 표시용 쿼리 형태 (SELECT 컬럼 목록 생략)"""
+    return _SELECT_COLUMNS.sub('SELECT ... FROM ', shape)[:MAX_HEADER_SHAPE_LENGTH]
+
+
+class RequestProfile:
+    """요청 하나의 SQL 실행 기록"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_time = 0.0  # 초
+        self.shapes: Counter = Counter()
+        self.shape_times: Dict[str, float] = {}
+
+    def record(self, statement: str, elapsed: float):
+        shape = normalize_statement(statement)
+        self.query_count += 1
+        self.total_time += elapsed
+        self.shapes[shape] += 1
+        self.shape_times[shape] = self.shape_times.get(shape, 0.0) + elapsed
+
+    def n_plus_one_suspects(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 회 이상 반복된 쿼리 형태 (많이 반복된 순)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and has_request_context() and g.get('sql_profile') is not None:
+        context._sql_profiler_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, '_sql_profiler_start', None)
+    if start is None or not has_request_context():
+        return
+
+    profile = g.get('sql_profile')
+    if profile is not None:
+        profile.record(statement, time.perf_counter() - start)
+
+
+def init_app(app):
+    """SQL 프로파일링 등록 (SQL_PROFILING 설정 시)"""
+    global _listeners_registered
+
+    if not app.config.get('SQL_PROFILING'):
+        return
+
+    threshold = app.config.get('SQL_PROFILING_N_PLUS_ONE_THRESHOLD', 5)
+
+    if not _listeners_registered:
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        _listeners_registered = True
+
+    @app.before_request
+    def _start_sql_profile():
+        g.sql_profile = RequestProfile()
+
+    @app.after_request
+    def _finish_sql_profile(response):
+        profile = g.pop('sql_profile', None)
+        if profile is None:
+            return response
+
+        total_ms = profile.total_time * 1000
+        suspects = profile.n_plus_one_suspects(threshold)
+
+        response.headers['X-SQL-Query-Count'] = str(profile.query_count)
+        response.headers['X-SQL-Query-Time-Ms'] = f"{total_ms:.1f}"
+
+        summary = f"SQL {request.method} {request.path}: {profile.query_count} queries, {total_ms:.1f}ms"
+
+        if suspects:
+            shape, count = suspects[0]
+            header_value = f"{count}x {display_shape(shape)}"
+            response.headers['X-SQL-N-Plus-One'] = header_value.encode('ascii', 'replace').decode('ascii')
+
+            details = '; '.join(
+                f"{count}x ({profile.shape_times[shape] * 1000:.1f}ms) {display_shape(shape)}"
+                for shape, count in suspects
+            )
+            logger.warning(f"{summary} - possible N+1: {details}")
+        else:
+            logger.info(summary)
+
+        return response
+
+    logger.info(f"SQL profiling enabled (N+1 threshold: {threshold})")
@@ -0,0 +1,180 @@
+"""
+테이블별 버전과 ETag 조건부 GET
+
+ORM 세션 이벤트로 변경된 테이블을 모아 커밋하는 트랜잭션 안에서 table_versions 행의 버전을 올리고,
+목록 API는 관련 테이블 버전으로 ETag를 만들어 If-None-Match가 일치하면
+쿼리/직렬화 없이 304를 반환합니다.
+
+- flush 된 객체(추가/수정/삭제)와 ORM/Core insert/update/delete 문을 테이블 단위로 기록
+- etag_cached 뷰가 읽는 테이블만 버전을 올림 (아웃박스 전송 등 다른 테이블 커밋은 쓰기 없음)
+- 확인 시각/재시도 횟수 같은 기록용 컬럼(BOOKKEEPING_COLUMNS)만 바뀐 수정은 변경으로 보지 않음
+  (모니터링 틱마다 ETag 가 바뀌지 않도록, 대신 304 응답의 확인 시각은 이전 값일 수 있음)
+- 버전은 DB에 저장하므로 다른 프로세스(스케줄러 작업, scripts/ 의 동기화/정리/백필 스크립트)의
+  변경도 다음 요청의 ETag에 반영됨 (변경과 같은 트랜잭션이므로 롤백 시 함께 폐기)
+- text() 로 직접 쓴 SQL 은 테이블을 알 수 없으므로 mark_changed() 로 알려야 함
+- 프로세스마다 epoch가 달라 재시작(배포) 후에는 ETag가 모두 바뀜 (응답 형식 변경 대비)
+
+사용 예:
+    @bp.route('/camping-sites', methods=['GET'])
+    @require_auth
+    @etag_cached('camping_sites', 'camping_site_accounts')
+    def get_camping_sites(): ...
+"""
+import hashlib
+import uuid
+from datetime import datetime
+from functools import wraps
+from typing import Dict, Iterable
+
+from flask import make_response, request
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.database import TableVersion
+
+# 세션 info 에 커밋 대기 중인 테이블 이름을 쌓아두는 키
+_PENDING_KEY = 'table_versions_pending'
+
+# 이 컬럼만 바뀐 수정은 응답 내용 변경으로 보지 않음 (확인 시각 / 전송 재시도 상태)
+BOOKKEEPING_COLUMNS = frozenset({'checked_at', 'last_checked', 'attempts', 'next_attempt_at'})
+
+
+class TableVersions:
+    """테이블별 변경 버전 (table_versions 테이블)"""
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.tracked = set()  # etag_cached 뷰가 읽는 테이블
+
+    def track(self, tables: Iterable[str]):
+        """버전을 관리할 테이블 등록 (etag_cached 적용 시)"""
+        self.tracked.update(tables)
+
+    def bump(self, connection, tables: Iterable[str]):
+        """변경된 테이블의 버전 증가 (호출자의 트랜잭션 안에서 실행)"""
+        now = datetime.utcnow()
+        stmt = sqlite_insert(TableVersion.__table__).values(
+            [{'table_name': table, 'version': 1, 'updated_at': now} for table in sorted(tables)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['table_name'],
+            set_={'version': TableVersion.__table__.c.version + 1, 'updated_at': stmt.excluded.updated_at}
+        )
+        connection.execute(stmt)
+
+    def snapshot(self, tables: Iterable[str] = None) -> Dict[str, str]:
+        """{테이블: '버전@변경 시각'} (tables 생략 시 전체)"""
+        query = select(TableVersion.table_name, TableVersion.version, TableVersion.updated_at)
+        if tables is not None:
+            query = query.where(TableVersion.table_name.in_(list(tables)))
+        return {
+            name: f"{version}@{updated_at.isoformat() if updated_at else ''}"
+            for name, version, updated_at in db.session.execute(query)
+        }
+
+    def etag_for(self, tables: Iterable[str], key: str = '') -> str:
+        """테이블 버전 + 요청 키(경로/쿼리)로 ETag 생성
+
+        버전만 쓰면 DB를 백업에서 복원한 뒤 같은 번호가 다른 내용을 가리킬 수 있어 변경 시각도 포함합니다.
+        """
+        tables = list(tables)
+        versions = self.snapshot(tables)
+        parts = [self.epoch, key] + [f"{table}={versions.get(table, 0)}" for table in tables]
+        return hashlib.blake2s('|'.join(parts).encode('utf-8'), digest_size=12).hexdigest()
+
+
+# 싱글톤 인스턴스
+table_versions = TableVersions()
+
+
+def _pending(session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def mark_changed(session, *tables: str):
+    """text() SQL 등 테이블을 알 수 없는 변경을 커밋 시 버전에 반영하도록 기록"""
+    _pending(session).update(tables)
+
+
+def _has_content_changes(obj) -> bool:
+    """기록용 컬럼 외에 값이 실제로 바뀐 속성이 있는지 (after_flush 시점의 변경 이력 기준)"""
+    state = inspect(obj)
+    for attr in state.mapper.attrs:
+        if attr.key in BOOKKEEPING_COLUMNS:
+            continue
+        history = state.attrs[attr.key].history
+        # 같은 값을 다시 대입한 경우는 added == deleted
+        if history.added and list(history.added) != list(history.deleted):
+            return True
+    return False
+
+
+def _register_listeners():
+    """변경 테이블 수집 및 커밋 트랜잭션에서 버전 증가 / 롤백 시 폐기"""
+
+    @event.listens_for(Session, 'after_flush')
+    def collect_flushed(session, flush_context):
+        changed = _pending(session)
+        for obj in (*session.new, *session.deleted):
+            changed.update(table.name for table in inspect(obj).mapper.tables)
+        for obj in session.dirty:
+            if _has_content_changes(obj):
+                changed.update(table.name for table in inspect(obj).mapper.tables)
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def collect_bulk(orm_execute_state):
+        # bulk insert / query.update() / query.delete() / Core 문은 flush 를 거치지 않음
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            table = getattr(orm_execute_state.statement, 'table', None)
+            if table is not None and getattr(table, 'name', None):
+                _pending(orm_execute_state.session).add(table.name)
+
+    @event.listens_for(Session, 'before_commit')
+    def write_pending(session):
+        # 남은 변경을 먼저 flush 해야 after_flush 에서 테이블이 수집됨
+        session.flush()
+        changed = session.info.pop(_PENDING_KEY, set()) & table_versions.tracked
+        if changed:
+            # session.execute 가 아닌 연결로 실행해 do_orm_execute 에 다시 걸리지 않게 함
+            table_versions.bump(session.connection(), changed)
+
+    @event.listens_for(Session, 'after_rollback')
+    def discard_pending(session):
+        session.info.pop(_PENDING_KEY, None)
+
+
+_register_listeners()
+
+
+def etag_cached(*tables: str):
+    """GET 응답에 테이블 버전 기반 ETag 적용 (If-None-Match 일치 시 뷰 실행 없이 304)
+
+    Args:
+        tables: 응답 내용에 영향을 주는 테이블 이름
+    """
+    table_versions.track(tables)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+
+            # 뷰 실행 전에 버전을 읽어야 조회 도중 커밋된 변경이 다음 요청에서 반영됨 (버전 조회 쿼리 1회)
+            tag = table_versions.etag_for(tables, request.full_path)
+
+            if request.if_none_match.contains_weak(tag):
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            # 본문이 아닌 데이터 버전 기반이고 gzip 여부와 무관하므로 weak ETag
+            response.set_etag(tag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
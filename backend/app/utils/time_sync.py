@@ -10,9 +10,10 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple, List
 from email.utils import parsedate_to_datetime
 from loguru import logger
-import requests
 import threading
 
+from app.utils.upstream import UpstreamSession
+
 
 class TimeSample:
     """시간 샘플 데이터"""
@@ -67,7 +68,7 @@ class PreciseTimeSync:
         self._max_rtt_history = 10
 
         # 세션
-        self.session = requests.Session()
+        self.session = UpstreamSession('xticket')
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -0,0 +1,298 @@
+"""
+경량 요청 추적 (span tracing)
+
+API 요청(또는 모니터링 틱) 하나를 trace로 보고, 그 안에서 발생한
+DB 쿼리 / XTicket 호출 / 텔레그램 호출을 span으로 기록합니다.
+완료된 trace는 크기가 고정된 링 버퍼에 보관되며 /api/admin/traces 로 조회합니다.
+
+진행 중인 trace가 없으면 span()은 아무것도 기록하지 않으므로
+백그라운드 작업에서 호출되어도 비용이 거의 없습니다.
+
+사용 예:
+    with span('xticket.login', kind='xticket'):
+        ...
+
+    @traced('telegram.send_message', kind='telegram')
+    def deliver(self, message): ...
+"""
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Optional
+
+# trace 하나에 기록할 최대 span 수 (초과분은 개수만 집계)
+MAX_SPANS_PER_TRACE = 200
+
+_current_trace: ContextVar[Optional['Trace']] = ContextVar('current_trace', default=None)
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+
+
+class Span:
+    """trace 내의 개별 작업 구간"""
+
+    __slots__ = ('span_id', 'parent_id', 'name', 'kind', 'start', 'end', 'attrs', 'error')
+
+    def __init__(self, name: str, kind: str, parent_id: Optional[int], attrs: Dict):
+        self.span_id = id(self)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attrs = attrs
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def to_dict(self, trace_start: float) -> Dict:
+        return {
+            'id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'offset_ms': round((self.start - trace_start) * 1000, 2),
+            'duration_ms': round(self.duration_ms, 2),
+            'attrs': self.attrs,
+            'error': self.error
+        }
+
+
+class Trace:
+    """요청(또는 작업) 하나의 span 모음"""
+
+    def __init__(self, name: str, attrs: Optional[Dict] = None):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.attrs = attrs or {}
+        self.started_at = datetime.utcnow()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.status: Optional[str] = None
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self._lock = threading.Lock()
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def add_span(self, span: Span):
+        with self._lock:
+            if len(self.spans) < MAX_SPANS_PER_TRACE:
+                self.spans.append(span)
+            else:
+                self.dropped_spans += 1
+
+    def breakdown(self) -> Dict[str, float]:
+        """종류별 소요 시간 (ms, 최상위 span 기준 - 중첩 span은 부모에 포함)"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            if span.parent_id is None:
+                totals[span.kind] = totals.get(span.kind, 0.0) + span.duration_ms
+
+        result = {kind: round(ms, 2) for kind, ms in totals.items()}
+        result['other'] = round(max(self.duration_ms - sum(totals.values()), 0.0), 2)
+        return result
+
+    def to_dict(self, include_spans: bool = True) -> Dict:
+        data = {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'attrs': self.attrs,
+            'status': self.status,
+            'started_at': self.started_at.isoformat(),
+            'duration_ms': round(self.duration_ms, 2),
+            'span_count': len(self.spans) + self.dropped_spans,
+            'breakdown_ms': self.breakdown()
+        }
+        if include_spans:
+            data['spans'] = [span.to_dict(self.start) for span in self.spans]
+            data['dropped_spans'] = self.dropped_spans
+        return data
+
+
+class TraceBuffer:
+    """최근 완료된 trace 링 버퍼"""
+
+    def __init__(self, size: int = 200):
+        self._traces: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def resize(self, size: int):
+        with self._lock:
+            self._traces = deque(self._traces, maxlen=size)
+
+    def add(self, trace: Trace):
+        with self._lock:
+            self._traces.append(trace)
+
+    def recent(self, limit: int = 20, min_duration_ms: float = 0) -> List[Trace]:
+        """최근 trace (최신순)"""
+        with self._lock:
+            traces = list(self._traces)
+        traces = [t for t in reversed(traces) if t.duration_ms >= min_duration_ms]
+        return traces[:limit]
+
+    def slowest(self, limit: int = 20, min_duration_ms: float = 0) -> List[Trace]:
+        """가장 느린 trace (소요 시간 내림차순)"""
+        with self._lock:
+            traces = list(self._traces)
+        traces = [t for t in traces if t.duration_ms >= min_duration_ms]
+        return sorted(traces, key=lambda t: t.duration_ms, reverse=True)[:limit]
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            for trace in self._traces:
+                if trace.trace_id == trace_id:
+                    return trace
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._traces.clear()
+
+
+# 싱글톤 버퍼
+trace_buffer = TraceBuffer()
+
+
+def current_trace() -> Optional[Trace]:
+    """진행 중인 trace (없으면 None)"""
+    return _current_trace.get()
+
+
+def start_trace(name: str, **attrs):
+    """trace 시작 (finish_trace에 전달할 토큰 반환)"""
+    trace = Trace(name, attrs)
+    return _current_trace.set(trace), _current_span.set(None)
+
+
+def finish_trace(tokens, status: Optional[str] = None) -> Optional[Trace]:
+    """trace 종료 후 링 버퍼에 저장"""
+    trace = _current_trace.get()
+    trace_token, span_token = tokens
+    _current_span.reset(span_token)
+    _current_trace.reset(trace_token)
+
+    if trace is None:
+        return None
+
+    trace.end = time.perf_counter()
+    trace.status = status
+    trace_buffer.add(trace)
+    return trace
+
+
+@contextmanager
+def trace(name: str, **attrs):
+    """with 블록을 하나의 trace로 기록 (백그라운드 작업용)"""
+    tokens = start_trace(name, **attrs)
+    status = 'ok'
+    try:
+        yield _current_trace.get()
+    except Exception:
+        status = 'error'
+        raise
+    finally:
+        finish_trace(tokens, status)
+
+
+@contextmanager
+def span(name: str, kind: str = 'internal', **attrs):
+    """진행 중인 trace에 span 기록 (trace가 없으면 아무것도 하지 않음)"""
+    active = _current_trace.get()
+    if active is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(name, kind, parent.span_id if parent else None, attrs)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(token)
+        active.add_span(current)
+
+
+def traced(name: str, kind: str = 'internal'):
+    """함수 실행을 span으로 기록하는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_listeners_registered = False
+
+
+def init_app(app):
+    """요청별 trace 및 DB 쿼리 span 등록 (TRACING_ENABLED 설정 시)"""
+    global _listeners_registered
+
+    if not app.config.get('TRACING_ENABLED', True):
+        return
+
+    from flask import g, request
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from app.utils.sql_profiler import display_shape, normalize_statement
+
+    trace_buffer.resize(app.config.get('TRACE_BUFFER_SIZE', 200))
+
+    if not _listeners_registered:
+        @event.listens_for(Engine, 'before_cursor_execute')
+        def _start_db_span(conn, cursor, statement, parameters, context, executemany):
+            if context is not None and _current_trace.get() is not None:
+                parent = _current_span.get()
+                context._trace_span = Span('db.query', 'db', parent.span_id if parent else None, {})
+
+        @event.listens_for(Engine, 'after_cursor_execute')
+        def _finish_db_span(conn, cursor, statement, parameters, context, executemany):
+            db_span = getattr(context, '_trace_span', None)
+            active = _current_trace.get()
+            if db_span is None or active is None:
+                return
+            db_span.end = time.perf_counter()
+            db_span.attrs['statement'] = display_shape(normalize_statement(statement))
+            active.add_span(db_span)
+
+        _listeners_registered = True
+
+    @app.before_request
+    def _start_request_trace():
+        g.trace_tokens = start_trace(f"{request.method} {request.path}", endpoint=request.endpoint)
+
+    @app.after_request
+    def _add_trace_header(response):
+        active = _current_trace.get()
+        if active is not None:
+            active.status = str(response.status_code)
+            response.headers['X-Trace-Id'] = active.trace_id
+        return response
+
+    @app.teardown_request
+    def _finish_request_trace(exc):
+        tokens = g.pop('trace_tokens', None)
+        if tokens is None:
+            return
+        active = _current_trace.get()
+        status = 'error' if exc else (active.status if active else None)
+        finish_trace(tokens, status)
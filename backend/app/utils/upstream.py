@@ -0,0 +1,94 @@
+"""
+외부 API 호출 정책 (타임아웃 / 마감 / 서킷 브레이커)
+
+메트릭 기록용 InstrumentedSession 위에 호출 정책만 얹은 Session 입니다.
+
+- connect/read 타임아웃 분리 및 호출자 마감(deadline) 적용 (timeout 미지정 호출 포함)
+- 마감 때문에 줄어든 타임아웃이 만료되면 DeadlineExceeded
+- 서킷 브레이커는 opt-in: 모니터링/조회용 세션(breaker=True)만 호스트별 브레이커를 거칩니다.
+  예약 POST, 로그인, 서버 시간 동기화는 오픈 시각의 5xx 폭주로 회로가 열려도
+  막히지 않도록 브레이커를 쓰지 않습니다 (요청 단위로 breaker=False 지정 가능).
+
+사용 예:
+    session = UpstreamSession('xticket', client=shop_code, breaker=True)
+    session.post(url, data=payload)                 # 브레이커 적용
+    session.post(url, data=payload, breaker=False)  # 예약 요청 등은 제외
+"""
+from urllib.parse import urlparse
+
+import requests
+
+from app.utils.circuit_breaker import STATE_VALUES, CircuitOpenError, circuit_breakers
+from app.utils.deadline import DeadlineExceeded, upstream_timeout
+from app.utils.metrics import (
+    CIRCUIT_BREAKER_REJECTIONS,
+    CIRCUIT_BREAKER_STATE,
+    InstrumentedSession,
+    endpoint_label,
+)
+
+
+class UpstreamSession(InstrumentedSession):
+    """타임아웃/마감/서킷 브레이커 정책을 적용하는 외부 API Session"""
+
+    def __init__(self, upstream: str, client: str = None, timeout=None, breaker: bool = False):
+        """
+        Args:
+            upstream: 메트릭/trace 라벨 (xticket, telegram)
+            client: 클라이언트 라벨 (풀 클라이언트 식별용)
+            timeout: timeout 없이 호출된 요청의 기본 타임아웃 (None이면 UPSTREAM_CONNECT_TIMEOUT / REQUEST_TIMEOUT)
+            breaker: 호스트별 서킷 브레이커 적용 여부 (모니터링/조회용 세션만 True)
+        """
+        super().__init__(upstream, client=client)
+        self.timeout = timeout
+        self.breaker = breaker
+
+    def uses_breaker(self, breaker: bool = None) -> bool:
+        """요청에 브레이커를 적용할지 (요청 단위 지정이 세션 기본값보다 우선)"""
+        return self.breaker if breaker is None else breaker
+
+    def request(self, method, url, *args, breaker: bool = None, **kwargs):
+        kwargs['timeout'], clipped = upstream_timeout(kwargs.get('timeout') or self.timeout)
+
+        if not self.uses_breaker(breaker):
+            try:
+                return super().request(method, url, *args, **kwargs)
+            except requests.Timeout as e:
+                if clipped and not isinstance(e, DeadlineExceeded):
+                    raise DeadlineExceeded(f"Deadline exceeded during {method} {endpoint_label(url)}: {e}") from e
+                raise
+
+        circuit = circuit_breakers.get(urlparse(url).netloc)
+        try:
+            circuit.before_request()
+        except CircuitOpenError:
+            CIRCUIT_BREAKER_REJECTIONS.inc(host=circuit.host)
+            self._record(endpoint_label(url), 'circuit_open')
+            raise
+
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.Timeout as e:
+            if clipped:
+                # 서버 문제가 아니라 호출자 예산이 부족했던 것이므로 브레이커 실패로 세지 않음
+                circuit.release_probe()
+                if isinstance(e, DeadlineExceeded):
+                    raise
+                raise DeadlineExceeded(f"Deadline exceeded during {method} {endpoint_label(url)}: {e}") from e
+            circuit.record_failure(f"{type(e).__name__}: {e}")
+            raise
+        except requests.RequestException as e:
+            circuit.record_failure(f"{type(e).__name__}: {e}")
+            raise
+        except BaseException:
+            # 업스트림 장애가 아닌 예외 (코드 오류, 중단 등) 는 실패로 세지 않고 probe 자리만 반환
+            circuit.release_probe()
+            raise
+        else:
+            if response.status_code >= 500:
+                circuit.record_failure(f"HTTP {response.status_code}")
+            else:
+                circuit.record_success()
+            return response
+        finally:
+            CIRCUIT_BREAKER_STATE.set(STATE_VALUES[circuit.state], host=circuit.host)
@@ -0,0 +1,486 @@
+"""
+벤치마크 실행기
+
+임시 SQLite 파일에 실제 운영 규모의 데이터를 채운 뒤
+모니터링 틱, 직렬화(to_dict), JSON 인코딩, 주요 API 엔드포인트의 소요 시간을 측정합니다.
+XTicket 호출은 로컬 스텁 서버(benchmarks/xticket_stub.py)로 보내므로 네트워크가 필요 없습니다.
+
+결과는 benchmarks/results/ 아래 JSON으로 저장되며,
+--compare 로 이전 결과와 비교해 회귀 여부를 확인할 수 있습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --repeat 10 --stub-latency-ms 20
+    python -m benchmarks.run_benchmarks --only api. --compare benchmarks/results/<이전 결과>.json
+    python -m benchmarks.run_benchmarks --reservations 10000 --targets 200   # 빠른 확인용
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).parent.parent
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+SEAT_CATEGORIES = [
+    ('0001', 'grass', '잔디'),
+    ('0002', 'deck', '데크'),
+    ('0003', 'crushed_stone', '파쇄석'),
+]
+RESERVATION_STATUSES = ['monitoring', 'available', 'reserved', 'failed']
+SCHEDULE_STATUSES = ['pending', 'completed', 'failed', 'cancelled']
+
+
+def _git_commit() -> Optional[str]:
+    """현재 git 커밋 해시 (git이 없으면 None)"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def measure(fn: Callable, repeat: int, warmup: int = 1, setup: Callable = None) -> Dict:
+    """함수 실행 시간 측정
+
+    Args:
+        fn: 측정할 함수
+        repeat: 측정 횟수
+        warmup: 측정 전 워밍업 횟수
+        setup: 매 실행 전 호출할 준비 함수 (측정 시간에서 제외)
+
+    Returns:
+        Dict: 실행 시간 통계 (ms)
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        'repeat': repeat,
+        'min_ms': round(samples[0], 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'mean_ms': round(statistics.mean(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'max_ms': round(samples[-1], 3),
+    }
+
+
+def seed_database(db, sizes: Dict[str, int], seed: int = 0):
+    """벤치마크용 데이터 생성 (bulk insert)
+
+    Args:
+        db: SQLAlchemy 인스턴스
+        sizes: 테이블별 생성 개수 (sites, targets, reservations, schedules, seats_per_site, accounts_per_site)
+        seed: 난수 시드
+    """
+    from app.models.database import (
+        AppSettings, CampingSite, CampingSiteAccount, CampingSiteSeat,
+        MonitoringTarget, Reservation, ReservationSchedule
+    )
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    today = date.today()
+
+    def insert(model, rows: List[Dict]):
+        if rows:
+            db.session.execute(db.insert(model), rows)
+
+    # 알림이 아웃박스로 적재되도록 텔레그램 설정 (실제 전송은 하지 않음)
+    db.session.add(AppSettings(telegram_bot_token='0:benchmark', telegram_chat_id='0'))
+
+    insert(CampingSite, [
+        {
+            'id': site_id,
+            'name': f'벤치마크 캠핑장 {site_id:02d}',
+            'site_type': 'xticket',
+            'url': f'https://camp.xticket.kr/web/main?shopEncode=bench{site_id:04d}',
+            'shop_encode': f'bench{site_id:04d}',
+            'shop_code': f'bench{site_id:04d}',
+            'created_at': now,
+        }
+        for site_id in range(1, sizes['sites'] + 1)
+    ])
+
+    site_ids = list(range(1, sizes['sites'] + 1))
+
+    insert(CampingSiteAccount, [
+        {
+            'camping_site_id': site_id,
+            'login_username': f'user{site_id}_{n}',
+            'login_password': 'password',
+            'booker_name': '홍길동',
+            'booker_phone': '01012345678',
+            'is_active': True,
+            'priority': n,
+            'created_at': now,
+            'updated_at': now,
+        }
+        for site_id in site_ids
+        for n in range(sizes['accounts_per_site'])
+    ])
+
+    seat_rows = []
+    for site_id in site_ids:
+        for n in range(sizes['seats_per_site']):
+            group_code, category, label = SEAT_CATEGORIES[n % len(SEAT_CATEGORIES)]
+            seat_rows.append({
+                'camping_site_id': site_id,
+                'product_code': f'{group_code}{n + 1:04d}',
+                'product_group_code': group_code,
+                'seat_name': f'{label}-{n + 1:02d}',
+                'seat_category': category,
+                'display_order': n,
+                'created_at': now,
+                'updated_at': now,
+            })
+    insert(CampingSiteSeat, seat_rows)
+
+    # 타겟은 (캠핑장, 날짜) 조합이 겹치지 않도록 향후 날짜에 분산
+    insert(MonitoringTarget, [
+        {
+            'camping_site_id': site_ids[n % len(site_ids)],
+            'target_date': today + timedelta(days=1 + n // len(site_ids)),
+            'is_active': True,
+            'notification_sent': False,
+            'last_status': 'unavailable',
+            'created_at': now,
+        }
+        for n in range(sizes['targets'])
+    ])
+
+    batch = []
+    for n in range(sizes['reservations']):
+        check_in = today + timedelta(days=rng.randint(-365, 90))
+        batch.append({
+            'camping_site_id': rng.choice(site_ids),
+            'check_in_date': check_in,
+            'check_out_date': check_in + timedelta(days=1),
+            'status': rng.choice(RESERVATION_STATUSES),
+            'created_at': now - timedelta(minutes=n),
+            'updated_at': now,
+        })
+        if len(batch) >= 10000:
+            insert(Reservation, batch)
+            batch = []
+    insert(Reservation, batch)
+
+    seats_per_site = sizes['seats_per_site']
+    accounts_per_site = sizes['accounts_per_site']
+    schedule_rows = []
+    for n in range(sizes['schedules']):
+        site_id = rng.choice(site_ids)
+        first_seat = (site_id - 1) * seats_per_site + 1
+        first_account = (site_id - 1) * accounts_per_site + 1
+        status = rng.choice(SCHEDULE_STATUSES)
+        executed = status in ('completed', 'failed')
+        attempts = [
+            {'account_id': first_account, 'seat_id': first_seat, 'success': False, 'elapsed_ms': rng.randint(20, 400)}
+            for _ in range(rng.randint(1, 10))
+        ] if executed else []
+        schedule_rows.append({
+            'camping_site_id': site_id,
+            'execute_at': now + timedelta(hours=rng.randint(-24 * 30, 24 * 30)),
+            'target_date': today + timedelta(days=rng.randint(1, 60)),
+            'seat_ids': rng.sample(range(first_seat, first_seat + seats_per_site), min(3, seats_per_site)),
+            'account_ids': list(range(first_account, first_account + accounts_per_site)),
+            'status': status,
+            'result': {'success': status == 'completed', 'attempts': attempts} if executed else None,
+            'result_success': status == 'completed' if executed else None,
+            'result_duration_ms': sum(attempt['elapsed_ms'] for attempt in attempts) if executed else None,
+            'result_accounts_attempted': len(attempts) if executed else None,
+            'created_at': now,
+            'updated_at': now,
+        })
+    insert(ReservationSchedule, schedule_rows)
+
+    db.session.commit()
+
+
+def run(args) -> Dict:
+    """벤치마크 실행 후 결과 반환"""
+    from benchmarks.xticket_stub import XTicketStubServer
+
+    stub = XTicketStubServer(latency_ms=args.stub_latency_ms, seed=args.seed).start()
+
+    db_dir = tempfile.mkdtemp(prefix='camping-bench-')
+    db_path = Path(db_dir) / 'bench.db'
+
+    # 앱 import 전에 환경 설정 (스크래퍼/설정이 import 시점에 환경변수를 읽음)
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    os.environ['XTICKET_BASE_URL'] = stub.base_url
+    os.environ.setdefault('XTICKET_SHOP_ENCODE', 'benchmark')
+    os.environ.setdefault('XTICKET_SHOP_CODE', 'benchmark')
+    os.environ['MAX_RETRIES'] = '1'
+    os.environ['LOG_LEVEL'] = os.getenv('BENCHMARK_LOG_LEVEL', 'WARNING')
+    os.environ['LOG_FILE'] = str(Path(db_dir) / 'bench.log')
+
+    from config import Config, config
+
+    class BenchmarkConfig(Config):
+        """벤치마크 설정 (백그라운드 스케줄러/디스패처 및 rate limit 비활성화)"""
+        DEBUG = True
+        RATELIMIT_ENABLED = False
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+
+    config['benchmark'] = BenchmarkConfig
+
+    from loguru import logger
+    from app import create_app, db
+    from app.models.database import (
+        CampingSite, MonitoringTarget, NotificationOutbox, Reservation, ReservationSchedule
+    )
+
+    app = create_app('benchmark')
+    sizes = {
+        'sites': args.sites,
+        'targets': args.targets,
+        'reservations': args.reservations,
+        'schedules': args.schedules,
+        'seats_per_site': args.seats_per_site,
+        'accounts_per_site': args.accounts_per_site,
+    }
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, stats: Dict, **extra):
+        stats.update(extra)
+        results[name] = stats
+        print(f"  {name:<40} median {stats['median_ms']:>10.2f} ms   p95 {stats['p95_ms']:>10.2f} ms")
+
+    try:
+        with app.app_context():
+            start = time.perf_counter()
+            seed_database(db, sizes, seed=args.seed)
+            print(f"🌱 Seeded {db_path} in {time.perf_counter() - start:.1f}s "
+                  f"({', '.join(f'{k}={v}' for k, v in sizes.items())})")
+
+        def selected(name: str) -> bool:
+            return not args.only or any(name.startswith(prefix) for prefix in args.only)
+
+        # ----- 모니터링 틱 -----
+        if selected('monitor.check_all_targets'):
+            from app.api.routes import monitor_service
+
+            def reset_targets():
+                # 매 틱마다 일부 타겟이 '예약 가능'으로 바뀌도록 상태 초기화
+                MonitoringTarget.query.update({'last_status': 'unavailable', 'notification_sent': False})
+                NotificationOutbox.query.delete()
+                db.session.commit()
+
+            with app.app_context():
+                stub.request_counts.clear()
+                stats = measure(monitor_service.check_all_targets, args.tick_repeat, warmup=0, setup=reset_targets)
+                upstream_requests = sum(stub.request_counts.values()) // args.tick_repeat
+                record('monitor.check_all_targets', stats,
+                       targets=args.targets, upstream_requests_per_tick=upstream_requests)
+
+        # ----- 직렬화 -----
+        with app.app_context():
+            from sqlalchemy.orm import joinedload
+            from app.models.database import serialize_schedules
+
+            serializers = {
+                'serialize.camping_site': lambda: CampingSite.query.all(),
+                'serialize.monitoring_target': lambda: MonitoringTarget.query.all(),
+                'serialize.reservation': lambda: Reservation.query.limit(args.serialize_limit).all(),
+                'serialize.reservation_schedule': lambda: ReservationSchedule.query.all(),
+            }
+            for name, load in serializers.items():
+                if not selected(name):
+                    continue
+                objects = load()
+                for obj in objects:
+                    obj.to_dict()  # 지연 로딩 관계를 미리 로드해 순수 직렬화 비용만 측정
+                stats = measure(lambda: [obj.to_dict() for obj in objects], args.repeat)
+                record(name, stats, objects=len(objects))
+                db.session.expunge_all()
+
+            # 목록 응답 경로 (관계 eager load 후 to_dict, 스케줄 좌석은 IN 쿼리 1회)
+            many_serializers = {
+                'serialize_many.monitoring_target': lambda: [
+                    target.to_dict() for target in
+                    MonitoringTarget.query.options(joinedload(MonitoringTarget.camping_site)).all()
+                ],
+                'serialize_many.reservation': lambda: [
+                    reservation.to_dict() for reservation in
+                    Reservation.query.options(joinedload(Reservation.camping_site)).limit(args.serialize_limit).all()
+                ],
+                'serialize_many.reservation_schedule': lambda: serialize_schedules(
+                    ReservationSchedule.query.options(joinedload(ReservationSchedule.camping_site)).all()
+                ),
+            }
+            for name, serialize in many_serializers.items():
+                if not selected(name):
+                    continue
+                objects = serialize()
+                stats = measure(serialize, args.repeat, setup=db.session.expunge_all)
+                record(name, stats, objects=len(objects))
+                db.session.expunge_all()
+
+            # JSON 인코딩 (표준 json vs 앱 JSON 프로바이더)
+            if selected('json.'):
+                payload = [r.to_dict() for r in Reservation.query.limit(args.serialize_limit).all()]
+                db.session.expunge_all()
+                encoders = {
+                    'json.reservations.stdlib': lambda: json.dumps(payload, separators=(',', ':'), sort_keys=True),
+                    'json.reservations.provider': lambda: app.json.dumps(payload),
+                }
+                for name, encode in encoders.items():
+                    if selected(name):
+                        record(name, measure(encode, args.repeat), objects=len(payload), bytes=len(encode()))
+
+        # ----- API 엔드포인트 -----
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+            sess['username'] = 'admin'
+
+        endpoints = {
+            'api.reservations': '/api/reservations',
+            'api.schedules': '/api/schedules',
+            'api.statistics': '/api/statistics',
+            'api.camping_site_seats': '/api/camping-sites/1/seats',
+        }
+        for name, path in endpoints.items():
+            if not selected(name):
+                continue
+
+            response_sizes = []
+
+            def request():
+                response = client.get(path)
+                assert response.status_code == 200, f"{path} -> {response.status_code}"
+                response_sizes.append(len(response.data))
+
+            repeat = args.repeat if name != 'api.reservations' else max(1, args.repeat // 2)
+            stats = measure(request, repeat)
+            record(name, stats, path=path, response_bytes=response_sizes[-1])
+
+        # gzip 응답 (Accept-Encoding: gzip)
+        if selected('api.reservations_gzip'):
+            response_sizes = []
+
+            def request_gzip():
+                response = client.get('/api/reservations', headers={'Accept-Encoding': 'gzip'})
+                assert response.status_code == 200, f"/api/reservations -> {response.status_code}"
+                response_sizes.append((len(response.data), response.headers.get('Content-Encoding')))
+
+            stats = measure(request_gzip, max(1, args.repeat // 2))
+            record('api.reservations_gzip', stats, path='/api/reservations',
+                   response_bytes=response_sizes[-1][0], content_encoding=response_sizes[-1][1])
+    finally:
+        stub.stop()
+        with app.app_context():
+            db.engine.dispose()
+        # 임시 디렉토리의 로그 파일 싱크를 해제한 뒤 삭제
+        logger.remove()
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'stub_latency_ms': args.stub_latency_ms,
+            'repeat': args.repeat,
+            'tick_repeat': args.tick_repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """이전 결과와 비교 (median 기준)
+
+    Returns:
+        List[str]: threshold(%) 이상 느려진 벤치마크 이름 목록
+    """
+    regressions = []
+    print(f"\n📊 Compare with {baseline['meta'].get('git_commit')} ({baseline['meta'].get('timestamp')})")
+    print(f"  {'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>9}")
+
+    for name, stats in current['results'].items():
+        base = baseline['results'].get(name)
+        if not base:
+            print(f"  {name:<40} {'-':>12} {stats['median_ms']:>10.2f}ms {'new':>9}")
+            continue
+
+        change = (stats['median_ms'] - base['median_ms']) / base['median_ms'] * 100 if base['median_ms'] else 0.0
+        flag = ''
+        if change >= threshold:
+            flag = ' ⚠️'
+            regressions.append(name)
+        print(f"  {name:<40} {base['median_ms']:>10.2f}ms {stats['median_ms']:>10.2f}ms {change:>+8.1f}%{flag}")
+
+    if baseline['meta'].get('sizes') != current['meta'].get('sizes'):
+        print("  ⚠️ dataset sizes differ from baseline")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캠핑 예약 백엔드 벤치마크')
+    parser.add_argument('--sites', type=int, default=50)
+    parser.add_argument('--targets', type=int, default=2000)
+    parser.add_argument('--reservations', type=int, default=100000)
+    parser.add_argument('--schedules', type=int, default=1000)
+    parser.add_argument('--seats-per-site', type=int, default=60)
+    parser.add_argument('--accounts-per-site', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5, help='벤치마크별 측정 횟수')
+    parser.add_argument('--tick-repeat', type=int, default=3, help='모니터링 틱 측정 횟수')
+    parser.add_argument('--serialize-limit', type=int, default=10000, help='직렬화 측정에 사용할 예약 수')
+    parser.add_argument('--stub-latency-ms', type=float, default=0, help='스텁 서버 응답 지연')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', help='이름이 접두어와 일치하는 벤치마크만 실행 (예: api. serialize.)')
+    parser.add_argument('--output', help='결과 파일 경로 (기본: benchmarks/results/<시각>_<커밋>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 파일')
+    parser.add_argument('--threshold', type=float, default=10.0, help='회귀로 판단할 median 증가율 (%%)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀 발견 시 종료 코드 1')
+    args = parser.parse_args()
+
+    print("🏁 Running benchmarks")
+    result = run(args)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}_{result['meta']['git_commit'] or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n💾 Results saved: {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        regressions = compare(result, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(BACKEND_DIR))
+    main()
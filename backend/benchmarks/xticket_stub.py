@@ -0,0 +1,410 @@
+"""
+XTicket 오프라인 스텁 서버
+
+camp.xticket.kr 대신 로컬에서 응답하는 HTTP 서버입니다.
+네트워크 없이 모니터링/API 코드 경로를 반복 측정하기 위해 사용합니다.
+
+지원 엔드포인트 (조회 전용):
+- GET  /web/main                          (Date 헤더 - 서버 시간 동기화)
+- POST /Web/Book/GetBookPlayDate.json
+- POST /Web/Book/GetBookProductGroup.json
+- POST /Web/Book/GetBookProduct010001.json
+- POST /Web/Book/GetShopInformation.json
+
+응답은 fixtures/xticket/ 아래의 기록된 JSON을 재생하고,
+기록이 없는 월/시설 그룹은 시드 기반으로 결정적으로 생성합니다.
+
+사용법:
+    # 스텁 서버 실행 (지연 80ms, 5% 확률로 500 에러)
+    python -m benchmarks.xticket_stub serve --port 8765 --latency-ms 80 --error-rate 0.05
+
+    # 실제 서버 응답을 fixture로 기록
+    python -m benchmarks.xticket_stub record --months 202511 202512
+
+    # 앱/스크래퍼가 스텁을 사용하도록 설정
+    XTICKET_BASE_URL=http://127.0.0.1:8765
+"""
+import argparse
+import calendar
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'xticket'
+
+# 경로(소문자) -> 엔드포인트 이름
+ENDPOINTS = {
+    '/web/main': 'main',
+    '/web/book/getbookplaydate.json': 'GetBookPlayDate',
+    '/web/book/getbookproductgroup.json': 'GetBookProductGroup',
+    '/web/book/getbookproduct010001.json': 'GetBookProduct010001',
+    '/web/book/getshopinformation.json': 'GetShopInformation',
+}
+
+ERROR_MODES = ('500', 'timeout', 'reset')
+
+
+class FixtureStore:
+    """기록된 응답 fixture 조회 및 미기록 응답 생성"""
+
+    def __init__(self, fixtures_dir: Path = DEFAULT_FIXTURES_DIR, seed: int = 0):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.seed = seed
+        self._cache: Dict[Path, Optional[dict]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, *parts: str) -> Optional[dict]:
+        """fixture 파일 로드 (없으면 None, 결과 캐시)"""
+        path = self.fixtures_dir.joinpath(*parts)
+        with self._lock:
+            if path not in self._cache:
+                self._cache[path] = json.loads(path.read_text(encoding='utf-8')) if path.exists() else None
+            return self._cache[path]
+
+    def play_dates(self, play_month: str) -> dict:
+        """월별 예약 가능 날짜"""
+        recorded = self._load('GetBookPlayDate', f'{play_month}.json')
+        if recorded is not None:
+            return recorded
+
+        year, month = int(play_month[:4]), int(play_month[4:6])
+        rng = random.Random(f"{self.seed}-{play_month}")
+        days = calendar.monthrange(year, month)[1]
+        return {
+            'data': {
+                'bookPlayDateList': [
+                    {
+                        'play_date': f"{play_month}{day:02d}",
+                        # 약 70%는 매진, 나머지는 잔여 1~60
+                        'book_remain_count': 0 if rng.random() < 0.7 else rng.randint(1, 60),
+                        'advance_yn': '0'
+                    }
+                    for day in range(1, days + 1)
+                ]
+            }
+        }
+
+    def product_groups(self) -> dict:
+        """시설 그룹 목록"""
+        return self._load('GetBookProductGroup.json') or {'data': {'bookProductGroupList': []}}
+
+    def products(self, product_group_code: str, start_date: str) -> dict:
+        """시설 그룹의 개별 사이트 목록"""
+        recorded = (self._load('GetBookProduct010001', f'{product_group_code}_{start_date}.json')
+                    or self._load('GetBookProduct010001', f'{product_group_code}.json'))
+
+        if recorded is None:
+            recorded = {
+                'data': {
+                    'bookProductList': [
+                        {
+                            'product_code': f"{product_group_code}{number:04d}",
+                            'product_name': f"사이트-{number:02d}",
+                            'product_group_code': product_group_code,
+                            'select_yn': '1',
+                            'sale_product_fee': 30000
+                        }
+                        for number in range(1, 21)
+                    ]
+                }
+            }
+
+        # 날짜별로 선택 가능 여부를 결정적으로 변경
+        rng = random.Random(f"{self.seed}-{product_group_code}-{start_date}")
+        products = []
+        for product in recorded.get('data', {}).get('bookProductList', []):
+            product = dict(product)
+            if rng.random() < 0.7:
+                product['select_yn'] = '0'
+                product['sale_product_fee'] = 0
+            products.append(product)
+
+        return {'data': {'bookProductList': products}}
+
+    def shop_information(self) -> dict:
+        """캠핑장 기본 정보"""
+        return self._load('GetShopInformation.json') or {'data': {}}
+
+
+class XTicketStubServer:
+    """
+    XTicket 스텁 HTTP 서버
+
+    Features:
+    - 기록된 fixture 재생 (미기록 시 결정적 생성)
+    - 응답 지연 (고정 + jitter)
+    - 에러 주입 (500 응답, 타임아웃, 연결 끊기)
+    - 엔드포인트별 요청 수 집계
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 fixtures_dir: Path = DEFAULT_FIXTURES_DIR,
+                 latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, error_mode: str = '500',
+                 hang_seconds: float = 60, seed: int = 0):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            fixtures_dir: fixture 디렉토리
+            latency_ms: 모든 응답에 추가할 지연 (ms)
+            jitter_ms: 지연에 더할 무작위 편차 (0~jitter_ms)
+            error_rate: 에러 주입 확률 (0.0~1.0)
+            error_mode: 주입할 에러 종류 (500, timeout, reset)
+            hang_seconds: timeout 모드에서 응답을 보류할 시간 (초)
+            seed: fixture 생성 및 에러 주입 난수 시드
+        """
+        if error_mode not in ERROR_MODES:
+            raise ValueError(f"error_mode must be one of {ERROR_MODES}")
+
+        self.fixtures = FixtureStore(fixtures_dir, seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_mode = error_mode
+        self.hang_seconds = hang_seconds
+
+        self.request_counts: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """스텁 서버 주소 (XTICKET_BASE_URL 값으로 사용)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'XTicketStubServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="XTicketStub",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self.error_rate > 0 and self._rng.random() < self.error_rate
+
+    def _delay(self):
+        if self.latency_ms or self.jitter_ms:
+            with self._lock:
+                jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive 지원
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연(ACK 대기) 방지
+
+            def log_message(self, format, *args):
+                pass
+
+            def _endpoint(self) -> Optional[str]:
+                return ENDPOINTS.get(urlparse(self.path).path.lower())
+
+            def _send_json(self, status: int, body: dict):
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _inject_error(self) -> bool:
+                """에러 주입 (주입했으면 True)"""
+                if not server._should_fail():
+                    return False
+
+                if server.error_mode == '500':
+                    self._send_json(500, {'error': {'message': 'Injected server error'}})
+                elif server.error_mode == 'timeout':
+                    time.sleep(server.hang_seconds)
+                    self.close_connection = True
+                else:
+                    # 응답 없이 연결 끊기
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    self.close_connection = True
+                return True
+
+            def _handle(self, endpoint: Optional[str], form: Dict[str, str]):
+                with server._lock:
+                    server.request_counts[endpoint or 'unknown'] += 1
+
+                server._delay()
+
+                if endpoint is None:
+                    self._send_json(404, {'error': {'message': 'Not found'}})
+                    return
+
+                if self._inject_error():
+                    return
+
+                fixtures = server.fixtures
+                if endpoint == 'main':
+                    payload = b'<html><body>xticket stub</body></html>'
+                    self.send_response(200)  # Date 헤더 자동 포함
+                    self.send_header('Content-Type', 'text/html; charset=UTF-8')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                elif endpoint == 'GetBookPlayDate':
+                    self._send_json(200, fixtures.play_dates(form.get('play_month', time.strftime('%Y%m'))))
+                elif endpoint == 'GetBookProductGroup':
+                    self._send_json(200, fixtures.product_groups())
+                elif endpoint == 'GetBookProduct010001':
+                    self._send_json(200, fixtures.products(
+                        form.get('product_group_code', '0004'),
+                        form.get('start_date', time.strftime('%Y%m%d'))
+                    ))
+                elif endpoint == 'GetShopInformation':
+                    self._send_json(200, fixtures.shop_information())
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                self._handle(self._endpoint(), {k: v[0] for k, v in query.items()})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length).decode('utf-8') if length else ''
+                form = {k: v[0] for k, v in parse_qs(body).items()}
+                self._handle(self._endpoint(), form)
+
+        return Handler
+
+
+def record_fixtures(shop_encode: str, shop_code: str, months: list,
+                    fixtures_dir: Path = DEFAULT_FIXTURES_DIR):
+    """실제 XTicket 서버의 조회 응답을 fixture로 기록
+
+    Args:
+        shop_encode: 캠핑장 shopEncode
+        shop_code: 캠핑장 shopCode
+        months: 기록할 월 목록 (YYYYMM)
+        fixtures_dir: 저장 디렉토리
+    """
+    from app.scrapers.xticket_scraper import XTicketScraper
+
+    scraper = XTicketScraper(shop_encode, shop_code, base_url="https://camp.xticket.kr")
+    fixtures_dir = Path(fixtures_dir)
+
+    def save(data: dict, *parts: str):
+        path = fixtures_dir.joinpath(*parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"📝 {path.relative_to(fixtures_dir)}")
+
+    def post(endpoint: str, payload: dict) -> dict:
+        response = scraper._make_request_with_retry('POST', f"{scraper.BASE_URL}/Web/Book/{endpoint}.json", data=payload)
+        return response.json()
+
+    shop_info = post('GetShopInformation', {'shop_encode': shop_encode})
+    save(shop_info, 'GetShopInformation.json')
+
+    for play_month in months:
+        save(post('GetBookPlayDate', {'play_month': play_month}), 'GetBookPlayDate', f'{play_month}.json')
+
+    first_month = months[0]
+    year, month = int(first_month[:4]), int(first_month[4:6])
+    last_day = calendar.monthrange(year, month)[1]
+    groups = post('GetBookProductGroup', {'start_date': f"{first_month}01", 'end_date': f"{first_month}{last_day}"})
+    save(groups, 'GetBookProductGroup.json')
+
+    for group in groups.get('data', {}).get('bookProductGroupList', []):
+        code = group['product_group_code']
+        products = post('GetBookProduct010001', {
+            'product_group_code': code,
+            'start_date': f"{first_month}01",
+            'end_date': f"{first_month}01",
+            'book_days': 1,
+            'two_stay_days': 0,
+            'shopCode': shop_code
+        })
+        save(products, 'GetBookProduct010001', f'{code}.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='XTicket 오프라인 스텁 서버')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve = subparsers.add_parser('serve', help='스텁 서버 실행')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--fixtures', default=str(DEFAULT_FIXTURES_DIR))
+    serve.add_argument('--latency-ms', type=float, default=0)
+    serve.add_argument('--jitter-ms', type=float, default=0)
+    serve.add_argument('--error-rate', type=float, default=0.0)
+    serve.add_argument('--error-mode', choices=ERROR_MODES, default='500')
+    serve.add_argument('--hang-seconds', type=float, default=60)
+    serve.add_argument('--seed', type=int, default=0)
+
+    record = subparsers.add_parser('record', help='실제 서버 응답을 fixture로 기록')
+    record.add_argument('--shop-encode', default=os.getenv('XTICKET_SHOP_ENCODE'))
+    record.add_argument('--shop-code', default=os.getenv('XTICKET_SHOP_CODE'))
+    record.add_argument('--months', nargs='+', required=True, help='YYYYMM 목록')
+    record.add_argument('--fixtures', default=str(DEFAULT_FIXTURES_DIR))
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        if not args.shop_encode or not args.shop_code:
+            parser.error('--shop-encode/--shop-code (또는 XTICKET_SHOP_ENCODE/XTICKET_SHOP_CODE) 필요')
+        record_fixtures(args.shop_encode, args.shop_code, args.months, Path(args.fixtures))
+        return
+
+    server = XTicketStubServer(
+        host=args.host,
+        port=args.port,
+        fixtures_dir=Path(args.fixtures),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_mode=args.error_mode,
+        hang_seconds=args.hang_seconds,
+        seed=args.seed
+    )
+    print(f"🏕️ XTicket stub server: {server.base_url}")
+    print(f"   XTICKET_BASE_URL={server.base_url}")
+
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    # backend 디렉토리를 Python 경로에 추가 (record 명령에서 app 패키지 사용)
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    main()
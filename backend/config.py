@@ -18,6 +18,25 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # SQL 프로파일링 (요청별 쿼리 수/시간 헤더 및 N+1 의심 로그, 개발/진단용)
+    SQL_PROFILING = os.getenv('SQL_PROFILING', 'false').lower() == 'true'
+    SQL_PROFILING_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_PROFILING_N_PLUS_ONE_THRESHOLD', 5))
+
+    # 요청 추적 (최근 trace를 메모리 링 버퍼에 보관, /api/admin/traces)
+    TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'true').lower() == 'true'
+    TRACE_BUFFER_SIZE = int(os.getenv('TRACE_BUFFER_SIZE', 200))
+
+    # API 요청당 외부 호출 전체 시간 예산 (초, 0이면 미적용)
+    API_REQUEST_DEADLINE_SECONDS = float(os.getenv('API_REQUEST_DEADLINE_SECONDS', 25))
+    # 모니터링 틱 하나의 외부 호출 전체 예산 (초, 다음 틱 전에 끝나도록 간격보다 짧게)
+    MONITOR_TICK_DEADLINE_SECONDS = float(os.getenv('MONITOR_TICK_DEADLINE_SECONDS', 50))
+    # 스케줄 작업(워밍업/예약) 하나의 외부 호출 전체 예산 (초, 예약 작업은 예약 시각까지 대기 시간 별도)
+    JOB_DEADLINE_SECONDS = float(os.getenv('JOB_DEADLINE_SECONDS', 300))
+
+    # 응답 gzip 압축 (이 크기 이상인 JSON/텍스트 응답만, 0이면 미적용)
+    RESPONSE_GZIP_MIN_BYTES = int(os.getenv('RESPONSE_GZIP_MIN_BYTES', 1024))
+    RESPONSE_GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', 6))
+
     # CORS
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
 
@@ -25,6 +44,17 @@ class Config:
     TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
     TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
+    # 알림 아웃박스 디스패처
+    NOTIFICATION_DISPATCH_INTERVAL = int(os.getenv('NOTIFICATION_DISPATCH_INTERVAL', 5))  # 초
+    NOTIFICATION_BATCH_SIZE = int(os.getenv('NOTIFICATION_BATCH_SIZE', 20))
+    NOTIFICATION_RETRY_BASE_SECONDS = int(os.getenv('NOTIFICATION_RETRY_BASE_SECONDS', 5))
+    NOTIFICATION_RETRY_MAX_SECONDS = int(os.getenv('NOTIFICATION_RETRY_MAX_SECONDS', 300))
+    NOTIFICATION_LEASE_SECONDS = int(os.getenv('NOTIFICATION_LEASE_SECONDS', 60))  # 전송 선점 유지 시간
+
+    # 알림 다이제스트 (0이면 모니터링 틱 단위로 묶어서 전송)
+    NOTIFICATION_DIGEST_WINDOW = int(os.getenv('NOTIFICATION_DIGEST_WINDOW', 0))  # 초
+    NOTIFICATION_DIGEST_GROUP_BY_SITE = os.getenv('NOTIFICATION_DIGEST_GROUP_BY_SITE', 'true').lower() == 'true'
+
     # XTicket (생림오토 캠핑장 등)
     XTICKET_SHOP_ENCODE = os.getenv('XTICKET_SHOP_ENCODE')
     XTICKET_SHOP_CODE = os.getenv('XTICKET_SHOP_CODE')
@@ -32,10 +62,26 @@ class Config:
     XTICKET_PASSWORD = os.getenv('XTICKET_PASSWORD')
     XTICKET_DRY_RUN = os.getenv('XTICKET_DRY_RUN', 'true').lower() == 'true'
 
+    # 메트릭 (/api/metrics) - 설정 시 Bearer 토큰으로 접근, 없으면 로그인 세션 필요
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
     # 모니터링 설정
     MONITORING_INTERVAL = int(os.getenv('MONITORING_INTERVAL', 60))  # 초
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
-    REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 30))  # 초
+    REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 30))  # 응답 대기(read) 타임아웃 (초)
+    UPSTREAM_CONNECT_TIMEOUT = float(os.getenv('UPSTREAM_CONNECT_TIMEOUT', 3.05))  # 연결(connect) 타임아웃 (초)
+
+    # XTicket 클라이언트 풀 (캠핑장별 keep-alive 세션)
+    XTICKET_POOL_MAX_CLIENTS = int(os.getenv('XTICKET_POOL_MAX_CLIENTS', 32))
+    XTICKET_POOL_IDLE_SECONDS = int(os.getenv('XTICKET_POOL_IDLE_SECONDS', 1800))
+
+    # 실시간 업스트림 조회 API 격벽 (동시 실행 수 / 자리 대기 시간(초))
+    UPSTREAM_PROXY_MAX_CONCURRENT = int(os.getenv('UPSTREAM_PROXY_MAX_CONCURRENT', 4))
+    UPSTREAM_PROXY_QUEUE_TIMEOUT = float(os.getenv('UPSTREAM_PROXY_QUEUE_TIMEOUT', 0.5))
+
+    # 호스트별 서킷 브레이커 (연속 실패 수 / open 유지 시간(초))
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5))
+    CIRCUIT_BREAKER_RECOVERY_SECONDS = float(os.getenv('CIRCUIT_BREAKER_RECOVERY_SECONDS', 30))
 
     # 스케줄링 설정
     RESERVATION_SCHEDULE_ENABLED = os.getenv('RESERVATION_SCHEDULE_ENABLED', 'false').lower() == 'true'
@@ -51,6 +97,43 @@ class Config:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     # backend/logs/app.log 경로 사용
     LOG_FILE = os.getenv('LOG_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'app.log'))
+    LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', 30))  # 지난 로그는 gzip 압축 보관
+
+    # DB 유지보수 (매일 MAINTENANCE_HOUR 시부터 MAINTENANCE_WINDOW_MINUTES 동안)
+    MAINTENANCE_ENABLED = os.getenv('MAINTENANCE_ENABLED', 'true').lower() == 'true'
+    MAINTENANCE_HOUR = int(os.getenv('MAINTENANCE_HOUR', 4))
+    MAINTENANCE_WINDOW_MINUTES = int(os.getenv('MAINTENANCE_WINDOW_MINUTES', 120))
+    MAINTENANCE_BATCH_SIZE = int(os.getenv('MAINTENANCE_BATCH_SIZE', 1000))
+    MAINTENANCE_VACUUM_MAX_PAGES = int(os.getenv('MAINTENANCE_VACUUM_MAX_PAGES', 0))  # 0이면 빈 페이지 전부
+    # backend/data/archive 경로 사용
+    MAINTENANCE_ARCHIVE_DIR = os.getenv(
+        'MAINTENANCE_ARCHIVE_DIR',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'archive')
+    )
+
+    # 보존 기간 (일, 0이면 정리하지 않음)
+    RETENTION_RESERVATIONS_DAYS = int(os.getenv('RETENTION_RESERVATIONS_DAYS', 365))
+    RETENTION_SCHEDULES_DAYS = int(os.getenv('RETENTION_SCHEDULES_DAYS', 365))
+    RETENTION_SCHEDULE_RESULTS_DAYS = int(os.getenv('RETENTION_SCHEDULE_RESULTS_DAYS', 90))
+    RETENTION_AVAILABILITY_HISTORY_DAYS = int(os.getenv('RETENTION_AVAILABILITY_HISTORY_DAYS', 30))
+    RETENTION_AVAILABILITY_DAILY_DAYS = int(os.getenv('RETENTION_AVAILABILITY_DAILY_DAYS', 730))
+    RETENTION_PAST_TARGETS_DAYS = int(os.getenv('RETENTION_PAST_TARGETS_DAYS', 30))
+    RETENTION_NOTIFICATIONS_DAYS = int(os.getenv('RETENTION_NOTIFICATIONS_DAYS', 14))
+
+    # SQLite 온라인 백업 (매일 BACKUP_HOUR 시)
+    BACKUP_ENABLED = os.getenv('BACKUP_ENABLED', 'true').lower() == 'true'
+    BACKUP_HOUR = int(os.getenv('BACKUP_HOUR', 3))
+    # backend/data/backups 경로 사용
+    BACKUP_DIR = os.getenv('BACKUP_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'backups'))
+    BACKUP_PAGES_PER_STEP = int(os.getenv('BACKUP_PAGES_PER_STEP', 256))
+    BACKUP_STEP_SLEEP_MS = int(os.getenv('BACKUP_STEP_SLEEP_MS', 10))
+    BACKUP_COMPRESS = os.getenv('BACKUP_COMPRESS', 'true').lower() == 'true'
+    BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', 7))
+
+    # 좌석 카탈로그 동기화 (매일 SEAT_SYNC_HOUR 시 30분)
+    SEAT_SYNC_ENABLED = os.getenv('SEAT_SYNC_ENABLED', 'true').lower() == 'true'
+    SEAT_SYNC_HOUR = int(os.getenv('SEAT_SYNC_HOUR', 5))
+    SEAT_SYNC_LOOKAHEAD_DAYS = int(os.getenv('SEAT_SYNC_LOOKAHEAD_DAYS', 30))  # 상품 그룹 조회 기간 (일)
 
     # 자동 예약 설정
     AUTO_RESERVE_ENABLED = os.getenv('AUTO_RESERVE_ENABLED', 'true').lower() == 'true'
@@ -74,6 +157,7 @@ class TestingConfig(Config):
     """테스트 환경 설정"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    RATELIMIT_ENABLED = False
 
 
 config = {
@@ -0,0 +1,61 @@
+"""
+Add shop_encode / shop_code columns to camping_sites table
+
+기존 XTicket 캠핑장은 URL의 shopEncode 와 XTICKET_SHOP_CODE 환경변수
+(없으면 기존 하드코딩 값인 생림오토캠핑장 코드)로 채웁니다.
+"""
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+# 이전 버전에서 하드코딩되어 있던 shop_code (생림오토캠핑장)
+LEGACY_SHOP_CODE = "622830018001"
+
+app = create_app()
+
+with app.app_context():
+    try:
+        inspector = inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('camping_sites')]
+
+        with db.engine.connect() as conn:
+            for name, column_type in (('shop_encode', 'VARCHAR(100)'), ('shop_code', 'VARCHAR(50)')):
+                if name in columns:
+                    print(f"✅ {name} column already exists in camping_sites table")
+                    continue
+                conn.execute(text(f"ALTER TABLE camping_sites ADD COLUMN {name} {column_type}"))
+                print(f"✅ Successfully added {name} column to camping_sites table")
+            conn.commit()
+
+        # 기존 XTicket 캠핑장 값 채우기
+        from app.models.database import CampingSite
+
+        default_shop_code = os.getenv('XTICKET_SHOP_CODE') or LEGACY_SHOP_CODE
+        updated = 0
+        for site in CampingSite.query.filter_by(site_type='xticket'):
+            shop_encode, _ = site.xticket_shop()
+            if not site.shop_encode and shop_encode:
+                site.shop_encode = shop_encode
+                updated += 1
+            if not site.shop_code:
+                site.shop_code = default_shop_code
+                updated += 1
+        db.session.commit()
+        print(f"✅ Backfilled {updated} shop values (default shop_code: {default_shop_code})")
+
+        # 결과 확인
+        print("\n📋 XTicket camping sites:")
+        for site in CampingSite.query.filter_by(site_type='xticket'):
+            print(f"  - #{site.id} {site.name}: shop_encode={site.shop_encode}, shop_code={site.shop_code}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
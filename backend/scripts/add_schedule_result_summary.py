@@ -0,0 +1,62 @@
+"""
+Add result summary columns to reservation_schedules table
+
+목록 조회는 요약 컬럼만 사용하고 전체 result JSON은 상세 조회에서만 로드합니다.
+기존 스케줄은 저장된 result로 요약 컬럼을 채웁니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+SUMMARY_COLUMNS = (
+    ('result_success', 'BOOLEAN'),
+    ('result_message', 'VARCHAR(500)'),
+    ('result_reservation_number', 'VARCHAR(100)'),
+    ('result_duration_ms', 'INTEGER'),
+    ('result_accounts_attempted', 'INTEGER'),
+    ('result_successful_count', 'INTEGER'),
+    ('result_failed_count', 'INTEGER'),
+)
+
+app = create_app()
+
+with app.app_context():
+    try:
+        inspector = inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('reservation_schedules')]
+
+        with db.engine.connect() as conn:
+            for name, column_type in SUMMARY_COLUMNS:
+                if name in columns:
+                    print(f"✅ {name} column already exists in reservation_schedules table")
+                    continue
+                conn.execute(text(f"ALTER TABLE reservation_schedules ADD COLUMN {name} {column_type}"))
+                print(f"✅ Successfully added {name} column to reservation_schedules table")
+            conn.commit()
+
+        # 기존 실행 결과로 요약 채우기
+        from app.models.database import ReservationSchedule
+        from sqlalchemy.orm import undefer
+
+        schedules = ReservationSchedule.query.options(undefer(ReservationSchedule.result)).filter(
+            ReservationSchedule.result.isnot(None),
+            ReservationSchedule.result_success.is_(None)
+        ).all()
+        backfilled = 0
+        for schedule in schedules:
+            if schedule.result:  # JSON null 제외
+                schedule.set_result(schedule.result)
+                backfilled += 1
+        db.session.commit()
+        print(f"✅ Backfilled result summary for {backfilled} schedules")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,83 @@
+"""
+Add (camping_site_id, product_code) unique index to camping_site_seats table
+
+좌석 카탈로그 동기화(INSERT ... ON CONFLICT)의 기준 키입니다.
+같은 캠핑장에 product_code 가 중복된 좌석이 있으면 가장 먼저 만든 좌석(최소 id)만 남기고,
+예약 스케줄의 seat_id / seat_ids 가 가리키던 중복 좌석은 남긴 좌석으로 바꿉니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+INDEX_NAME = 'uq_camping_site_seats_site_product'
+
+app = create_app()
+
+with app.app_context():
+    try:
+        inspector = inspect(db.engine)
+        existing = [idx['name'] for idx in inspector.get_indexes('camping_site_seats')]
+        existing += [uc['name'] for uc in inspector.get_unique_constraints('camping_site_seats')]
+        if INDEX_NAME in existing:
+            print(f"✅ {INDEX_NAME} already exists on camping_site_seats table")
+            sys.exit(0)
+
+        from app.models.database import ReservationSchedule
+        from app.utils.table_versions import mark_changed
+
+        # 중복 좌석 → 남길 좌석 id
+        duplicates = db.session.execute(text("""
+            SELECT s.id, keep.keep_id
+            FROM camping_site_seats s
+            JOIN (
+                SELECT camping_site_id, product_code, MIN(id) AS keep_id
+                FROM camping_site_seats
+                GROUP BY camping_site_id, product_code
+                HAVING COUNT(*) > 1
+            ) keep ON keep.camping_site_id = s.camping_site_id AND keep.product_code = s.product_code
+            WHERE s.id != keep.keep_id
+        """)).all()
+        remap = dict(duplicates)
+
+        if remap:
+            remapped = 0
+            for schedule in ReservationSchedule.query.all():
+                changed = False
+                if schedule.seat_id in remap:
+                    schedule.seat_id = remap[schedule.seat_id]
+                    changed = True
+                if schedule.seat_ids and any(seat_id in remap for seat_id in schedule.seat_ids):
+                    seat_ids = []
+                    for seat_id in schedule.seat_ids:
+                        seat_id = remap.get(seat_id, seat_id)
+                        if seat_id not in seat_ids:
+                            seat_ids.append(seat_id)
+                    schedule.seat_ids = seat_ids
+                    changed = True
+                remapped += changed
+
+            db.session.execute(
+                text(f"DELETE FROM camping_site_seats WHERE id IN ({', '.join(str(seat_id) for seat_id in remap)})")
+            )
+            # text() 삭제는 ORM 이벤트로 테이블을 알 수 없으므로 ETag 버전 반영용으로 직접 기록
+            mark_changed(db.session, 'camping_site_seats')
+            db.session.commit()
+            print(f"✅ Removed {len(remap)} duplicate seats (remapped {remapped} schedules)")
+
+        with db.engine.connect() as conn:
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX {INDEX_NAME} ON camping_site_seats (camping_site_id, product_code)"
+            ))
+            conn.commit()
+        print(f"✅ Successfully created {INDEX_NAME} on camping_site_seats table")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,54 @@
+"""
+Back up SQLite databases (online backup API) and verify the newest backups
+
+사용법 (backend 디렉토리에서):
+    python scripts/backup_db.py run       # 메인 DB + scheduler_jobs.db 백업 후 오래된 백업 정리
+    python scripts/backup_db.py verify    # DB 별 가장 최근 백업을 열어 PRAGMA integrity_check
+    python scripts/backup_db.py list      # 백업 파일 목록
+
+verify 는 하나라도 실패하면 종료 코드 1 (cron 등에서 복원 가능 여부 점검용)
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app
+
+parser = argparse.ArgumentParser(description='SQLite DB 백업 / 복원 검증')
+parser.add_argument('command', choices=['run', 'verify', 'list'], help='실행할 작업')
+parser.add_argument('--name', action='append', help='verify 대상 DB 이름 (예: camping, scheduler_jobs)')
+args = parser.parse_args()
+
+app = create_app()
+
+with app.app_context():
+    from app.services.backup_service import backup_service
+
+    try:
+        if args.command == 'run':
+            result = backup_service.run()
+            failed = [name for name, r in result['databases'].items() if 'error' in r]
+        elif args.command == 'verify':
+            result = backup_service.verify_latest(args.name)
+            failed = [name for name, r in result.items() if not r['ok']]
+            if not result:
+                print("❌ No backups found")
+                sys.exit(1)
+        else:
+            result = [str(path) for path in backup_service.list_backups()]
+            failed = []
+
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        if failed:
+            print(f"❌ Failed: {', '.join(failed)}")
+            sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
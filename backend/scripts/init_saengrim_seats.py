@@ -1,5 +1,7 @@
 """
 생림오토캠핑장 좌석 데이터 초기화 스크립트
+
+XTicket 에서 직접 가져오려면 scripts/sync_seats.py 를 사용하세요.
 """
 import sys
 import os
@@ -7,8 +9,9 @@ import os
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app, db
+from app import create_app
 from app.models.database import CampingSite, CampingSiteSeat
+from app.services.seat_catalog_service import seat_catalog_service
 
 # 생림오토캠핑장 전체 좌석 목록 (실제 사이트 정보 기반)
 SAENGRIM_SEATS = [
@@ -97,28 +100,10 @@ def init_saengrim_seats():
 
         print(f"✅ 캠핑장 찾음: {saengrim.name} (ID: {saengrim.id})")
 
-        # 기존 좌석 데이터 삭제
-        existing_count = CampingSiteSeat.query.filter_by(camping_site_id=saengrim.id).count()
-        if existing_count > 0:
-            print(f"⚠️  기존 좌석 데이터 {existing_count}개 삭제 중...")
-            CampingSiteSeat.query.filter_by(camping_site_id=saengrim.id).delete()
-            db.session.commit()
-
-        # 새 좌석 데이터 삽입
-        print(f"📝 {len(SAENGRIM_SEATS)}개 좌석 데이터 삽입 중...")
-
-        for seat_data in SAENGRIM_SEATS:
-            seat = CampingSiteSeat(
-                camping_site_id=saengrim.id,
-                product_code=seat_data['product_code'],
-                product_group_code=seat_data['product_group_code'],
-                seat_name=seat_data['seat_name'],
-                seat_category=seat_data['seat_category'],
-                display_order=seat_data['display_order']
-            )
-            db.session.add(seat)
-
-        db.session.commit()
+        # 좌석 카탈로그 일괄 upsert (기존 좌석 id / display_order 유지 - 예약 스케줄 참조 보존)
+        print(f"📝 {len(SAENGRIM_SEATS)}개 좌석 데이터 반영 중...")
+        result = seat_catalog_service.apply(saengrim.id, SAENGRIM_SEATS)
+        print(f"   - 추가 {result['created']}개, 변경 {result['updated']}개, 동일 {result['unchanged']}개")
 
         # 결과 확인
         grass_count = CampingSiteSeat.query.filter_by(
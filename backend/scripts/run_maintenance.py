@@ -0,0 +1,42 @@
+"""
+Run DB maintenance (retention cleanup / downsampling / incremental VACUUM) manually
+
+사용법 (backend 디렉토리에서):
+    python scripts/run_maintenance.py --dry-run        # 정리 대상 행 수만 확인
+    python scripts/run_maintenance.py                  # 정리 + (유지보수 시간대라면) 증분 VACUUM
+    python scripts/run_maintenance.py --force-vacuum   # 시간대와 관계없이 VACUUM
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app
+
+parser = argparse.ArgumentParser(description='DB 유지보수 실행')
+parser.add_argument('--dry-run', action='store_true', help='정리 대상 행 수만 집계')
+parser.add_argument('--no-vacuum', action='store_true', help='증분 VACUUM 생략')
+parser.add_argument('--force-vacuum', action='store_true', help='유지보수 시간대 밖에서도 VACUUM')
+args = parser.parse_args()
+
+app = create_app()
+
+with app.app_context():
+    from app.services.maintenance_service import maintenance_service
+
+    try:
+        result = maintenance_service.run(
+            dry_run=args.dry_run,
+            vacuum=not args.no_vacuum,
+            force_vacuum=args.force_vacuum
+        )
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,52 @@
+"""
+Sync seat catalogs from XTicket product lists
+
+상품 그룹 / 그룹별 개별 사이트를 조회해 camping_site_seats 와 비교한 뒤 바뀐 좌석만 일괄 upsert 합니다.
+(먼저 scripts/add_seat_catalog_unique_index.py 로 유니크 인덱스를 추가해야 합니다)
+
+사용법 (backend 디렉토리에서):
+    python scripts/sync_seats.py --site-id 1 --dry-run   # 변경될 좌석 수만 확인
+    python scripts/sync_seats.py --site-id 1             # 캠핑장 하나 동기화
+    python scripts/sync_seats.py --all                   # shop 설정이 있는 모든 캠핑장
+    python scripts/sync_seats.py --all --prune           # 상류에서 사라진 좌석도 삭제
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import create_app
+
+parser = argparse.ArgumentParser(description='좌석 카탈로그 동기화')
+target = parser.add_mutually_exclusive_group(required=True)
+target.add_argument('--site-id', type=int, help='캠핑장 ID')
+target.add_argument('--all', action='store_true', help='모든 캠핑장')
+parser.add_argument('--dry-run', action='store_true', help='변경 건수만 집계')
+parser.add_argument('--prune', action='store_true', help='상류에 없는 좌석 삭제 (스케줄이 참조하는 좌석 제외)')
+args = parser.parse_args()
+
+app = create_app()
+
+with app.app_context():
+    from app.models.database import CampingSite
+    from app.services.seat_catalog_service import seat_catalog_service
+
+    try:
+        if args.all:
+            result = seat_catalog_service.sync_all(dry_run=args.dry_run, prune=args.prune)
+        else:
+            camping_site = CampingSite.query.get(args.site_id)
+            if camping_site is None:
+                print(f"❌ Camping site {args.site_id} not found")
+                sys.exit(1)
+            result = seat_catalog_service.sync_site(camping_site, dry_run=args.dry_run, prune=args.prune)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
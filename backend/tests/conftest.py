@@ -0,0 +1,59 @@
+"""
+테스트 공용 fixture
+
+네트워크 없이 실행되도록 TestingConfig(인메모리 SQLite)로 앱을 만들고,
+스케줄러/디스패처 같은 백그라운드 작업은 시작하지 않습니다.
+
+    cd backend && python -m pytest -q
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# backend/ 를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'camping-tests', 'app.log'))
+
+from app import create_app, db  # noqa: E402
+from app.models.database import CampingSite  # noqa: E402
+
+ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'admin')
+ADMIN_PASSWORD = os.getenv('ADMIN_PASSWORD', 'admin123')
+
+
+@pytest.fixture
+def app():
+    """테스트마다 새 인메모리 DB를 쓰는 앱 (앱 컨텍스트 안에서 실행)"""
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    """기본 관리자로 로그인한 테스트 클라이언트"""
+    client = app.test_client()
+    response = client.post('/api/auth/login', json={'username': ADMIN_USERNAME, 'password': ADMIN_PASSWORD})
+    assert response.status_code == 200
+    return client
+
+
+@pytest.fixture
+def camping_site(app):
+    """XTicket 캠핑장 1곳"""
+    site = CampingSite(
+        name='테스트 캠핑장',
+        site_type='xticket',
+        url='https://camp.xticket.kr',
+        shop_encode='test-encode',
+        shop_code='100001'
+    )
+    db.session.add(site)
+    db.session.commit()
+    return site
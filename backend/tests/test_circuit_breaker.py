@@ -0,0 +1,180 @@
+"""호스트별 서킷 브레이커 (상태 전이 / probe / UpstreamSession 실패 판정)"""
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from app.utils import circuit_breaker, upstream
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from app.utils.upstream import UpstreamSession
+
+HOST = 'camp.example.test'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedAdapter(BaseAdapter):
+    """미리 정한 응답 코드/예외를 순서대로 반환하는 어댑터"""
+
+    def __init__(self, *outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, BaseException):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        response.url = request.url
+        response.request = request
+        response._content = b''
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker, 'time', SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def breakers(monkeypatch):
+    registry = CircuitBreakerRegistry()
+    registry.configure(failure_threshold=2, recovery_seconds=30)
+    monkeypatch.setattr(upstream, 'circuit_breakers', registry)
+    return registry
+
+
+def _session(*outcomes):
+    session = UpstreamSession('xticket', breaker=True)
+    adapter = ScriptedAdapter(*outcomes)
+    session.mount('https://', adapter)
+    return session, adapter
+
+
+def test_opens_after_threshold_and_rejects_with_retry_after(clock):
+    breaker = CircuitBreaker(HOST, failure_threshold=3, recovery_seconds=30)
+
+    breaker.record_failure('HTTP 502')
+    breaker.record_failure('HTTP 502')
+    assert breaker.state == CLOSED
+    breaker.record_failure('HTTP 503')
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.retry_after == pytest.approx(20)
+    assert exc_info.value.last_error == 'HTTP 503'
+    assert breaker.rejected == 1
+
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = CircuitBreaker(HOST, failure_threshold=2, recovery_seconds=30)
+
+    breaker.record_failure('HTTP 502')
+    breaker.record_success()
+    breaker.record_failure('HTTP 502')
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(HOST, failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure('timeout')
+
+    clock.now += 30
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+    # probe 가 끝나기 전 다른 요청은 즉시 실패
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(HOST, failure_threshold=5, recovery_seconds=30)
+    for _ in range(5):
+        breaker.record_failure('HTTP 500')
+
+    clock.now += 30
+    breaker.before_request()
+    breaker.record_failure('HTTP 500')
+
+    assert breaker.state == OPEN
+    assert breaker.is_open
+
+
+def test_released_probe_hands_slot_to_next_request(clock):
+    breaker = CircuitBreaker(HOST, failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure('timeout')
+    clock.now += 30
+    breaker.before_request()
+
+    breaker.release_probe()
+
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+
+def test_registry_configure_applies_to_existing_breakers():
+    registry = CircuitBreakerRegistry()
+    breaker = registry.get(HOST)
+
+    registry.configure(failure_threshold=9, recovery_seconds=5)
+
+    assert registry.get(HOST) is breaker
+    assert (breaker.failure_threshold, breaker.recovery_seconds) == (9, 5)
+
+
+def test_session_counts_connection_errors_and_5xx(clock, breakers):
+    session, adapter = _session(requests.ConnectionError('refused'), 503)
+
+    with pytest.raises(requests.ConnectionError):
+        session.get(f'https://{HOST}/api')
+    assert session.get(f'https://{HOST}/api').status_code == 503
+
+    assert breakers.get(HOST).state == OPEN
+    with pytest.raises(CircuitOpenError):
+        session.get(f'https://{HOST}/api')
+    assert adapter.sent == 2
+
+
+def test_session_ignores_client_errors_and_code_bugs(clock, breakers):
+    session, adapter = _session(404, KeyError('result'), KeyError('result'))
+
+    assert session.get(f'https://{HOST}/api').status_code == 404
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            session.get(f'https://{HOST}/api')
+
+    breaker = breakers.get(HOST)
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_session_without_breaker_is_never_blocked(clock, breakers):
+    breakers.get(HOST).record_failure('HTTP 500')
+    breakers.get(HOST).record_failure('HTTP 500')
+    session, adapter = _session(200)
+
+    assert session.post(f'https://{HOST}/reserve', breaker=False).status_code == 200
+    assert adapter.sent == 1
@@ -0,0 +1,92 @@
+"""호출 단위 마감 시간 (타임아웃 절단 / 중첩 마감 / DeadlineExceeded)"""
+import time
+
+import pytest
+import requests
+
+from app.utils import deadline as deadline_module
+from app.utils.circuit_breaker import CLOSED, CircuitBreakerRegistry
+from app.utils.deadline import DeadlineExceeded, deadline, remaining, upstream_timeout
+from app.utils.upstream import UpstreamSession
+
+
+@pytest.fixture(autouse=True)
+def default_timeouts(monkeypatch):
+    monkeypatch.setattr(deadline_module, 'CONNECT_TIMEOUT', 3.05)
+    monkeypatch.setattr(deadline_module, 'READ_TIMEOUT', 30.0)
+
+
+def test_timeout_without_deadline():
+    assert upstream_timeout() == ((3.05, 30.0), False)
+    # 숫자 하나면 read 타임아웃, connect 는 기본값 이하
+    assert upstream_timeout(10) == ((3.05, 10), False)
+    assert upstream_timeout(2) == ((2, 2), False)
+    assert upstream_timeout((1, 5)) == ((1, 5), False)
+
+
+def test_timeout_is_clipped_to_remaining_budget():
+    with deadline(1):
+        (connect, read), clipped = upstream_timeout(10)
+
+    assert clipped
+    assert 0 < read <= 1
+    assert connect <= 1
+
+
+def test_timeout_within_budget_is_not_clipped():
+    with deadline(60):
+        assert upstream_timeout(10) == ((3.05, 10), False)
+
+
+def test_nested_deadline_never_extends_outer():
+    with deadline(1):
+        with deadline(60):
+            assert remaining() <= 1
+        with deadline(0.5):
+            assert remaining() <= 0.5
+        assert 0.5 < remaining() <= 1
+    assert remaining() is None
+
+
+def test_expired_deadline_raises_before_request():
+    with deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            upstream_timeout()
+
+
+def test_clipped_timeout_raises_deadline_exceeded_without_breaker_failure(monkeypatch):
+    registry = CircuitBreakerRegistry()
+    monkeypatch.setattr('app.utils.upstream.circuit_breakers', registry)
+
+    def timeout(self, request, **kwargs):
+        raise requests.ReadTimeout('read timed out')
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', timeout)
+    session = UpstreamSession('xticket', breaker=True)
+
+    with deadline(1), pytest.raises(DeadlineExceeded):
+        session.get('https://camp.example.test/api', timeout=10)
+
+    # 호출자 예산 부족은 서버 장애로 세지 않음
+    assert registry.get('camp.example.test').state == CLOSED
+    assert registry.get('camp.example.test').consecutive_failures == 0
+
+
+def test_create_app_applies_timeout_config(app):
+    assert deadline_module.CONNECT_TIMEOUT == float(app.config['UPSTREAM_CONNECT_TIMEOUT'])
+    assert deadline_module.READ_TIMEOUT == float(app.config['REQUEST_TIMEOUT'])
+
+
+def test_api_request_runs_under_deadline(app):
+    seen = {}
+
+    @app.route('/_deadline_probe')
+    def _deadline_probe():
+        seen['remaining'] = remaining()
+        return 'ok'
+
+    app.test_client().get('/_deadline_probe')
+
+    assert 0 < seen['remaining'] <= app.config['API_REQUEST_DEADLINE_SECONDS']
+    assert remaining() is None
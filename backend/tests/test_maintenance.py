@@ -0,0 +1,106 @@
+"""DB 유지보수 (보존 기간 정리 / 보관 파일 / 일별 집계 다운샘플링)"""
+import gzip
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.database import AvailabilityDailySummary, AvailabilityHistory, NotificationOutbox, Reservation
+from app.services.maintenance_service import DEFAULT_RETENTION_DAYS, maintenance_service
+
+OLD = datetime.utcnow() - timedelta(days=400)
+RECENT = datetime.utcnow() - timedelta(days=1)
+
+
+@pytest.fixture
+def maintenance(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(maintenance_service, 'archive_dir', tmp_path)
+    monkeypatch.setattr(maintenance_service, 'batch_size', 2)
+    monkeypatch.setattr(maintenance_service, 'retention_days', dict(DEFAULT_RETENTION_DAYS))
+    return maintenance_service
+
+
+@pytest.fixture
+def rows(camping_site):
+    def reservation(status, updated_at):
+        return Reservation(
+            camping_site_id=camping_site.id, check_in_date=date(2025, 8, 1), check_out_date=date(2025, 8, 2),
+            status=status, created_at=updated_at, updated_at=updated_at
+        )
+
+    def notification(status, created_at):
+        return NotificationOutbox(bot_token='123:secret', chat_id='100', message='hi', status=status, created_at=created_at)
+
+    db.session.add_all([
+        reservation('reserved', OLD), reservation('failed', OLD), reservation('reserved', OLD),
+        reservation('monitoring', OLD), reservation('reserved', RECENT),
+        notification('sent', OLD), notification('pending', OLD), notification('sent', RECENT),
+    ])
+    db.session.commit()
+
+
+def _history(camping_site_id, status, checked_at):
+    return AvailabilityHistory(camping_site_id=camping_site_id, target_date=date(2025, 9, 1), status=status, checked_at=checked_at)
+
+
+def test_dry_run_counts_without_deleting(maintenance, rows):
+    result = maintenance.run(dry_run=True)
+
+    assert result['steps']['reservations']['would_delete'] == 3
+    assert result['steps']['notifications']['would_delete'] == 1
+    assert 'vacuum' not in result['steps']
+    assert Reservation.query.count() == 5
+    assert NotificationOutbox.query.count() == 3
+    assert not any(maintenance.archive_dir.iterdir())
+
+
+def test_purge_deletes_only_old_finished_rows(maintenance, rows):
+    result = maintenance.run(vacuum=False)
+
+    assert result['steps']['reservations']['deleted'] == 3
+    assert sorted(r.status for r in Reservation.query) == ['monitoring', 'reserved']
+    assert sorted(n.status for n in NotificationOutbox.query) == ['pending', 'sent']
+
+
+def test_archive_excludes_secret_columns(maintenance, rows):
+    result = maintenance.run(vacuum=False)
+
+    with gzip.open(result['steps']['notifications']['archive'], 'rt', encoding='utf-8') as f:
+        [archived] = [json.loads(line) for line in f]
+    assert archived['message'] == 'hi'
+    assert 'bot_token' not in archived
+
+    # 배치 크기(2)보다 많은 행도 한 파일에 모두 보관
+    with gzip.open(result['steps']['reservations']['archive'], 'rt', encoding='utf-8') as f:
+        assert len(f.readlines()) == 3
+
+
+def test_zero_retention_skips_step(maintenance, rows):
+    maintenance.retention_days['reservations'] = 0
+
+    result = maintenance.run(vacuum=False)
+
+    assert result['steps']['reservations'] == {'skipped': 'no retention'}
+    assert Reservation.query.count() == 5
+
+
+def test_availability_history_is_downsampled_to_daily_summary(maintenance, camping_site):
+    day = (datetime.utcnow() - timedelta(days=60)).replace(hour=9, minute=0, second=0, microsecond=0)
+    db.session.add_all([
+        _history(camping_site.id, 'available', day),
+        _history(camping_site.id, 'unavailable', day + timedelta(hours=1)),
+        _history(camping_site.id, 'available', day + timedelta(hours=2)),
+        _history(camping_site.id, 'available', RECENT),
+    ])
+    db.session.commit()
+
+    result = maintenance.run(vacuum=False)
+
+    assert result['steps']['availability_history']['downsampled'] == 3
+    assert AvailabilityHistory.query.count() == 1
+    summary = AvailabilityDailySummary.query.one()
+    assert summary.day == day.date()
+    assert (summary.changes, summary.available_count, summary.unavailable_count) == (3, 2, 1)
+    assert summary.last_status == 'available'
+    assert summary.last_checked_at == day + timedelta(hours=2)
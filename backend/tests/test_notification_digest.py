@@ -0,0 +1,86 @@
+"""예약 가능 알림 다이제스트 (렌더링 / 4000자 분할 / 채팅별 묶음)"""
+from datetime import date, timedelta
+
+from app.notifications.notification_digest import MAX_MESSAGE_LENGTH, AvailabilityDigest
+
+
+class FakeNotifier:
+    def __init__(self, chat_id='100'):
+        self.bot_token = 'token'
+        self.chat_id = chat_id
+        self.messages = []
+        self.single = []
+
+    def send_message(self, message):
+        self.messages.append(message)
+        return True
+
+    def send_availability_notification(self, camping_site, date):
+        self.single.append((camping_site, date))
+        return True
+
+
+def test_render_groups_dates_by_site():
+    digest = AvailabilityDigest(group_by_site=True)
+    events = [('B 캠핑장', '2026-11-02'), ('A 캠핑장', '2026-11-03'), ('B 캠핑장', '2026-11-01')]
+
+    [message] = digest.render(events)
+
+    assert message.startswith('🏕️ <b>예약 가능 알림 (3건)</b>\n')
+    assert message.endswith('✅ 예약이 가능해졌습니다!')
+    # 캠핑장은 처음 등장한 순서, 날짜는 정렬
+    assert message.index('<b>B 캠핑장</b>') < message.index('<b>A 캠핑장</b>')
+    assert message.index('• 2026-11-01') < message.index('• 2026-11-02')
+
+
+def test_render_flat_list_sorted_by_date():
+    digest = AvailabilityDigest(group_by_site=False)
+    events = [('B', '2026-11-02'), ('A', '2026-11-01')]
+
+    [message] = digest.render(events)
+
+    assert message.index('• 2026-11-01 - A') < message.index('• 2026-11-02 - B')
+
+
+def test_render_splits_long_digest_under_limit():
+    digest = AvailabilityDigest(group_by_site=True)
+    start = date(2026, 1, 1)
+    events = [(f'캠핑장 {i % 7}', str(start + timedelta(days=i))) for i in range(600)]
+
+    messages = digest.render(events)
+
+    assert len(messages) > 1
+    assert all(len(message) <= MAX_MESSAGE_LENGTH for message in messages)
+    assert all(message.startswith('🏕️ <b>예약 가능 알림 (600건)</b>') for message in messages)
+    # 분할해도 날짜가 빠지거나 중복되지 않음
+    rendered = [line for message in messages for line in message.splitlines() if line.startswith('• ')]
+    assert sorted(rendered) == sorted(f'• {d}' for _, d in events)
+
+
+def test_flush_sends_one_digest_per_chat_and_reports_refs():
+    digest = AvailabilityDigest()
+    chat_a, chat_b = FakeNotifier('100'), FakeNotifier('200')
+    digest.add(chat_a, 'A', date(2026, 11, 1), ref=('target', 1))
+    digest.add(chat_a, 'A', date(2026, 11, 2), ref=('target', 2))
+    digest.add(chat_a, 'A', date(2026, 11, 2), ref=('target', 2))  # 중복 이벤트
+    digest.add(chat_b, 'B', date(2026, 11, 3), ref=('range', 7, date(2026, 11, 3)))
+
+    flushed = []
+    sent = digest.flush(force=True, on_flushed=flushed.extend)
+
+    assert sent == 2
+    assert len(chat_a.messages) == 1 and '(2건)' in chat_a.messages[0]
+    # 한 건이면 다이제스트 대신 단건 알림
+    assert chat_b.single == [('B', '2026-11-03')]
+    assert flushed == [('target', 1), ('target', 2), ('range', 7, date(2026, 11, 3))]
+    assert digest.pending_count() == 0
+
+
+def test_flush_waits_for_window():
+    digest = AvailabilityDigest(window_seconds=3600)
+    notifier = FakeNotifier()
+    digest.add(notifier, 'A', date(2026, 11, 1))
+
+    assert digest.flush() == 0
+    assert digest.pending_count() == 1
+    assert digest.flush(force=True) == 1
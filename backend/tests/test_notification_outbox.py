@@ -0,0 +1,166 @@
+"""알림 아웃박스 디스패처 (재시도 / backoff / retry_after / 선점)"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models.database import NotificationOutbox
+from app.notifications import telegram_notifier
+from app.notifications.notification_outbox import enqueue_notification, notification_dispatcher
+from app.notifications.telegram_notifier import DeliveryResult
+
+
+class FakeNotifier:
+    """deliver 호출을 기록하고 미리 정한 결과를 순서대로 반환"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.delivered = []
+
+    def deliver(self, message):
+        self.delivered.append(message)
+        return self.results.pop(0) if self.results else DeliveryResult(ok=True)
+
+
+@pytest.fixture
+def dispatcher(monkeypatch):
+    monkeypatch.setattr(notification_dispatcher, 'retry_base_seconds', 5)
+    monkeypatch.setattr(notification_dispatcher, 'retry_max_seconds', 300)
+    monkeypatch.setattr(notification_dispatcher, 'batch_size', 20)
+    monkeypatch.setattr(notification_dispatcher, 'lease_seconds', 60)
+    return notification_dispatcher
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    fake = FakeNotifier()
+    monkeypatch.setattr(telegram_notifier, 'get_notifier_for', lambda bot_token, chat_id: fake)
+    return fake
+
+
+def _enqueue(message='hello', chat_id='100'):
+    enqueue_notification('token', chat_id, message)
+    db.session.commit()
+    return NotificationOutbox.query.order_by(NotificationOutbox.id.desc()).first()
+
+
+def _make_due(item):
+    item.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+
+def test_retry_delay_backoff_is_exponential_and_capped(dispatcher):
+    assert [dispatcher._retry_delay(n) for n in range(1, 5)] == [5, 10, 20, 40]
+    assert dispatcher._retry_delay(10) == 300
+
+
+def test_retry_after_overrides_backoff(dispatcher):
+    assert dispatcher._retry_delay(3, retry_after=17) == 17.0
+
+
+def test_enqueue_is_part_of_caller_transaction(app):
+    enqueue_notification('token', '100', 'rolled back')
+    db.session.rollback()
+    assert NotificationOutbox.query.count() == 0
+
+
+def test_sent_on_success(app, dispatcher, notifier):
+    item = _enqueue('hello')
+
+    assert dispatcher.dispatch_pending() == 1
+
+    item = db.session.get(NotificationOutbox, item.id)
+    assert notifier.delivered == ['hello']
+    assert item.status == 'sent'
+    assert item.attempts == 1
+    assert item.sent_at is not None
+
+
+def test_retryable_failure_backs_off_then_succeeds(app, dispatcher, notifier):
+    notifier.results = [
+        DeliveryResult(ok=False, retryable=True, error='HTTP 502'),
+        DeliveryResult(ok=False, retryable=True, error='HTTP 502'),
+    ]
+    item = _enqueue()
+
+    before = datetime.utcnow()
+    dispatcher.dispatch_pending()
+    item = db.session.get(NotificationOutbox, item.id)
+    assert item.status == 'pending'
+    assert item.attempts == 1
+    assert item.last_error == 'HTTP 502'
+    assert timedelta(seconds=4) < item.next_attempt_at - before <= timedelta(seconds=6)
+
+    # 대기 시간 전에는 다시 보내지 않음
+    assert dispatcher.dispatch_pending() == 0
+
+    _make_due(item)
+    before = datetime.utcnow()
+    dispatcher.dispatch_pending()
+    item = db.session.get(NotificationOutbox, item.id)
+    assert item.attempts == 2
+    assert timedelta(seconds=9) < item.next_attempt_at - before <= timedelta(seconds=11)
+
+    _make_due(item)
+    dispatcher.dispatch_pending()
+    item = db.session.get(NotificationOutbox, item.id)
+    assert item.status == 'sent'
+    assert item.attempts == 3
+    assert item.last_error is None
+
+
+def test_rate_limit_uses_retry_after(app, dispatcher, notifier):
+    notifier.results = [DeliveryResult(ok=False, retryable=True, retry_after=42, error='Too Many Requests')]
+    item = _enqueue()
+
+    before = datetime.utcnow()
+    dispatcher.dispatch_pending()
+
+    item = db.session.get(NotificationOutbox, item.id)
+    assert item.status == 'pending'
+    assert timedelta(seconds=41) < item.next_attempt_at - before <= timedelta(seconds=43)
+
+
+def test_permanent_failure_is_not_retried(app, dispatcher, notifier):
+    notifier.results = [DeliveryResult(ok=False, retryable=False, error='Bad Request: chat not found')]
+    item = _enqueue()
+
+    dispatcher.dispatch_pending()
+    _make_due(item)
+    dispatcher.dispatch_pending()
+
+    item = db.session.get(NotificationOutbox, item.id)
+    assert item.status == 'failed'
+    assert item.attempts == 1
+    assert len(notifier.delivered) == 1
+
+
+def test_same_chat_messages_wait_behind_deferred_message(app, dispatcher, notifier):
+    notifier.results = [DeliveryResult(ok=False, retryable=True, retry_after=30, error='Too Many Requests')]
+    first = _enqueue('first', chat_id='100')
+    second = _enqueue('second', chat_id='100')
+    other = _enqueue('other', chat_id='200')
+
+    dispatcher.dispatch_pending()
+
+    first = db.session.get(NotificationOutbox, first.id)
+    second = db.session.get(NotificationOutbox, second.id)
+    assert notifier.delivered == ['first', 'other']
+    assert second.status == 'pending'
+    assert second.next_attempt_at >= first.next_attempt_at
+    assert db.session.get(NotificationOutbox, other.id).status == 'sent'
+
+
+def test_claimed_row_is_not_sent_again_until_lease_expires(app, dispatcher, notifier):
+    item = _enqueue()
+    assert dispatcher._claim(item)
+
+    # 다른 디스패처가 선점한 행 (리스 유지 중)
+    assert dispatcher.dispatch_pending() == 0
+    assert notifier.delivered == []
+
+    # 선점한 디스패처가 죽어 리스가 만료되면 다시 전송
+    _make_due(db.session.get(NotificationOutbox, item.id))
+    dispatcher.dispatch_pending()
+    assert notifier.delivered == ['hello']
+    assert db.session.get(NotificationOutbox, item.id).status == 'sent'
@@ -0,0 +1,78 @@
+"""기간 모니터링 타겟 (요일 마스크 / 날짜별 비트셋)"""
+from datetime import date
+
+import pytest
+
+from app import db
+from app.models.database import ALL_WEEKDAYS_MASK, MonitoringRangeTarget, weekdays_to_mask
+
+
+def _range(start=date(2026, 11, 1), end=date(2026, 11, 30), weekdays=None):
+    return MonitoringRangeTarget(
+        camping_site_id=1,
+        start_date=start,
+        end_date=end,
+        weekday_mask=weekdays_to_mask(weekdays),
+        available_bits=b'',
+        notified_bits=b''
+    )
+
+
+def test_weekdays_to_mask():
+    assert weekdays_to_mask(None) == ALL_WEEKDAYS_MASK
+    assert weekdays_to_mask([0, 6]) == 0b1000001
+    with pytest.raises(ValueError):
+        weekdays_to_mask([7])
+
+
+def test_dates_follow_weekday_mask_and_since():
+    # 2026-11-06 금, 2026-11-07 토
+    target = _range(weekdays=[4, 5])
+
+    assert list(target.dates())[:2] == [date(2026, 11, 6), date(2026, 11, 7)]
+    assert all(d.weekday() in (4, 5) for d in target.dates())
+    assert list(target.dates(since=date(2026, 11, 25))) == [date(2026, 11, 27), date(2026, 11, 28)]
+
+
+def test_months_spanning_year_end():
+    target = _range(start=date(2026, 12, 20), end=date(2027, 2, 3))
+    assert target.months() == {(2026, 12), (2027, 1), (2027, 2)}
+
+
+def test_apply_availability_sets_and_clears_bits():
+    target = _range()
+
+    newly = target.apply_availability({date(2026, 11, 3): True, date(2026, 11, 30): True, date(2026, 11, 4): False})
+    assert newly == [date(2026, 11, 3), date(2026, 11, 30)]
+    assert target.available_dates() == [date(2026, 11, 3), date(2026, 11, 30)]
+    # 30일 범위 = 31비트 -> 4바이트
+    assert len(target.available_bits) == 4
+
+    target.apply_availability({date(2026, 11, 3): False})
+    assert target.available_dates() == [date(2026, 11, 30)]
+
+
+def test_notified_dates_are_not_reported_again():
+    target = _range()
+    newly = target.apply_availability({date(2026, 11, 3): True, date(2026, 11, 4): True})
+    target.mark_notified(newly)
+
+    assert target.is_notified(date(2026, 11, 3))
+    assert not target.is_notified(date(2026, 11, 5))
+    assert target.apply_availability({date(2026, 11, 3): True, date(2026, 11, 5): True}) == [date(2026, 11, 5)]
+
+
+def test_full_year_bitset_round_trips_through_database(app, camping_site):
+    target = _range(start=date(2026, 1, 1), end=date(2026, 12, 31))
+    target.camping_site_id = camping_site.id
+    target.apply_availability({date(2026, 1, 1): True, date(2026, 12, 31): True})
+    target.mark_notified([date(2026, 12, 31)])
+    db.session.add(target)
+    db.session.commit()
+    db.session.expire_all()
+
+    loaded = db.session.get(MonitoringRangeTarget, target.id)
+    assert len(loaded.available_bits) == 46
+    assert loaded.available_dates() == [date(2026, 1, 1), date(2026, 12, 31)]
+    assert loaded.is_notified(date(2026, 12, 31))
+    assert loaded.to_dict()['date_count'] == 365
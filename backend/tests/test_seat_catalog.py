@@ -0,0 +1,144 @@
+"""좌석 카탈로그 동기화 (diff / upsert / prune / 유니크 인덱스 확인)"""
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.models.database import CampingSiteSeat, ReservationSchedule
+from app.scrapers.xticket_pool import xticket_pool
+from app.services.seat_catalog_service import seat_catalog_service, seat_category_for
+
+
+def _item(code, name, group='0001', price=30000, group_index=0, position=1):
+    return {
+        'product_code': code, 'product_group_code': group, 'seat_name': name,
+        'seat_category': 'grass', 'price': price, 'group_index': group_index, 'position': position
+    }
+
+
+class FakeScraper:
+    def get_product_groups(self, start, end):
+        return [
+            {'product_group_code': '0001', 'product_group_name': 'A구역 잔디'},
+            {'product_group_code': '0002', 'product_group_name': '데크'},
+        ]
+
+    def get_available_sites(self, target_date, group_code, include_unavailable=False):
+        assert include_unavailable
+        if group_code == '0001':
+            return [
+                {'product_code': '00010001', 'product_name': '잔디-01', 'sale_product_fee': 30000},
+                {'product_code': '00010002', 'product_name': '잔디-02', 'sale_product_fee': 0},
+            ]
+        return [{'product_code': '00020001', 'product_name': '데크-01', 'sale_product_fee': 40000}]
+
+
+def _seats(camping_site_id):
+    return {
+        seat.product_code: seat
+        for seat in CampingSiteSeat.query.filter_by(camping_site_id=camping_site_id).order_by(CampingSiteSeat.id)
+    }
+
+
+def test_seat_category_for():
+    assert seat_category_for('A구역 잔디') == 'grass'
+    assert seat_category_for('데크') == 'deck'
+    assert seat_category_for('파쇄석 사이트') == 'crushed_stone'
+    assert seat_category_for('카라반') == '카라반'
+    assert seat_category_for(None) == 'etc'
+
+
+def test_unique_index_exists_on_new_database(app):
+    assert seat_catalog_service.has_unique_index()
+
+
+def test_missing_unique_index_is_detected(app):
+    db.session.execute(text('ALTER TABLE camping_site_seats RENAME TO camping_site_seats_old'))
+    db.session.execute(text(
+        'CREATE TABLE camping_site_seats (id INTEGER PRIMARY KEY, camping_site_id INTEGER, product_code VARCHAR(20))'
+    ))
+    db.session.commit()
+
+    assert not seat_catalog_service.has_unique_index()
+
+
+def test_apply_creates_then_reports_unchanged(app, camping_site):
+    catalog = [_item('00010001', 'A-01', position=1), _item('00010002', 'A-02', position=2)]
+
+    result = seat_catalog_service.apply(camping_site.id, catalog)
+    assert (result['created'], result['updated'], result['unchanged']) == (2, 0, 0)
+    assert [s.display_order for s in _seats(camping_site.id).values()] == [1, 2]
+
+    result = seat_catalog_service.apply(camping_site.id, catalog)
+    assert (result['created'], result['updated'], result['unchanged']) == (0, 0, 2)
+
+
+def test_apply_updates_changed_seats_and_keeps_display_order(app, camping_site):
+    seat_catalog_service.apply(camping_site.id, [_item('00010001', 'A-01'), _item('00010002', 'A-02', position=2)])
+    seat = _seats(camping_site.id)['00010001']
+    seat.display_order = 50
+    db.session.commit()
+
+    result = seat_catalog_service.apply(camping_site.id, [
+        _item('00010001', 'A-01 (리뉴얼)', price=None),
+        _item('00010002', 'A-02', position=2),
+        _item('00010003', 'A-03', position=3),
+    ])
+    db.session.expire_all()
+
+    assert (result['created'], result['updated'], result['unchanged']) == (1, 1, 1)
+    seats = _seats(camping_site.id)
+    assert seats['00010001'].seat_name == 'A-01 (리뉴얼)'
+    # 가격이 없으면 기존 가격 유지, 관리자가 정한 순서 유지
+    assert seats['00010001'].price == 30000
+    assert seats['00010001'].display_order == 50
+    # 새 좌석은 그룹 안의 마지막 순서 다음
+    assert seats['00010003'].display_order == 51
+
+
+def test_dry_run_does_not_write(app, camping_site):
+    result = seat_catalog_service.apply(camping_site.id, [_item('00010001', 'A-01')], dry_run=True)
+
+    assert result['created'] == 1
+    assert _seats(camping_site.id) == {}
+
+
+def test_prune_keeps_seats_referenced_by_schedules(app, camping_site):
+    seat_catalog_service.apply(camping_site.id, [
+        _item('00010001', 'A-01'), _item('00010002', 'A-02', position=2), _item('00010003', 'A-03', position=3)
+    ])
+    referenced = _seats(camping_site.id)['00010002']
+    db.session.add(ReservationSchedule(
+        camping_site_id=camping_site.id, execute_at=datetime(2026, 11, 1, 10), target_date=date(2026, 12, 1),
+        seat_ids=[referenced.id]
+    ))
+    db.session.commit()
+
+    catalog = [_item('00010001', 'A-01')]
+    result = seat_catalog_service.apply(camping_site.id, catalog)
+    assert result['missing_upstream'] == 2 and result['removed'] == 0
+    assert len(_seats(camping_site.id)) == 3
+
+    result = seat_catalog_service.apply(camping_site.id, catalog, prune=True)
+    assert (result['removed'], result['kept_referenced']) == (1, 1)
+    assert set(_seats(camping_site.id)) == {'00010001', '00010002'}
+
+
+def test_sync_site_fetches_catalog_from_scraper(app, camping_site, monkeypatch):
+    monkeypatch.setattr(xticket_pool, 'get_for_site', lambda site: FakeScraper())
+
+    result = seat_catalog_service.sync_site(camping_site)
+
+    assert result['created'] == 3
+    seats = _seats(camping_site.id)
+    assert [(s.seat_category, s.display_order) for s in seats.values()] == [('grass', 1), ('grass', 2), ('deck', 101)]
+    # 매진 등으로 가격이 0이면 비워 둠
+    assert seats['00010002'].price is None
+
+
+def test_sync_site_without_shop_config_fails(app, camping_site, monkeypatch):
+    monkeypatch.setattr(xticket_pool, 'get_for_site', lambda site: None)
+
+    with pytest.raises(ValueError):
+        seat_catalog_service.sync_site(camping_site)
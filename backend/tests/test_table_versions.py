@@ -0,0 +1,98 @@
+"""테이블 버전 기반 ETag (304 / 내용 변경 시에만 버전 증가)"""
+from datetime import date, datetime
+
+import pytest
+
+from app import db
+from app.models.database import MonitoringTarget, NotificationOutbox, TableVersion
+from app.utils.table_versions import mark_changed, table_versions
+
+URL = '/api/monitoring/targets'
+
+
+@pytest.fixture
+def target(app, camping_site):
+    target = MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True)
+    db.session.add(target)
+    db.session.commit()
+    return target
+
+
+def _version(table):
+    row = db.session.get(TableVersion, table)
+    return row.version if row else 0
+
+
+def _etag(client):
+    response = client.get(URL)
+    assert response.status_code == 200
+    return response.headers['ETag']
+
+
+def test_unchanged_list_returns_304(client, target):
+    etag = _etag(client)
+
+    response = client.get(URL, headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert response.data == b''
+
+
+def test_content_change_invalidates_etag(client, target):
+    etag = _etag(client)
+
+    target.last_status = 'available'
+    db.session.commit()
+
+    response = client.get(URL, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.get_json()[0]['last_status'] == 'available'
+
+
+def test_bookkeeping_only_change_keeps_etag(client, target):
+    etag = _etag(client)
+    before = _version('monitoring_targets')
+
+    target.last_checked = datetime.utcnow()
+    db.session.commit()
+    # 같은 값을 다시 대입한 경우도 변경이 아님
+    target.last_status = target.last_status
+    db.session.commit()
+
+    assert _version('monitoring_targets') == before
+    assert client.get(URL, headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_rolled_back_change_does_not_bump(app, target):
+    before = _version('monitoring_targets')
+
+    target.last_status = 'available'
+    db.session.flush()
+    db.session.rollback()
+    db.session.commit()
+
+    assert _version('monitoring_targets') == before
+
+
+def test_bulk_update_and_mark_changed_bump(app, target):
+    before = _version('monitoring_targets')
+
+    MonitoringTarget.query.filter_by(id=target.id).update({'last_status': 'available'})
+    db.session.commit()
+    assert _version('monitoring_targets') == before + 1
+
+    mark_changed(db.session, 'monitoring_targets')
+    db.session.commit()
+    assert _version('monitoring_targets') == before + 2
+
+
+def test_untracked_table_is_not_versioned(app):
+    assert 'monitoring_targets' in table_versions.tracked
+    assert 'notification_outbox' not in table_versions.tracked
+
+    db.session.add(NotificationOutbox(bot_token='token', chat_id='100', message='hello'))
+    db.session.commit()
+
+    assert db.session.get(TableVersion, 'notification_outbox') is None
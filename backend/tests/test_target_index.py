@@ -0,0 +1,108 @@
+"""활성 타겟 인메모리 인덱스 (커밋 후 반영 / 롤백 시 폐기 / DB 대조)"""
+from datetime import date
+
+import pytest
+
+from app import db
+from app.models.database import MonitoringRangeTarget, MonitoringTarget
+from app.services.target_index import target_index
+
+
+@pytest.fixture
+def index(app):
+    target_index.load()
+    return target_index
+
+
+def _keys(index, camping_site_id, year, month):
+    entry = index.fetch_plan().get((camping_site_id, year, month))
+    return entry or {'targets': [], 'range_targets': []}
+
+
+def test_committed_target_is_indexed(index, camping_site):
+    target = MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True)
+    db.session.add(target)
+
+    # flush 만으로는 반영되지 않음
+    db.session.flush()
+    assert _keys(index, camping_site.id, 2026, 11)['targets'] == []
+
+    db.session.commit()
+    assert _keys(index, camping_site.id, 2026, 11)['targets'] == [target.id]
+
+
+def test_rolled_back_target_is_discarded(index, camping_site):
+    db.session.add(MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True))
+    db.session.flush()
+    db.session.rollback()
+
+    assert index.fetch_plan() == {}
+    # 롤백된 변경이 다음 커밋에 섞여 반영되지 않음
+    db.session.commit()
+    assert index.fetch_plan() == {}
+
+
+def test_range_target_spans_every_month(index, camping_site):
+    target = MonitoringRangeTarget(
+        camping_site_id=camping_site.id, start_date=date(2026, 12, 20), end_date=date(2027, 1, 10), is_active=True
+    )
+    db.session.add(target)
+    db.session.commit()
+
+    plan = index.fetch_plan()
+    assert set(plan) == {(camping_site.id, 2026, 12), (camping_site.id, 2027, 1)}
+    assert plan[(camping_site.id, 2027, 1)]['range_targets'] == [target.id]
+
+
+def test_deactivate_and_delete_remove_from_index(index, camping_site):
+    single = MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True)
+    ranged = MonitoringRangeTarget(
+        camping_site_id=camping_site.id, start_date=date(2026, 11, 1), end_date=date(2026, 11, 30), is_active=True
+    )
+    db.session.add_all([single, ranged])
+    db.session.commit()
+
+    single.is_active = False
+    db.session.commit()
+    assert _keys(index, camping_site.id, 2026, 11) == {'targets': [], 'range_targets': [ranged.id]}
+
+    db.session.delete(ranged)
+    db.session.commit()
+    assert index.fetch_plan() == {}
+
+
+def test_moving_target_date_moves_month(index, camping_site):
+    target = MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True)
+    db.session.add(target)
+    db.session.commit()
+
+    target.target_date = date(2026, 12, 5)
+    db.session.commit()
+
+    assert set(index.fetch_plan()) == {(camping_site.id, 2026, 12)}
+
+
+def test_since_drops_past_months_for_range_targets_only(index, camping_site):
+    single = MonitoringTarget(camping_site_id=camping_site.id, target_date=date(2026, 10, 7), is_active=True)
+    ranged = MonitoringRangeTarget(
+        camping_site_id=camping_site.id, start_date=date(2026, 10, 1), end_date=date(2026, 11, 30), is_active=True
+    )
+    db.session.add_all([single, ranged])
+    db.session.commit()
+
+    plan = index.fetch_plan(since=date(2026, 11, 1))
+    assert plan[(camping_site.id, 2026, 10)] == {'targets': [single.id], 'range_targets': []}
+    assert plan[(camping_site.id, 2026, 11)] == {'targets': [], 'range_targets': [ranged.id]}
+
+
+def test_reconcile_picks_up_writes_without_orm_events(index, camping_site):
+    # Core insert 는 ORM 이벤트가 없으므로 인덱스에 바로 반영되지 않음
+    db.session.execute(MonitoringTarget.__table__.insert().values(
+        camping_site_id=camping_site.id, target_date=date(2026, 11, 7), is_active=True
+    ))
+    db.session.commit()
+    assert index.fetch_plan() == {}
+
+    assert index.reconcile() == 1
+    assert len(_keys(index, camping_site.id, 2026, 11)['targets']) == 1
+    assert index.reconcile() == 0
@@ -683,14 +683,16 @@ function ScheduledReserveTab({ sites }) {
                           <Chip label={`Pre-fire ${schedule.pre_fire_ms}ms`} size="small" variant="outlined" />
                         )}
                       </Box>
-                      {schedule.result && (
+                      {schedule.result_summary && (
                         <Alert
-                          severity={schedule.result.success ? 'success' : 'error'}
+                          severity={schedule.result_summary.success ? 'success' : 'error'}
                           sx={{ mt: 1, py: 0 }}
                         >
-                          {schedule.result.message || schedule.result.first_success?.reservation_number
-                            ? `예약 성공! 번호: ${schedule.result.first_success?.reservation_number}`
-                            : (schedule.result.success ? '예약 성공!' : '예약 실패')}
+                          {schedule.result_summary.success
+                            ? (schedule.result_summary.reservation_number
+                              ? `예약 성공! 번호: ${schedule.result_summary.reservation_number}`
+                              : '예약 성공!')
+                            : `예약 실패${schedule.result_summary.message ? `: ${schedule.result_summary.message}` : ''}`}
                         </Alert>
                       )}
                     </Box>